@@ -10,10 +10,22 @@ This script analyzes actual product offerings to understand:
 Goal: Classify accounts by what they actually sell, not self-reported industry.
 """
 
+import argparse
+import hashlib
+import inspect
+import os
+import time
 import pandas as pd
 import numpy as np
 import re
-from collections import Counter
+
+from catalog_correlations import print_correlation_report
+from product_offerings_store import load_product_offerings
+
+parser = argparse.ArgumentParser(description='Product type classification analysis')
+parser.add_argument('--benchmark', action='store_true',
+                    help='Time vectorized name features against the per-item functions')
+args = parser.parse_args()
 
 print("="*80)
 print("PRODUCT TYPE CLASSIFICATION ANALYSIS")
@@ -21,7 +33,7 @@ print("="*80)
 
 # Load data
 print("\nLoading datasets...")
-product_offerings = pd.read_csv('customer_product_offerings_with_type.csv')
+product_offerings = load_product_offerings('customer_product_offerings_with_type.csv')
 accounts_v2 = pd.read_csv('data/customermethodaccount_01-07-2026_RECLUSTERED_V2.csv')
 
 # Filter to active accounts only
@@ -108,104 +120,269 @@ def classify_item_type(product_name):
 
     return 'Product'
 
-print("\nAnalyzing product catalog for each account...")
-
-results = []
-
-for account_name in product_offerings['Account'].unique():
-    # Get all products for this account
-    account_products = product_offerings[product_offerings['Account'] == account_name]['Item'].tolist()
-
-    if len(account_products) == 0:
-        continue
-
-    # SKU count
-    sku_count = len(account_products)
-
-    # Analyze each product name
-    name_features = [analyze_product_name(p) for p in account_products]
-
-    # Aggregate metrics
-    avg_delimiter_count = np.mean([f['delimiter_count'] for f in name_features])
-    avg_char_length = np.mean([f['char_length'] for f in name_features])
-    avg_word_count = np.mean([f['word_count'] for f in name_features])
-    pct_with_sku_codes = sum([f['has_sku_code'] for f in name_features]) / len(name_features) * 100
-    pct_with_specs = sum([f['has_specs'] for f in name_features]) / len(name_features) * 100
-    pct_with_brand_prefix = sum([f['has_brand_prefix'] for f in name_features]) / len(name_features) * 100
+# Precompiled patterns for the vectorized extractor; each category is one alternation
+# so a name is scanned once per category instead of once per keyword
+DELIMITER_PATTERN = re.compile(r'[:/|]')
+SKU_CODE_PATTERN = re.compile(r'\b[A-Z0-9]{3,}-?[A-Z0-9]{2,}\b')
+SPECS_PATTERN = re.compile(r'\d+\s*(?:oz|lb|kg|ml|l|gal|ft|in|mm|cm|m)', re.IGNORECASE)
+BRAND_PREFIX_PATTERN = re.compile(r'^[A-Z][a-zA-Z0-9\s&]+:')
+SERVICE_PATTERN = re.compile(
+    r'\b(?:service|consulting|labor|hourly|freight|shipping|delivery|handling|'
+    r'warehousing|storage|picking|packing|installation|maintenance|repair)\b')
+FEE_PATTERN = re.compile(
+    r'\b(?:fee|charge|surcharge|tariff|late\s+fee|processing|admin|finance)\b')
+
+
+def extract_name_features(names):
+    """
+    Vectorized analyze_product_name + classify_item_type over a sequence of names.
+    Returns one row per name with the same columns and values as the per-item functions.
+    """
+    # Object dtype keeps matching on Python's re (Arrow-backed strings would use RE2,
+    # whose \b and case folding differ for non-ASCII names)
+    names = pd.Series([str(name) for name in names], dtype=object)
+    lowered = names.str.lower()
+
+    is_service = lowered.str.contains(SERVICE_PATTERN)
+    is_fee = lowered.str.contains(FEE_PATTERN)
+
+    return pd.DataFrame({
+        'char_length': names.str.len(),
+        'word_count': names.str.split().str.len(),
+        'delimiter_count': names.str.count(DELIMITER_PATTERN),
+        'has_sku_code': names.str.contains(SKU_CODE_PATTERN),
+        'has_specs': names.str.contains(SPECS_PATTERN),
+        'has_brand_prefix': names.str.contains(BRAND_PREFIX_PATTERN),
+        'classified_type': np.select([is_service, is_fee], ['Service', 'Fee'], 'Product'),
+    })
 
-    # Get item types from the data (ItemType column)
-    account_data = product_offerings[product_offerings['Account'] == account_name]
-    item_types_from_data = account_data['ItemType'].tolist()
-    type_counts = Counter(item_types_from_data)
 
-    # Calculate percentages
-    total_items = len(item_types_from_data)
-    pct_service = type_counts.get('Service', 0) / total_items * 100
-    pct_inventory = type_counts.get('Inventory', 0) / total_items * 100
-    pct_non_inventory = type_counts.get('NonInventory', 0) / total_items * 100
+def benchmark_name_features(names, replicate=5):
+    """
+    Time extract_name_features against the per-item analyze_product_name /
+    classify_item_type loop on the same names and check the outputs match.
+    """
+    print("\n" + "="*80)
+    print(f"NAME FEATURE BENCHMARK ({len(names):,} names x {replicate})")
+    print("="*80)
+
+    names = list(names) * replicate
+
+    start = time.perf_counter()
+    reference = pd.DataFrame([analyze_product_name(p) for p in names])
+    reference['classified_type'] = [classify_item_type(p) for p in names]
+    loop_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = extract_name_features(names)
+    vectorized_secs = time.perf_counter() - start
+
+    reference = reference[vectorized.columns]
+    mismatches = int((reference != vectorized).any(axis=1).sum())
+    print(f"Rows differing from the per-item functions: {mismatches}")
+    print(f"Per-item loop:   {len(names) / loop_secs:>12,.0f} names/sec ({loop_secs:.2f}s)")
+    print(f"Vectorized .str: {len(names) / vectorized_secs:>12,.0f} names/sec ({vectorized_secs:.2f}s)")
+
+    return mismatches == 0
+
+
+# Name features only depend on the item string, so they are cached per distinct name
+ITEM_FEATURE_CACHE = 'data/item_feature_cache.csv'
+ITEM_FEATURE_COLUMNS = ['char_length', 'word_count', 'delimiter_count', 'has_sku_code',
+                        'has_specs', 'has_brand_prefix', 'classified_type']
+
+
+def name_hash(name):
+    """Stable key for an item string in the feature cache."""
+    return hashlib.sha1(name.encode('utf-8')).hexdigest()[:16]
+
+
+def item_feature_version():
+    """
+    Fingerprint of the name-feature logic: the pattern sources and flags and
+    the source of extract_name_features. Cached rows written under another
+    version are recomputed.
+    """
+    patterns = [DELIMITER_PATTERN, SKU_CODE_PATTERN, SPECS_PATTERN, BRAND_PREFIX_PATTERN,
+                SERVICE_PATTERN, FEE_PATTERN]
+    logic = repr([(p.pattern, p.flags) for p in patterns]) + inspect.getsource(extract_name_features)
+    return hashlib.sha1(logic.encode('utf-8')).hexdigest()[:16]
+
+
+def load_item_feature_cache(cache_file):
+    """
+    Load the cached item-feature table indexed by Name_Hash, keeping only rows
+    written by the current item_feature_version.
+    Item is kept as a plain string so names like 'NA' or 'nan' survive the round trip.
+    """
+    if not cache_file or not os.path.exists(cache_file):
+        return pd.DataFrame(columns=['Name_Hash', 'Feature_Version', 'Item'] +
+                            ITEM_FEATURE_COLUMNS).set_index('Name_Hash')
+    cache = pd.read_csv(cache_file, dtype={'Name_Hash': str, 'Feature_Version': str, 'Item': str,
+                                           'classified_type': str},
+                        keep_default_na=False)
+    if 'Feature_Version' not in cache:
+        cache['Feature_Version'] = ''
+    current = cache['Feature_Version'] == item_feature_version()
+    if not current.all():
+        print(f"Item feature cache: dropping {(~current).sum():,} rows from an older feature version")
+    return cache[current].set_index('Name_Hash')
+
+
+def item_feature_table(names, cache_file=ITEM_FEATURE_CACHE):
+    """
+    Features for each distinct item string in names, indexed by the string.
+
+    Strings already in the cache are looked up by name hash (and checked against
+    the stored Item to rule out collisions); only unseen strings go through
+    extract_name_features, and those are appended to the cache. Rows cached
+    under an older item_feature_version are recomputed and replaced.
+    """
+    distinct = pd.Index(pd.unique(names))
+    hashes = pd.Index([name_hash(name) for name in distinct])
+
+    cache = load_item_feature_cache(cache_file)
+    position = cache.index.get_indexer(hashes)
+    cached = position >= 0
+    cached[cached] = cache['Item'].to_numpy()[position[cached]] == distinct.to_numpy()[cached]
+
+    new_names = distinct[~cached]
+    computed = extract_name_features(new_names)[ITEM_FEATURE_COLUMNS]
+    computed.insert(0, 'Item', new_names)
+    computed.insert(0, 'Feature_Version', item_feature_version())
+    computed.index = hashes[~cached]
+    computed.index.name = 'Name_Hash'
+
+    print(f"Item features: {len(distinct):,} distinct names "
+          f"({cached.sum():,} cached, {len(new_names):,} computed)")
+
+    if cache_file and len(computed):
+        updated = pd.concat([cache[~cache.index.isin(computed.index)], computed])
+        updated.to_csv(cache_file)
+
+    table = pd.concat([cache.iloc[position[cached]], computed])
+    table.index = pd.Index(table['Item'])
+    return table.loc[distinct, ITEM_FEATURE_COLUMNS].astype(
+        {'char_length': int, 'word_count': int, 'delimiter_count': int,
+         'has_sku_code': bool, 'has_specs': bool, 'has_brand_prefix': bool})
+
+
+def compute_item_features(product_offerings, cache_file=ITEM_FEATURE_CACHE):
+    """
+    Per-item features for every product row: name features and keyword
+    item type from extract_name_features, and flags for the exported ItemType.
+
+    Name features are computed once per distinct Item string (via the
+    item-feature cache) and joined back onto the rows.
+    """
+    names = product_offerings['Item'].map(str)
+    table = item_feature_table(names, cache_file)
+    features = table.iloc[table.index.get_indexer(names)]
+    features.index = product_offerings.index
+
+    features['Account'] = product_offerings['Account']
+    features['Item'] = product_offerings['Item']
+    features['is_service'] = product_offerings['ItemType'] == 'Service'
+    features['is_inventory'] = product_offerings['ItemType'] == 'Inventory'
+    features['is_non_inventory'] = product_offerings['ItemType'] == 'NonInventory'
+    features['is_fee'] = features['classified_type'] == 'Fee'
+    return features
+
+
+def round_values(series, digits):
+    """
+    Python round() per value. The per-account percentages were plain Python
+    floats, and Python and numpy rounding differ on ties like 9.35.
+    """
+    return series.map(lambda value: round(value, digits))
+
+
+def aggregate_catalog_metrics(item_features):
+    """
+    Per-account catalog metrics from per-item features in one groupby pass.
+    Accounts appear in order of first appearance, as in the product export.
+    """
+    grouped = item_features.groupby('Account', sort=False)
+    metrics = grouped.agg(
+        sku_count=('Item', 'size'),
+        avg_delimiter_count=('delimiter_count', 'mean'),
+        avg_char_length=('char_length', 'mean'),
+        avg_word_count=('word_count', 'mean'),
+        sku_code_items=('has_sku_code', 'sum'),
+        spec_items=('has_specs', 'sum'),
+        brand_prefix_items=('has_brand_prefix', 'sum'),
+        service_items=('is_service', 'sum'),
+        inventory_items=('is_inventory', 'sum'),
+        non_inventory_items=('is_non_inventory', 'sum'),
+        fee_items=('is_fee', 'sum'),
+    )
+    sku_count = metrics['sku_count']
 
-    # Also do keyword-based classification for comparison
-    item_types_classified = [classify_item_type(p) for p in account_products]
-    classified_counts = Counter(item_types_classified)
-    pct_fee = classified_counts.get('Fee', 0) / len(item_types_classified) * 100
-    pct_product = classified_counts.get('Product', 0) / len(item_types_classified) * 100
+    pct_with_sku_codes = metrics['sku_code_items'] / sku_count * 100
+    pct_with_specs = metrics['spec_items'] / sku_count * 100
+    pct_with_brand_prefix = metrics['brand_prefix_items'] / sku_count * 100
+    pct_service = metrics['service_items'] / sku_count * 100
+    pct_inventory = metrics['inventory_items'] / sku_count * 100
+    pct_non_inventory = metrics['non_inventory_items'] / sku_count * 100
+    pct_fee = metrics['fee_items'] / sku_count * 100
 
     # Determine primary business type based on ItemType from data
-    if pct_service > 50:
-        primary_type = 'Service-Based'
-    elif pct_inventory > 70:
-        primary_type = 'Inventory-Based (Physical Products)'
-    elif pct_non_inventory > 50:
-        primary_type = 'NonInventory-Based (Digital/Services)'
-    elif pct_service > 20:
-        primary_type = 'Hybrid (Mixed)'
-    else:
-        primary_type = 'Product-Based (Mixed Inventory)'
+    primary_type = np.select(
+        [pct_service > 50, pct_inventory > 70, pct_non_inventory > 50, pct_service > 20],
+        ['Service-Based', 'Inventory-Based (Physical Products)',
+         'NonInventory-Based (Digital/Services)', 'Hybrid (Mixed)'],
+        default='Product-Based (Mixed Inventory)'
+    )
 
     # Calculate catalog complexity score (0-100)
     # Factors: SKU count, naming depth, sophistication indicators
-    sku_score = min(sku_count / 500 * 40, 40)  # Max 40 points for SKU count
-    depth_score = min(avg_delimiter_count / 3 * 20, 20)  # Max 20 points for categorization depth
+    sku_score = np.minimum(sku_count / 500 * 40, 40)  # Max 40 points for SKU count
+    depth_score = np.minimum(metrics['avg_delimiter_count'] / 3 * 20, 20)  # Max 20 points for categorization depth
     sophistication_score = (
         (pct_with_sku_codes / 100 * 15) +  # 15 points for SKU codes
         (pct_with_specs / 100 * 10) +      # 10 points for specifications
         (pct_with_brand_prefix / 100 * 15) # 15 points for brand prefixes
     )
-
     catalog_complexity_score = sku_score + depth_score + sophistication_score
 
     # Determine complexity tier
-    if catalog_complexity_score < 20:
-        complexity_tier = 'Ultra-Simple'
-    elif catalog_complexity_score < 40:
-        complexity_tier = 'Simple'
-    elif catalog_complexity_score < 60:
-        complexity_tier = 'Standard'
-    elif catalog_complexity_score < 80:
-        complexity_tier = 'Complex'
-    else:
-        complexity_tier = 'Very Complex'
-
-    results.append({
-        'Account': account_name,
-        'SKU_Count': sku_count,
-        'Avg_Delimiter_Count': round(avg_delimiter_count, 2),
-        'Avg_Char_Length': round(avg_char_length, 1),
-        'Avg_Word_Count': round(avg_word_count, 1),
-        'Pct_With_SKU_Codes': round(pct_with_sku_codes, 1),
-        'Pct_With_Specs': round(pct_with_specs, 1),
-        'Pct_With_Brand_Prefix': round(pct_with_brand_prefix, 1),
-        'Pct_Service_Items': round(pct_service, 1),
-        'Pct_Inventory_Items': round(pct_inventory, 1),
-        'Pct_NonInventory_Items': round(pct_non_inventory, 1),
-        'Pct_Fee_Items': round(pct_fee, 1),
+    complexity_tier = np.select(
+        [catalog_complexity_score < 20, catalog_complexity_score < 40,
+         catalog_complexity_score < 60, catalog_complexity_score < 80],
+        ['Ultra-Simple', 'Simple', 'Standard', 'Complex'],
+        default='Very Complex'
+    )
+
+    sample_products = item_features.groupby('Account', sort=False).head(3) \
+        .groupby('Account', sort=False)['Item'].agg(', '.join)
+
+    # Averages and the complexity score round like numpy floats, percentages like Python floats
+    return pd.DataFrame({
+        'Account': metrics.index,
+        'SKU_Count': sku_count.to_numpy(),
+        'Avg_Delimiter_Count': metrics['avg_delimiter_count'].round(2).to_numpy(),
+        'Avg_Char_Length': metrics['avg_char_length'].round(1).to_numpy(),
+        'Avg_Word_Count': metrics['avg_word_count'].round(1).to_numpy(),
+        'Pct_With_SKU_Codes': round_values(pct_with_sku_codes, 1).to_numpy(),
+        'Pct_With_Specs': round_values(pct_with_specs, 1).to_numpy(),
+        'Pct_With_Brand_Prefix': round_values(pct_with_brand_prefix, 1).to_numpy(),
+        'Pct_Service_Items': round_values(pct_service, 1).to_numpy(),
+        'Pct_Inventory_Items': round_values(pct_inventory, 1).to_numpy(),
+        'Pct_NonInventory_Items': round_values(pct_non_inventory, 1).to_numpy(),
+        'Pct_Fee_Items': round_values(pct_fee, 1).to_numpy(),
         'Primary_Business_Type': primary_type,
-        'Catalog_Complexity_Score': round(catalog_complexity_score, 1),
+        'Catalog_Complexity_Score': catalog_complexity_score.round(1).to_numpy(),
         'Complexity_Tier': complexity_tier,
-        'Sample_Products': ', '.join(account_products[:3])
+        'Sample_Products': sample_products.reindex(metrics.index).to_numpy(),
     })
 
-results_df = pd.DataFrame(results)
+print("\nAnalyzing product catalog for each account...")
+
+# Per-item features first, then one groupby('Account') aggregation
+item_features = compute_item_features(product_offerings)
+if args.benchmark:
+    benchmark_name_features(pd.unique(product_offerings['Item'].map(str)))
+results_df = aggregate_catalog_metrics(item_features)
 
 print(f"\nAnalyzed {len(results_df)} accounts with product data")
 
@@ -340,29 +517,8 @@ merged_with_products['Total_Custom_Screens'] = pd.to_numeric(
     merged_with_products['Custom Screens Classic'], errors='coerce'
 ).fillna(0)
 
-print("\nSKU Count vs Users:")
-correlation = merged_with_products[['SKU_Count', 'Users']].corr()
-print(f"  Correlation: {correlation.iloc[0,1]:.3f}")
-
-print("\nSKU Count vs Custom Screens:")
-correlation = merged_with_products[['SKU_Count', 'Total_Custom_Screens']].corr()
-print(f"  Correlation: {correlation.iloc[0,1]:.3f}")
-
-print("\nSKU Count vs MRR:")
-correlation = merged_with_products[['SKU_Count', 'MRR_Calculated']].corr()
-print(f"  Correlation: {correlation.iloc[0,1]:.3f}")
-
-print("\nCatalog Complexity Score vs Users:")
-correlation = merged_with_products[['Catalog_Complexity_Score', 'Users']].corr()
-print(f"  Correlation: {correlation.iloc[0,1]:.3f}")
-
-print("\nCatalog Complexity Score vs Custom Screens:")
-correlation = merged_with_products[['Catalog_Complexity_Score', 'Total_Custom_Screens']].corr()
-print(f"  Correlation: {correlation.iloc[0,1]:.3f}")
-
-print("\nCatalog Complexity Score vs MRR:")
-correlation = merged_with_products[['Catalog_Complexity_Score', 'MRR_Calculated']].corr()
-print(f"  Correlation: {correlation.iloc[0,1]:.3f}")
+# Full Pearson/Spearman matrices and bootstrap intervals for every catalog/workflow pair
+print_correlation_report(merged_with_products)
 
 # Cross-tabulations
 print("\n" + "="*80)
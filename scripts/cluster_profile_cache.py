@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+On-disk cache for cluster statistical profiles.
+
+Profiles are stored under data/cache/cluster_profiles/ as <fingerprint>.csv,
+where the fingerprint is a SHA-256 of the dataset file's bytes, the cluster
+column and PROFILE_VERSION. Editing the dataset (or reclustering into another
+column) changes the fingerprint, so stale profiles are never read; the entry
+they replace is deleted when the new one is written.
+
+index.json remembers each dataset's size, mtime and fingerprint so an unchanged
+file is not rehashed on every run. A file whose size or mtime changed is always
+rehashed, so a touched-but-identical file still hits the cache.
+
+Author: Evidence-Based Analysis
+Date: January 7, 2026
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable
+
+import pandas as pd
+
+PROFILE_CACHE_DIR = 'data/cache/cluster_profiles'
+PROFILE_INDEX = 'index.json'
+
+# Bump when calculate_cluster_profiles changes its output so old entries miss
+PROFILE_VERSION = 3
+
+
+def _file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_index(cache_dir: str) -> dict:
+    try:
+        with open(os.path.join(cache_dir, PROFILE_INDEX)) as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_index(cache_dir: str, index: dict):
+    path = os.path.join(cache_dir, PROFILE_INDEX)
+    with open(path + '.tmp', 'w') as handle:
+        json.dump(index, handle, indent=2, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+
+def _index_key(dataset_path: str, cluster_column: str) -> str:
+    return f"{os.path.abspath(dataset_path)}::{cluster_column}"
+
+
+def _current_file_hash(dataset_path: str, entry: dict) -> str:
+    """Indexed file hash when size and mtime are unchanged, otherwise a fresh hash."""
+    stat = os.stat(dataset_path)
+    if entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        return entry['file_sha256']
+    return _file_sha256(dataset_path)
+
+
+def _fingerprint(file_hash: str, cluster_column: str) -> str:
+    key = f"{file_hash}\0{cluster_column}\0{PROFILE_VERSION}"
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:20]
+
+
+def dataset_fingerprint(dataset_path: str, cluster_column: str,
+                        cache_dir: str = PROFILE_CACHE_DIR) -> str:
+    """Fingerprint of (dataset contents, cluster column, profile version)."""
+    entry = _read_index(cache_dir).get(_index_key(dataset_path, cluster_column), {})
+    return _fingerprint(_current_file_hash(dataset_path, entry), cluster_column)
+
+
+def profile_cache_path(fingerprint: str, cache_dir: str = PROFILE_CACHE_DIR) -> str:
+    return os.path.join(cache_dir, f"{fingerprint}.csv")
+
+
+def cached_profiles(dataset_path: str, cluster_column: str,
+                    compute: Callable[[], pd.DataFrame],
+                    cache_dir: str = PROFILE_CACHE_DIR,
+                    refresh: bool = False) -> pd.DataFrame:
+    """
+    Profiles for dataset_path grouped by cluster_column: read from the cache when
+    the fingerprint matches, otherwise computed with compute() and stored.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    stat = os.stat(dataset_path)
+    index = _read_index(cache_dir)
+    key = _index_key(dataset_path, cluster_column)
+    previous = index.get(key, {})
+
+    file_hash = _current_file_hash(dataset_path, previous)
+    fingerprint = _fingerprint(file_hash, cluster_column)
+    path = profile_cache_path(fingerprint, cache_dir)
+
+    if os.path.exists(path) and not refresh:
+        print(f"Using cached cluster profiles ({fingerprint})")
+        profiles = pd.read_csv(path, index_col=0, float_precision='round_trip')
+    else:
+        profiles = compute()
+        profiles.to_csv(path + '.tmp')
+        os.replace(path + '.tmp', path)
+        print(f"Cached cluster profiles ({fingerprint})")
+
+    index[key] = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'file_sha256': file_hash,
+        'fingerprint': fingerprint,
+    }
+    _write_index(cache_dir, index)
+
+    # Drop the entry this dataset used before, unless another dataset shares it
+    stale = previous.get('fingerprint')
+    in_use = {entry.get('fingerprint') for entry in index.values()}
+    if stale and stale not in in_use and os.path.exists(profile_cache_path(stale, cache_dir)):
+        os.remove(profile_cache_path(stale, cache_dir))
+    return profiles
@@ -11,6 +11,8 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
 
+from validate_cluster_statistical import load_cluster_profiles
+
 def calculate_composite_confidence(website_conf: float, product_conf: float,
                                      statistical_conf: str) -> Tuple[float, str]:
     """
@@ -119,7 +121,8 @@ def determine_recommendation(composite_confidence: float, matches_expected: bool
 def consolidate_validation_results(website_file: str = None,
                                      product_file: str = None,
                                      statistical_file: str = None,
-                                     output_file: str = 'final_validation_report.csv'):
+                                     output_file: str = 'final_validation_report.csv',
+                                     include_cluster_profiles: bool = False):
     """
     Consolidate validation results from all sources.
 
@@ -128,6 +131,8 @@ def consolidate_validation_results(website_file: str = None,
         product_file: Product validation results CSV
         statistical_file: Statistical validation results CSV
         output_file: Output consolidated report CSV
+        include_cluster_profiles: Add each account's cluster size and MRR/Users
+                                  means and medians (from the profile cache)
     """
     print("="*80)
     print("VALIDATION RESULTS CONSOLIDATION")
@@ -217,6 +222,20 @@ def consolidate_validation_results(website_file: str = None,
         )
         print(f"Merged statistical validation: {consolidated['Statistical_Confidence'].notna().sum()} accounts")
 
+    # Cluster context from the cached statistical profiles
+    if include_cluster_profiles:
+        profile_cols = {
+            'Total_Accounts': 'Cluster_Accounts',
+            'MRR_Mean': 'Cluster_MRR_Mean',
+            'MRR_Median': 'Cluster_MRR_Median',
+            'Users_Mean': 'Cluster_Users_Mean',
+            'Users_Median': 'Cluster_Users_Median'
+        }
+        profiles = load_cluster_profiles(df=df)[list(profile_cols)].rename(columns=profile_cols)
+        consolidated = consolidated.merge(profiles, left_on='Current_Cluster',
+                                          right_index=True, how='left')
+        print(f"Merged cluster profiles: {profiles.shape[0]} clusters")
+
     # Calculate composite confidence scores
     print("\n" + "="*80)
     print("CALCULATING COMPOSITE CONFIDENCE SCORES")
@@ -267,7 +286,9 @@ def consolidate_validation_results(website_file: str = None,
     # Add optional columns if they exist
     optional_cols = ['Website_Confidence', 'Product_Confidence', 'Statistical_Confidence',
                      'Product_Classification', 'Top_3_Clusters', 'Is_Overall_Outlier',
-                     'MRR_Calculated', 'Users', 'Primary_Business_Type']
+                     'MRR_Calculated', 'Users', 'Primary_Business_Type',
+                     'Cluster_Accounts', 'Cluster_MRR_Mean', 'Cluster_MRR_Median',
+                     'Cluster_Users_Mean', 'Cluster_Users_Median']
 
     for col in optional_cols:
         if col in consolidated.columns:
@@ -343,7 +364,8 @@ if __name__ == '__main__':
         website_file='website_validation_pilot_test.csv',  # If exists
         product_file='product_validation_pilot_test.csv',
         statistical_file='statistical_validation_pilot_test.csv',
-        output_file='consolidated_validation_pilot_test.csv'
+        output_file='consolidated_validation_pilot_test.csv',
+        include_cluster_profiles=True
     )
 
     print("\n" + "="*80)
@@ -9,6 +9,8 @@ Date: January 7, 2026
 
 import pandas as pd
 
+from validate_cluster_statistical import load_cluster_profiles
+
 def create_validation_queue():
     """
     Create prioritized validation queue based on:
@@ -20,15 +22,9 @@ def create_validation_queue():
     print("Creating Validation Queue...")
     print("="*80)
 
-    # Load data
-    df = pd.read_csv('data/customermethodaccount_01-07-2026_RECLUSTERED_V2_WITH_PRODUCT_TYPES.csv')
-    active = df[df['Active?'] == True].copy()
-
-    # Get cluster sizes and MRR
-    cluster_stats = active.groupby('Industry_Cluster_Enhanced_V2').agg({
-        'Account Name': 'count',
-        'MRR_Calculated': 'sum'
-    }).rename(columns={'Account Name': 'Total_Accounts', 'MRR_Calculated': 'Total_MRR'})
+    # Cluster sizes and MRR from the cluster profiles (cached per dataset version)
+    cluster_stats = load_cluster_profiles()[['Total_Accounts', 'MRR_Total']].rename(
+        columns={'MRR_Total': 'Total_MRR'})
 
     # Define validation queue
     validation_queue = [
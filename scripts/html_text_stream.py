@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Streaming HTML-to-text extraction for website validation.
+
+HtmlTextExtractor takes a page in arbitrary pieces as the fetcher decodes
+them and parses it incrementally (html.parser). Text inside script, style,
+noscript, template, svg, iframe, nav, footer and aside is dropped; every
+other run of text goes to a text sink as soon as it is parsed, with
+whitespace collapsed and tags treated as word breaks. Parsing stops once the
+HTML byte budget is spent or the sink reports that its own budget (e.g. a
+token count) is full. Only the visible text read before the stop is kept,
+so memory is bounded by the budgets rather than the page size.
+
+Usage:
+    python scripts/html_text_stream.py page.html [--chunk-size 4096]
+
+Author: Evidence-Based Analysis
+Date: January 7, 2026
+"""
+
+import argparse
+import re
+from html.parser import HTMLParser
+from typing import Dict, List
+
+# Elements whose contents are never part of the business description
+SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'svg', 'iframe', 'nav', 'footer', 'aside'}
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class HtmlTextExtractor(HTMLParser):
+    """
+    Incremental HTML parser that streams visible text into a sink.
+
+    text_sink needs feed(text) -> bool (False to stop) and close() -> dict of
+    result fields. feed() here returns False once extraction has stopped;
+    close() returns the visible text read ('content'), 'content_is_text',
+    'truncated' and the sink's fields.
+    """
+
+    def __init__(self, text_sink, max_bytes: int = 1_000_000):
+        super().__init__(convert_charrefs=True)
+        self.text_sink = text_sink
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self.truncated = False
+        self._skip_depth: Dict[str, int] = {}
+        self._skipping = 0
+        self._last_was_space = True
+        self._parts: List[str] = []
+        self._stopped = False
+
+    def _emit(self, text: str):
+        text = WHITESPACE_PATTERN.sub(' ', text)
+        if self._last_was_space:
+            text = text.lstrip(' ')
+        if not text or self._stopped:
+            return
+        self._last_was_space = text.endswith(' ')
+        self._parts.append(text)
+        if not self.text_sink.feed(text):
+            self._stopped = True
+            self.truncated = True
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth[tag] = self._skip_depth.get(tag, 0) + 1
+            self._skipping += 1
+        self._emit(' ')
+
+    def handle_endtag(self, tag):
+        if self._skip_depth.get(tag):
+            self._skip_depth[tag] -= 1
+            self._skipping -= 1
+        self._emit(' ')
+
+    def handle_startendtag(self, tag, attrs):
+        self._emit(' ')
+
+    def handle_data(self, data):
+        if not self._skipping:
+            self._emit(data)
+
+    def feed(self, html: str) -> bool:
+        """Parse the next piece of the page; False once extraction has stopped."""
+        if self._stopped:
+            return False
+        encoded = html.encode('utf-8', 'surrogatepass')
+        remaining = self.max_bytes - self.bytes_read
+        if len(encoded) > remaining:
+            html = encoded[:remaining].decode('utf-8', 'ignore')
+            self.truncated = True
+        self.bytes_read += min(len(encoded), remaining)
+        super().feed(html)
+        if self.truncated:
+            self._stopped = True
+        return not self._stopped
+
+    def close(self) -> Dict:
+        super().close()
+        result = {'content': ''.join(self._parts).strip(), 'content_is_text': True,
+                  'truncated': self.truncated}
+        result.update(self.text_sink.close())
+        return result
+
+
+class _CollectText:
+    """Text sink that only keeps the text (for the command-line preview)."""
+
+    def feed(self, text: str) -> bool:
+        return True
+
+    def close(self) -> Dict:
+        return {}
+
+
+def extract_text(html: str, max_bytes: int = 1_000_000, chunk_size: int = 65536) -> str:
+    """Visible text of a page, fed to the extractor chunk_size characters at a time."""
+    extractor = HtmlTextExtractor(_CollectText(), max_bytes=max_bytes)
+    for start in range(0, len(html), chunk_size):
+        if not extractor.feed(html[start:start + chunk_size]):
+            break
+    return extractor.close()['content']
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Print the visible text of an HTML file')
+    parser.add_argument('path', help='HTML file')
+    parser.add_argument('--chunk-size', type=int, default=4096, help='Characters per feed')
+    parser.add_argument('--max-bytes', type=int, default=1_000_000, help='HTML byte budget')
+    args = parser.parse_args()
+
+    with open(args.path, encoding='utf-8', errors='replace') as handle:
+        extractor = HtmlTextExtractor(_CollectText(), max_bytes=args.max_bytes)
+        for piece in iter(lambda: handle.read(args.chunk_size), ''):
+            if not extractor.feed(piece):
+                break
+        print(extractor.close()['content'])
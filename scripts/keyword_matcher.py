@@ -0,0 +1,106 @@
+"""
+Multi-keyword matcher (Aho-Corasick automaton) shared by the clustering scripts.
+
+The classification rules in this project are long lists of plain substring
+keywords. Checking them with chained `any(x in text for x in keywords)` scans
+re-reads the same text once per keyword. KeywordMatcher compiles every keyword
+into one automaton so a single left-to-right pass over the text reports all
+keyword hits, including overlapping ones ('sport' inside 'sporting goods').
+
+Author: Evidence-Based Analysis
+Date: January 7, 2026
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a fixed list of keywords.
+
+    Keywords are matched as raw substrings (same semantics as `keyword in text`),
+    so keywords padded with spaces such as ' ale ' keep their meaning.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._keyword_ids: Dict[str, int] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for keyword in keywords:
+            if keyword in self._keyword_ids or not keyword:
+                continue
+            self._keyword_ids[keyword] = len(self.keywords)
+            self.keywords.append(keyword)
+            self._add(keyword)
+
+        self._build_failure_links()
+
+    def _add(self, keyword: str):
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = self._output[state] + (self._keyword_ids[keyword],)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                # Inherit matches ending at the failure state (suffix keywords)
+                self._output[next_state] = (self._output[next_state] +
+                                            self._output[self._fail[next_state]])
+
+    def keyword_id(self, keyword: str) -> int:
+        """Return the id assigned to a keyword at build time."""
+        return self._keyword_ids[keyword]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Scan text once and yield (end_index, keyword_id) for every hit.
+        end_index is the position just past the last character of the match.
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for keyword_id in output[state]:
+                yield i + 1, keyword_id
+
+    def find_ids(self, text: str) -> Set[int]:
+        """Return the set of keyword ids that occur anywhere in text."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        found = set()
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the set of keywords that occur anywhere in text."""
+        return {self.keywords[keyword_id] for keyword_id in self.find_ids(text)}
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Columnar store for the product offerings export.
+
+customer_product_offerings_with_type.csv repeats the same Item, ItemType and
+Account strings tens of thousands of times and is reparsed from text by every
+product script. convert_offerings writes a Parquet copy next to the CSV with
+dictionary-encoded string columns, and load_product_offerings is the single
+loader the product scripts use: it reads the Parquet copy when it is current and
+falls back to the CSV otherwise. Either way Account and ItemType come back as
+pandas categoricals.
+
+Usage:
+    python scripts/product_offerings_store.py --convert
+    python scripts/product_offerings_store.py --benchmark
+
+Parquet support needs pyarrow.
+
+Author: Evidence-Based Analysis
+Date: January 7, 2026
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+OFFERINGS_CSV = 'customer_product_offerings_with_type.csv'
+CATEGORICAL_COLUMNS = ['Account', 'ItemType']
+
+
+def parquet_path_for(csv_path: str) -> str:
+    """Parquet copy lives next to the CSV with the same stem."""
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def read_offerings_csv(csv_path: str) -> pd.DataFrame:
+    """Parse the CSV export with Account/ItemType as categoricals (when present)."""
+    header = pd.read_csv(csv_path, nrows=0).columns
+    dtypes = {col: 'category' for col in CATEGORICAL_COLUMNS if col in header}
+    return pd.read_csv(csv_path, dtype=dtypes)
+
+
+def convert_offerings(csv_path: str = OFFERINGS_CSV, parquet_path: str = None) -> str:
+    """
+    Write the offerings CSV as Parquet. Categoricals are stored as Arrow
+    dictionary columns and Item is dictionary-encoded by the writer.
+    """
+    parquet_path = parquet_path or parquet_path_for(csv_path)
+    offerings = read_offerings_csv(csv_path)
+    offerings.to_parquet(parquet_path, engine='pyarrow', index=False,
+                         compression='zstd', use_dictionary=True)
+    print(f"Converted {len(offerings):,} rows: {csv_path} -> {parquet_path} "
+          f"({os.path.getsize(csv_path) / 1e6:.2f} MB -> {os.path.getsize(parquet_path) / 1e6:.2f} MB)")
+    return parquet_path
+
+
+def load_product_offerings(csv_path: str = OFFERINGS_CSV) -> pd.DataFrame:
+    """
+    Load the product offerings. Reads the Parquet copy when it exists and is at
+    least as new as the CSV; otherwise parses the CSV.
+    """
+    parquet_path = parquet_path_for(csv_path)
+    if os.path.exists(parquet_path) and (
+            not os.path.exists(csv_path) or
+            os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)):
+        offerings = pd.read_parquet(parquet_path, engine='pyarrow')
+        for col in CATEGORICAL_COLUMNS:
+            if col in offerings.columns and not isinstance(offerings[col].dtype, pd.CategoricalDtype):
+                offerings[col] = offerings[col].astype('category')
+        return offerings
+
+    if os.path.exists(parquet_path):
+        print(f"Note: {parquet_path} is older than {csv_path}; reading CSV "
+              f"(rerun product_offerings_store.py --convert)")
+    return read_offerings_csv(csv_path)
+
+
+def _rss_mb() -> float:
+    """Current resident set size in MB (Linux /proc; peak RSS elsewhere)."""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure_load(fmt: str, csv_path: str):
+    """Load one format in this process and print seconds, RSS growth, peak RSS and frame size."""
+    if fmt == 'parquet':
+        import pyarrow.parquet  # noqa: F401  (import cost is not part of the load)
+    rss_before = _rss_mb()
+    start = time.perf_counter()
+    if fmt == 'csv':
+        offerings = pd.read_csv(csv_path)
+    elif fmt == 'csv-categorical':
+        offerings = read_offerings_csv(csv_path)
+    else:
+        offerings = pd.read_parquet(parquet_path_for(csv_path), engine='pyarrow')
+    secs = time.perf_counter() - start
+    rss_growth = _rss_mb() - rss_before
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    frame_mb = offerings.memory_usage(deep=True).sum() / 1e6
+    print(f"{secs:.4f} {rss_growth:.1f} {peak_rss:.1f} {frame_mb:.2f}")
+
+
+def benchmark_offerings_load(csv_path: str = OFFERINGS_CSV, repeat: int = 5):
+    """
+    Compare plain CSV, categorical CSV and Parquet loads. Each load runs in a
+    fresh interpreter so peak RSS is not shared between formats.
+    """
+    if not os.path.exists(parquet_path_for(csv_path)):
+        convert_offerings(csv_path)
+
+    print("\n" + "="*80)
+    print(f"PRODUCT OFFERINGS LOAD BENCHMARK ({csv_path}, best of {repeat})")
+    print("="*80)
+    print(f"{'Format':<18} {'Load (s)':>10} {'RSS growth (MB)':>16} {'Peak RSS (MB)':>14} {'Frame (MB)':>11}")
+
+    for fmt in ('csv', 'csv-categorical', 'parquet'):
+        runs = []
+        for _ in range(repeat):
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--measure', fmt, '--csv', csv_path],
+                capture_output=True, text=True, check=True)
+            runs.append([float(x) for x in out.stdout.split()])
+        secs, rss_growth, peak_rss, frame_mb = min(runs)
+        print(f"{fmt:<18} {secs:>10.4f} {rss_growth:>16.1f} {peak_rss:>14.1f} {frame_mb:>11.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Columnar store for product offerings')
+    parser.add_argument('--csv', default=OFFERINGS_CSV, help='Offerings CSV export')
+    parser.add_argument('--convert', action='store_true', help='Write the Parquet copy')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare load time and RSS for CSV vs Parquet')
+    parser.add_argument('--measure', choices=['csv', 'csv-categorical', 'parquet'],
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        _measure_load(args.measure, args.csv)
+        sys.exit(0)
+    if args.convert:
+        convert_offerings(args.csv)
+    if args.benchmark:
+        benchmark_offerings_load(args.csv)
@@ -4,145 +4,374 @@ Re-clustering script with strict food & beverage keywords only.
 Removes generic wholesale/distribution terms that were causing mis-classification.
 """
 
+import argparse
+import hashlib
+import inspect
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from keyword_matcher import KeywordMatcher
+
+# Strict cluster rules, evaluated top to bottom - the first rule with any
+# keyword found in "Sector + QBOIndustryType" wins.
+# CRITICAL: Use word-boundary safe keywords to avoid matching 'ale' in 'sales' or 'brew' in 'hebrew'
+FOOD_KEYWORDS = ['food manufacturing', 'bakery', 'bakeries', 'dairy', 'meat', 'poultry', 'seafood',
+                 'fruit', 'vegetable', 'produce', 'snack', 'candy', 'confection',
+                 'grain', 'cereal', 'flour', 'sugar', 'grocery']
+BEVERAGE_KEYWORDS = ['beverage', 'coffee and tea', 'winery', 'wineries', 'beer ', ' ale ',
+                     'brewery', 'breweries', 'distillery', 'distilleries',
+                     'juice', 'soft drink', 'water bottl']
+RESTAURANT_KEYWORDS = ['restaurant', 'food service', 'eating place', 'drinking place',
+                       'cafe', 'cafes', ' bar ', 'catering']
+
+INDUSTRY_RULES = [
+    # MEDICAL - specific keywords only
+    ('Medical Equipment & Supplies', ['medical', 'dental', 'hospital', 'healthcare', 'pharma',
+                                      'surgical', 'clinic', 'diagnostic']),
+    # FOOD & BEVERAGE - STRICT specific keywords only, NO generic wholesale
+    # Removed: 'wholesale', 'distribution', 'merchant' - these are too generic
+    ('Food & Beverage Dist/Mfg', FOOD_KEYWORDS + BEVERAGE_KEYWORDS + RESTAURANT_KEYWORDS),
+    ('Building Materials & Construction', ['lumber', 'wood product', 'flooring', 'carpet',
+                                           'concrete', 'cement', 'brick', 'stone', 'granite',
+                                           'building material', 'construction material',
+                                           'drywall', 'insulation', 'roofing']),
+    ('Industrial Equipment & Machinery', ['industrial machinery', 'industrial equipment',
+                                          'valve', 'pump', 'compressor', 'hvac equipment',
+                                          'fork truck', 'forklift', 'conveyor',
+                                          'machinery merchant', 'equipment rental']),
+    ('Chemicals, Plastics & Rubber', ['chemical', 'plastic', 'rubber', 'resin', 'polymer',
+                                      'paint', 'coating', 'adhesive', 'fertilizer']),
+    ('Electronics & Technology', ['computer', 'electronic part', 'electronic component',
+                                  'semiconductor', 'circuit', 'software']),
+    ('Furniture & Home Furnishings', ['furniture', 'furnishing', 'cabinet', 'seating']),
+    ('Apparel & Textiles', ['apparel', 'clothing', 'textile', 'fabric', 'garment',
+                            'fashion', 'footwear', 'shoe']),
+    ('Automotive & Transportation', ['automotive', 'automobile', 'vehicle', 'auto part',
+                                     'tire', 'motor vehicle']),
+    ('Metal Fabrication & Steel', ['metal', 'steel', 'aluminum', 'iron', 'fabrication',
+                                   'welding', 'machining']),
+    ('Electrical & Lighting Equipment', ['electrical equipment', 'lighting', 'wiring', 'lamp']),
+    ('Packaging & Printing', ['packaging', 'container', 'box', 'printing', 'label']),
+    ('Office Supplies & Equipment', ['office equipment', 'office supply', 'stationery',
+                                     'paper product']),
+    ('Safety & Security Equipment', ['safety', 'security', 'surveillance', 'fire protection',
+                                     'first aid']),
+    ('Sporting Goods & Fitness Equipment', ['sporting goods', 'sport', 'athletic', 'fitness',
+                                            'recreation']),
+    ('Signs, Graphics & Displays', ['sign', 'banner', 'display', 'advertising specialt']),
+    ('Agriculture & Greenhouse/Nursery', ['greenhouse', 'nursery', 'garden', 'agricultural',
+                                          'farm supply', 'seed', 'fertilizer']),
+    ('Wood Products & Lumber', ['wood product', 'lumber', 'millwork', 'sawmill']),
+    ('HVAC & Refrigeration Equipment', ['hvac', 'heating', 'air conditioning', 'refrigeration',
+                                        'ventilation']),
+    ('Manufacturer Representatives', ['manufacturer rep', 'manufacturers rep', 'sales agent',
+                                      'wholesale agent', 'broker']),
+]
+
+# Generic fallback clusters - these also look at the Vertical column.
+# (cluster, Vertical term, keywords, exclude keywords), evaluated in order.
+GENERIC_RULES = [
+    # GENERAL RETAIL - only if clearly retail
+    # But NOT if it's wholesale or manufacturing
+    ('General Retail', 'retail', ['retail store', 'shop', 'boutique'], ['wholesale', 'manufact']),
+    # GENERAL WHOLESALE/DISTRIBUTION - catch generic wholesale
+    # This now catches everything that wasn't specifically categorized above
+    ('General Wholesale/Distribution', 'wholesale',
+     ['wholesale', 'distribution', 'merchant wholesale', 'distributor'], []),
+    # GENERAL MANUFACTURING - catch generic manufacturing
+    ('General/Specialty Manufacturing', 'manufacturing', ['manufacturing', 'manufacturer'], []),
+]
+# SERVICES & OTHER - everything else
+DEFAULT_CLUSTER = 'Services & Other'
+
+
+def categorize_generic(has_keyword, vertical):
+    """
+    Fallback clusters for accounts no specific rule matched.
+    has_keyword(keyword) tells whether keyword occurs in "Sector + QBOIndustryType".
+    """
+    for cluster, vertical_term, keywords, exclude_keywords in GENERIC_RULES:
+        if vertical_term in vertical or any(has_keyword(x) for x in keywords):
+            if not any(has_keyword(x) for x in exclude_keywords):
+                return cluster
+
+    return DEFAULT_CLUSTER
+
+
 def categorize_industry_strict(row):
     """
     Strict clustering - only specific industry keywords, no generic terms.
+    Reference (row-by-row) implementation of the INDUSTRY_RULES order.
     """
     sector = str(row['Sector']).lower() if pd.notna(row['Sector']) else ''
     qbo_type = str(row['QBOIndustryType']).lower() if pd.notna(row['QBOIndustryType']) else ''
     vertical = str(row['Vertical']).lower() if pd.notna(row['Vertical']) else ''
     combined = sector + ' ' + qbo_type
 
-    # MEDICAL - specific keywords only
-    if any(x in combined for x in ['medical', 'dental', 'hospital', 'healthcare', 'pharma',
-                                     'surgical', 'clinic', 'diagnostic']):
-        return 'Medical Equipment & Supplies'
+    for cluster, keywords in INDUSTRY_RULES:
+        if any(x in combined for x in keywords):
+            return cluster
 
-    # FOOD & BEVERAGE - STRICT specific keywords only, NO generic wholesale
-    # Removed: 'wholesale', 'distribution', 'merchant' - these are too generic
-    # CRITICAL: Use word-boundary safe keywords to avoid matching 'ale' in 'sales' or 'brew' in 'hebrew'
-    food_keywords = ['food manufacturing', 'bakery', 'bakeries', 'dairy', 'meat', 'poultry', 'seafood',
-                     'fruit', 'vegetable', 'produce', 'snack', 'candy', 'confection',
-                     'grain', 'cereal', 'flour', 'sugar', 'grocery']
-    beverage_keywords = ['beverage', 'coffee and tea', 'winery', 'wineries', 'beer ', ' ale ',
-                        'brewery', 'breweries', 'distillery', 'distilleries',
-                        'juice', 'soft drink', 'water bottl']
-    restaurant_keywords = ['restaurant', 'food service', 'eating place', 'drinking place',
-                          'cafe', 'cafes', ' bar ', 'catering']
-
-    if any(x in combined for x in food_keywords + beverage_keywords + restaurant_keywords):
-        return 'Food & Beverage Dist/Mfg'
-
-    # BUILDING MATERIALS - specific keywords
-    if any(x in combined for x in ['lumber', 'wood product', 'flooring', 'carpet',
-                                     'concrete', 'cement', 'brick', 'stone', 'granite',
-                                     'building material', 'construction material',
-                                     'drywall', 'insulation', 'roofing']):
-        return 'Building Materials & Construction'
-
-    # INDUSTRIAL EQUIPMENT - specific keywords
-    if any(x in combined for x in ['industrial machinery', 'industrial equipment',
-                                     'valve', 'pump', 'compressor', 'hvac equipment',
-                                     'fork truck', 'forklift', 'conveyor',
-                                     'machinery merchant', 'equipment rental']):
-        return 'Industrial Equipment & Machinery'
-
-    # CHEMICALS - specific keywords
-    if any(x in combined for x in ['chemical', 'plastic', 'rubber', 'resin', 'polymer',
-                                     'paint', 'coating', 'adhesive', 'fertilizer']):
-        return 'Chemicals, Plastics & Rubber'
-
-    # ELECTRONICS - specific keywords
-    if any(x in combined for x in ['computer', 'electronic part', 'electronic component',
-                                     'semiconductor', 'circuit', 'software']):
-        return 'Electronics & Technology'
-
-    # FURNITURE - specific keywords
-    if any(x in combined for x in ['furniture', 'furnishing', 'cabinet', 'seating']):
-        return 'Furniture & Home Furnishings'
-
-    # APPAREL - specific keywords
-    if any(x in combined for x in ['apparel', 'clothing', 'textile', 'fabric', 'garment',
-                                     'fashion', 'footwear', 'shoe']):
-        return 'Apparel & Textiles'
-
-    # AUTOMOTIVE - specific keywords
-    if any(x in combined for x in ['automotive', 'automobile', 'vehicle', 'auto part',
-                                     'tire', 'motor vehicle']):
-        return 'Automotive & Transportation'
-
-    # METAL - specific keywords
-    if any(x in combined for x in ['metal', 'steel', 'aluminum', 'iron', 'fabrication',
-                                     'welding', 'machining']):
-        return 'Metal Fabrication & Steel'
-
-    # ELECTRICAL - specific keywords
-    if any(x in combined for x in ['electrical equipment', 'lighting', 'wiring', 'lamp']):
-        return 'Electrical & Lighting Equipment'
-
-    # PACKAGING - specific keywords
-    if any(x in combined for x in ['packaging', 'container', 'box', 'printing', 'label']):
-        return 'Packaging & Printing'
-
-    # OFFICE SUPPLIES - specific keywords
-    if any(x in combined for x in ['office equipment', 'office supply', 'stationery',
-                                     'paper product']):
-        return 'Office Supplies & Equipment'
-
-    # SAFETY - specific keywords
-    if any(x in combined for x in ['safety', 'security', 'surveillance', 'fire protection',
-                                     'first aid']):
-        return 'Safety & Security Equipment'
-
-    # SPORTING GOODS - specific keywords
-    if any(x in combined for x in ['sporting goods', 'sport', 'athletic', 'fitness', 'recreation']):
-        return 'Sporting Goods & Fitness Equipment'
-
-    # SIGNS - specific keywords
-    if any(x in combined for x in ['sign', 'banner', 'display', 'advertising specialt']):
-        return 'Signs, Graphics & Displays'
-
-    # AGRICULTURE - specific keywords
-    if any(x in combined for x in ['greenhouse', 'nursery', 'garden', 'agricultural',
-                                     'farm supply', 'seed', 'fertilizer']):
-        return 'Agriculture & Greenhouse/Nursery'
-
-    # WOOD PRODUCTS - specific keywords
-    if any(x in combined for x in ['wood product', 'lumber', 'millwork', 'sawmill']):
-        return 'Wood Products & Lumber'
-
-    # HVAC - specific keywords
-    if any(x in combined for x in ['hvac', 'heating', 'air conditioning', 'refrigeration',
-                                     'ventilation']):
-        return 'HVAC & Refrigeration Equipment'
-
-    # MANUFACTURER REPRESENTATIVES - specific keywords
-    if any(x in combined for x in ['manufacturer rep', 'manufacturers rep', 'sales agent',
-                                     'wholesale agent', 'broker']):
-        return 'Manufacturer Representatives'
+    return categorize_generic(combined.__contains__, vertical)
 
-    # GENERAL RETAIL - only if clearly retail
-    if 'retail' in vertical or any(x in combined for x in ['retail store', 'shop', 'boutique']):
-        # But NOT if it's wholesale or manufacturing
-        if 'wholesale' not in combined and 'manufact' not in combined:
-            return 'General Retail'
 
-    # GENERAL WHOLESALE/DISTRIBUTION - catch generic wholesale
-    # This now catches everything that wasn't specifically categorized above
-    if 'wholesale' in vertical or any(x in combined for x in ['wholesale', 'distribution',
-                                                                'merchant wholesale', 'distributor']):
-        return 'General Wholesale/Distribution'
+class IndustryMatcher:
+    """
+    Compiled version of categorize_industry_strict.
 
-    # GENERAL MANUFACTURING - catch generic manufacturing
-    if 'manufacturing' in vertical or 'manufacturing' in combined or 'manufacturer' in combined:
-        return 'General/Specialty Manufacturing'
+    All INDUSTRY_RULES and fallback keywords go into one KeywordMatcher, so each
+    "Sector + QBOIndustryType" string is scanned once. The winning rule is the
+    lowest rule index among the keywords hit, which is exactly the first-match
+    order of the chained checks.
+    """
+
+    def __init__(self):
+        generic_keywords = [kw for _, _, keywords, exclude_keywords in GENERIC_RULES
+                            for kw in keywords + exclude_keywords]
+        all_keywords = [kw for _, keywords in INDUSTRY_RULES for kw in keywords] + generic_keywords
+        self.matcher = KeywordMatcher(all_keywords)
+
+        # First rule each keyword belongs to (fallback-only keywords are absent)
+        self.first_rule = {}
+        for rule_index, (_, keywords) in enumerate(INDUSTRY_RULES):
+            for kw in keywords:
+                self.first_rule.setdefault(kw, rule_index)
+
+        # "sector qbo_type" string -> (specific cluster or None, keyword hits)
+        self._cache = {}
+
+    def _scan(self, combined: str):
+        hits = self.matcher.find_all(combined)
+        rule_indexes = [self.first_rule[kw] for kw in hits if kw in self.first_rule]
+        cluster = INDUSTRY_RULES[min(rule_indexes)][0] if rule_indexes else None
+        return cluster, frozenset(hits)
+
+    def classify(self, combined: str, vertical: str) -> str:
+        """Classify one lowercased "sector qbo_type" string and vertical."""
+        scanned = self._cache.get(combined)
+        if scanned is None:
+            scanned = self._scan(combined)
+            self._cache[combined] = scanned
+
+        cluster, hits = scanned
+        if cluster is not None:
+            return cluster
+        return categorize_generic(hits.__contains__, vertical)
+
+    def classify_values(self, sector, qbo_type, vertical) -> str:
+        """Classify raw Sector / QBOIndustryType / Vertical cell values."""
+        sector = str(sector).lower() if pd.notna(sector) else ''
+        qbo_type = str(qbo_type).lower() if pd.notna(qbo_type) else ''
+        vertical = str(vertical).lower() if pd.notna(vertical) else ''
+        return self.classify(sector + ' ' + qbo_type, vertical)
+
+
+def distinct_row_codes(frame: pd.DataFrame) -> np.ndarray:
+    """
+    Factorize the rows of frame: returns one integer code per row, equal codes
+    for identical value tuples, numbered in order of first appearance.
+    Missing values (NaN/None) all share one code per column.
+    """
+    codes = np.zeros(len(frame), dtype=np.int64)
+    for col in frame.columns:
+        col_codes, col_uniques = pd.factorize(frame[col])
+        # Re-factorize after each column so the combined key never overflows
+        codes, _ = pd.factorize(codes * (len(col_uniques) + 1) + (col_codes + 1))
+    return codes
+
+
+def classify_distinct_rows(df: pd.DataFrame, key_columns: list, classify_row) -> pd.Series:
+    """
+    Run classify_row once per distinct tuple of key_columns and broadcast the
+    labels back to every row through the factorized codes.
+    classify_row receives the first row (as a dict of all df columns) of each tuple.
+    """
+    codes = distinct_row_codes(df[key_columns])
+    _, first_rows = np.unique(codes, return_index=True)
+    distinct = df.iloc[first_rows].to_dict('records')
+    labels = np.array([classify_row(row) for row in distinct], dtype=object)
+    return pd.Series(labels[codes], index=df.index, dtype=object)
+
+
+def categorize_industry_column(df: pd.DataFrame, matcher: IndustryMatcher = None) -> pd.Series:
+    """
+    Cluster every row of df with the compiled IndustryMatcher.
+    Produces the same labels as df.apply(categorize_industry_strict, axis=1),
+    but only classifies each distinct (Sector, QBOIndustryType, Vertical) once.
+    """
+    if matcher is None:
+        matcher = IndustryMatcher()
 
-    # SERVICES & OTHER - everything else
-    return 'Services & Other'
+    key_columns = ['Sector', 'QBOIndustryType', 'Vertical']
+    return classify_distinct_rows(
+        df[key_columns], key_columns,
+        lambda row: matcher.classify_values(row['Sector'], row['QBOIndustryType'], row['Vertical'])
+    )
+
+
+class RuleProfile:
+    """
+    Rule-hit and rule-latency instrumentation for the industry rules.
+
+    Replays the categorize_industry_strict rule chain (INDUSTRY_RULES, then
+    GENERIC_RULES) and records per rule: rows evaluated, rows hit, which
+    keywords matched on a hit, and time spent scanning its keyword list.
+    Each distinct (Sector, QBOIndustryType, Vertical) tuple is replayed once and
+    weighted by its row count, so Time_Sec estimates the row-by-row cost.
+    Counters are additive - update() can be called per chunk.
+    """
+
+    def __init__(self):
+        self.rules = [cluster for cluster, _ in INDUSTRY_RULES] + \
+            [cluster for cluster, _, _, _ in GENERIC_RULES] + [DEFAULT_CLUSTER]
+        self.keywords = [keywords for _, keywords in INDUSTRY_RULES] + \
+            [['vertical:' + term] + keywords for _, term, keywords, _ in GENERIC_RULES] + [[]]
+        self.evaluations = [0] * len(self.rules)
+        self.hits = [0] * len(self.rules)
+        self.seconds = [0.0] * len(self.rules)
+        self.keyword_hits = [{} for _ in self.rules]
+
+    def _record(self, rule_index, rows, seconds, matched=None):
+        self.evaluations[rule_index] += rows
+        self.seconds[rule_index] += seconds * rows
+        if matched is not None:
+            self.hits[rule_index] += rows
+            counts = self.keyword_hits[rule_index]
+            for kw in matched:
+                counts[kw] = counts.get(kw, 0) + rows
+
+    def _replay(self, combined: str, vertical: str, rows: int):
+        timer = time.perf_counter
+        for rule_index, (_, keywords) in enumerate(INDUSTRY_RULES):
+            start = timer()
+            hit = any(x in combined for x in keywords)
+            elapsed = timer() - start
+            if hit:
+                self._record(rule_index, rows, elapsed, [x for x in keywords if x in combined])
+                return
+            self._record(rule_index, rows, elapsed)
+
+        offset = len(INDUSTRY_RULES)
+        for generic_index, (_, term, keywords, exclude_keywords) in enumerate(GENERIC_RULES):
+            start = timer()
+            hit = (term in vertical or any(x in combined for x in keywords)) and \
+                not any(x in combined for x in exclude_keywords)
+            elapsed = timer() - start
+            if hit:
+                matched = (['vertical:' + term] if term in vertical else []) + \
+                    [x for x in keywords if x in combined]
+                self._record(offset + generic_index, rows, elapsed, matched)
+                return
+            self._record(offset + generic_index, rows, elapsed)
+
+        self._record(len(self.rules) - 1, rows, 0.0, [])
+
+    def update(self, df: pd.DataFrame):
+        """Replay the rule chain for every row of df (once per distinct input tuple)."""
+        key_columns = ['Sector', 'QBOIndustryType', 'Vertical']
+        codes = distinct_row_codes(df[key_columns])
+        _, first_rows, row_counts = np.unique(codes, return_index=True, return_counts=True)
+        for row, rows in zip(df[key_columns].iloc[first_rows].itertuples(index=False), row_counts):
+            sector, qbo_type, vertical = row
+            sector = str(sector).lower() if pd.notna(sector) else ''
+            qbo_type = str(qbo_type).lower() if pd.notna(qbo_type) else ''
+            vertical = str(vertical).lower() if pd.notna(vertical) else ''
+            self._replay(sector + ' ' + qbo_type, vertical, int(rows))
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per rule, in evaluation order."""
+        return pd.DataFrame({
+            'Rule_Order': range(1, len(self.rules) + 1),
+            'Cluster': self.rules,
+            'Evaluations': self.evaluations,
+            'Hits': self.hits,
+            'Hit_Rate_Pct': [round(h / e * 100, 2) if e else 0.0
+                             for h, e in zip(self.hits, self.evaluations)],
+            'Time_Sec': [round(s, 6) for s in self.seconds],
+            'Keywords': [len(kws) for kws in self.keywords],
+            'Keywords_Matched': [len(counts) for counts in self.keyword_hits],
+            'Dead_Keywords': [', '.join(kw for kw in kws if kw not in counts)
+                              for kws, counts in zip(self.keywords, self.keyword_hits)],
+        })
+
+    def write(self, output_file: str):
+        """Write <output>_RULE_PROFILE.csv and <output>_RULE_PROFILE.json beside output_file."""
+        stem = output_file[:-4] if output_file.endswith('.csv') else output_file
+        self.to_frame().to_csv(stem + '_RULE_PROFILE.csv', index=False)
+
+        rules = []
+        for i, cluster in enumerate(self.rules):
+            rules.append({
+                'order': i + 1,
+                'cluster': cluster,
+                'evaluations': self.evaluations[i],
+                'hits': self.hits[i],
+                'time_sec': self.seconds[i],
+                'matched_keywords': dict(sorted(self.keyword_hits[i].items(), key=lambda x: -x[1])),
+                'dead_keywords': [kw for kw in self.keywords[i] if kw not in self.keyword_hits[i]],
+            })
+        with open(stem + '_RULE_PROFILE.json', 'w') as f:
+            json.dump({'rows': self.evaluations[0], 'rules': rules}, f, indent=2)
+
+        return stem + '_RULE_PROFILE.csv', stem + '_RULE_PROFILE.json'
+
+
+def benchmark_industry_matcher(df: pd.DataFrame, replicate: int = 100):
+    """
+    Check categorize_industry_column against the row-by-row
+    categorize_industry_strict, then time both on the rows of df with a
+    distinct "sector qbo_type" string, so no per-tuple or per-string cache can
+    hit. The compiled pass is repeated `replicate` times with its scan cache
+    cleared each time. The end-to-end column time on df replicated
+    `replicate` times, which is mostly the distinct-tuple dedup, is reported
+    separately.
+    """
+    key_columns = ['Sector', 'QBOIndustryType', 'Vertical']
+    def lowered(col):
+        return df[col].astype(object).where(df[col].notna(), '').astype(str).str.lower()
+
+    combined = lowered('Sector') + ' ' + lowered('QBOIndustryType')
+    distinct = df.loc[~combined.duplicated(), key_columns]
+
+    print("\n" + "="*80)
+    print(f"INDUSTRY MATCHER BENCHMARK ({len(df):,} rows, {len(distinct):,} distinct inputs)")
+    print("="*80)
+
+    compiled = categorize_industry_column(df)
+    mismatches = int((compiled != df.apply(categorize_industry_strict, axis=1)).sum())
+    print(f"Label mismatches vs categorize_industry_strict: {mismatches}")
+
+    start = time.perf_counter()
+    distinct.apply(categorize_industry_strict, axis=1)
+    reference_secs = time.perf_counter() - start
+
+    matcher = IndustryMatcher()
+    rows = list(zip(*(distinct[col] for col in key_columns)))
+    start = time.perf_counter()
+    for _ in range(replicate):
+        matcher._cache.clear()
+        for sector, qbo_type, vertical in rows:
+            matcher.classify_values(sector, qbo_type, vertical)
+    matcher_secs = time.perf_counter() - start
+
+    big = pd.concat([df] * replicate, ignore_index=True)
+    start = time.perf_counter()
+    categorize_industry_column(big)
+    column_secs = time.perf_counter() - start
+
+    print(f"Row-by-row rules:  {len(distinct) / reference_secs:>12,.0f} distinct inputs/sec")
+    print(f"Compiled matcher:  {len(distinct) * replicate / matcher_secs:>12,.0f} distinct inputs/sec "
+          f"(no cache hits)")
+    print(f"Column end to end: {len(big) / column_secs:>12,.0f} rows/sec "
+          f"({len(big):,} rows, {len(distinct):,} distinct inputs, in {column_secs:.2f}s)")
+
+    return mismatches == 0
 
 def calculate_mrr(row):
     """Calculate Monthly Recurring Revenue based on payment type"""
@@ -191,6 +420,7 @@ def classify_b2b_b2c(row):
     # Everything else is predominantly B2B
     return 'B2B'
 
+
 def classify_company_size(employees):
     """Classify company size based on employee count"""
     if pd.isna(employees) or employees == 0:
@@ -206,55 +436,510 @@ def classify_company_size(employees):
     else:
         return 'Enterprise (200+ employees)'
 
+
+# Derived-column engine: vectorized equivalents of calculate_mrr,
+# classify_b2b_b2c and classify_company_size over whole columns
+COMPANY_SIZE_BINS = [-np.inf, 5, 20, 50, 200, np.inf]
+COMPANY_SIZE_LABELS = ['Micro (1-5 employees)', 'Small (6-20 employees)', 'Medium (21-50 employees)',
+                       'Large (51-200 employees)', 'Enterprise (200+ employees)']
+
+
+def compute_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute MRR_Calculated, Business_Type_V2 and Company_Size_V2 for every row
+    in one vectorized pass. Requires Industry_Cluster_Enhanced_V2 to be set.
+    """
+    # MRR - Prepay/Annual invoices cover a year, missing invoices count as 0
+    invoice = df['Last Invoice $']
+    pay_type = df['SaaS Pay Type']
+    mrr = np.select(
+        [invoice.isna().to_numpy(), pay_type.isin(['Prepay', 'Annual']).to_numpy()],
+        [0, invoice.to_numpy(dtype=float) / 12],
+        default=invoice.to_numpy(dtype=float)
+    )
+
+    # Business type - B2C/Hybrid thresholds only apply to consumer-facing clusters
+    cluster = df['Industry_Cluster_Enhanced_V2'].astype(str)
+    customers = df['Customers'].fillna(0).to_numpy()
+    is_retail = cluster.str.contains('General Retail', regex=False).to_numpy()
+    is_consumer_mfg = (cluster.str.contains('Food & Beverage', regex=False) |
+                       cluster.str.contains('Apparel', regex=False)).to_numpy()
+    b2c_threshold = np.select([is_retail, is_consumer_mfg], [1000, 500], default=np.inf)
+    business_type = np.select(
+        [customers > b2c_threshold, (is_retail | is_consumer_mfg) & (customers > 100)],
+        ['B2C', 'Hybrid (B2B & B2C)'],
+        default='B2B'
+    ).astype(object)
+
+    # Company size - 0 or missing employees is Unknown
+    employees = df['Employees']
+    company_size = pd.cut(employees, bins=COMPANY_SIZE_BINS, labels=COMPANY_SIZE_LABELS).astype(object)
+    company_size = company_size.where(employees.notna() & (employees != 0), 'Unknown')
+
+    return pd.DataFrame({
+        'MRR_Calculated': mrr,
+        'Business_Type_V2': business_type,
+        'Company_Size_V2': company_size.to_numpy(),
+    }, index=df.index)
+
+
+def derived_column_edge_cases() -> pd.DataFrame:
+    """Synthetic rows covering every branch and boundary of the derived-column rules."""
+    clusters = ['General Retail', 'Food & Beverage Dist/Mfg', 'Apparel & Textiles',
+                'Metal Fabrication & Steel', 'Services & Other']
+    customers = [np.nan, 0, 100, 101, 500, 501, 1000, 1001]
+    employees = [np.nan, 0, 1, 5, 5.5, 6, 20, 21, 50, 51, 200, 201, -1]
+    invoices = [np.nan, 0.0, 1200.0, 99.99]
+    pay_types = ['Monthly', 'Prepay', 'Annual', None, 'Other']
+
+    rows = []
+    for i in range(max(len(clusters) * len(customers), len(employees), len(invoices) * len(pay_types))):
+        rows.append({
+            'Industry_Cluster_Enhanced_V2': clusters[i % len(clusters)],
+            'Customers': customers[(i // len(clusters)) % len(customers)],
+            'Employees': employees[i % len(employees)],
+            'Last Invoice $': invoices[i % len(invoices)],
+            'SaaS Pay Type': pay_types[(i // len(invoices)) % len(pay_types)],
+        })
+    return pd.DataFrame(rows)
+
+
+def verify_derived_columns(df: pd.DataFrame) -> bool:
+    """
+    Equivalence harness: compare compute_derived_columns with the row-by-row
+    calculate_mrr / classify_b2b_b2c / classify_company_size, cell for cell.
+    Runs on df and on derived_column_edge_cases().
+    """
+    print("\n" + "="*80)
+    print("DERIVED COLUMN EQUIVALENCE CHECK")
+    print("="*80)
+
+    all_match = True
+    for name, frame in [('input', df), ('edge cases', derived_column_edge_cases())]:
+        expected = pd.DataFrame({
+            'MRR_Calculated': frame.apply(calculate_mrr, axis=1),
+            'Business_Type_V2': frame.apply(classify_b2b_b2c, axis=1),
+            'Company_Size_V2': frame['Employees'].apply(classify_company_size),
+        }, index=frame.index)
+        actual = compute_derived_columns(frame)
+
+        for col in expected.columns:
+            same = (expected[col] == actual[col]) | (expected[col].isna() & actual[col].isna())
+            mismatches = int((~same).sum())
+            all_match = all_match and mismatches == 0
+            print(f"{name:<12} {col:<20} {len(frame):>8,} rows | mismatches: {mismatches}")
+
+    print(f"\n{'✅ Outputs identical' if all_match else '❌ Outputs differ'}")
+    return all_match
+
+
+# Columns written by the re-clustering run
+DERIVED_COLUMNS = ['Industry_Cluster_Enhanced_V2', 'MRR_Calculated', 'Business_Type_V2', 'Company_Size_V2']
+# Every input column the DERIVED_COLUMNS depend on
+INPUT_COLUMNS = ['Sector', 'QBOIndustryType', 'Vertical', 'Customers', 'Employees',
+                 'Last Invoice $', 'SaaS Pay Type']
+
+
+def recluster_frame(df: pd.DataFrame, row_by_row: bool = False,
+                    matcher: IndustryMatcher = None, workers: int = 1,
+                    executor: ProcessPoolExecutor = None) -> pd.DataFrame:
+    """
+    Add DERIVED_COLUMNS to df (in place) and return it.
+
+    Args:
+        df: CRM export rows
+        row_by_row: Use the df.apply reference functions instead of the
+                    distinct-tuple matcher and vectorized derived-column engine
+        matcher: IndustryMatcher to reuse across calls (e.g. one per chunk)
+        workers: Shard the rows across this many processes (see recluster_parallel)
+        executor: Process pool to shard on instead of starting one (workers > 1)
+    """
+    if workers > 1:
+        derived = recluster_parallel(df, workers, row_by_row=row_by_row, executor=executor)
+        for col in DERIVED_COLUMNS:
+            df[col] = derived[col]
+    elif row_by_row:
+        df['Industry_Cluster_Enhanced_V2'] = df.apply(categorize_industry_strict, axis=1)
+        df['MRR_Calculated'] = df.apply(calculate_mrr, axis=1)
+        df['Business_Type_V2'] = df.apply(classify_b2b_b2c, axis=1)
+        df['Company_Size_V2'] = df['Employees'].apply(classify_company_size)
+    else:
+        df['Industry_Cluster_Enhanced_V2'] = categorize_industry_column(df, matcher)
+        derived = compute_derived_columns(df)
+        for col in derived.columns:
+            df[col] = derived[col]
+    return df
+
+
+def _recluster_shard(shard: pd.DataFrame, row_by_row: bool) -> dict:
+    """Worker entry point: classify one shard and return its derived columns as arrays."""
+    shard = recluster_frame(shard, row_by_row=row_by_row)
+    return {col: shard[col].to_numpy() for col in DERIVED_COLUMNS}
+
+
+def recluster_parallel(df: pd.DataFrame, workers: int, row_by_row: bool = False,
+                       executor: ProcessPoolExecutor = None) -> pd.DataFrame:
+    """
+    Compute DERIVED_COLUMNS for df on a process pool.
+
+    Rows are split into `workers` contiguous ranges; only INPUT_COLUMNS are
+    sent to the workers and only the derived columns come back. Results are
+    concatenated in input order, so the output matches the serial run.
+    A pool is started for the call unless executor is given (e.g. one pool
+    shared by every chunk of a streaming run).
+    """
+    bounds = np.linspace(0, len(df), workers + 1).astype(int)
+    inputs = df[INPUT_COLUMNS]
+    shards = [inputs.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+    pool = ProcessPoolExecutor(max_workers=workers) if executor is None else nullcontext(executor)
+    with pool as executor:
+        results = list(executor.map(_recluster_shard, shards, [row_by_row] * len(shards)))
+
+    return pd.DataFrame({
+        col: np.concatenate([result[col] for result in results]) if results else []
+        for col in DERIVED_COLUMNS
+    }, index=df.index)
+
+
+def benchmark_workers(df: pd.DataFrame, worker_counts=(1, 2, 4, 8), replicate: int = 20):
+    """
+    Time recluster_frame on df replicated `replicate` times for each worker
+    count, report speedup over 1 worker and check that the full output CSV
+    (every column, as written by the CLI) is byte-identical to the 1-worker run.
+    """
+    print("\n" + "="*80)
+    print(f"WORKER SCALING BENCHMARK ({len(df):,} rows x {replicate})")
+    print("="*80)
+
+    big = pd.concat([df] * replicate, ignore_index=True)
+    baseline_secs = None
+    baseline_digest = None
+    all_identical = True
+
+    for workers in worker_counts:
+        frame = big.copy()
+        start = time.perf_counter()
+        recluster_frame(frame, workers=workers)
+        secs = time.perf_counter() - start
+
+        digest = hashlib.sha256(frame.to_csv(index=False).encode('utf-8')).hexdigest()
+        if baseline_secs is None:
+            baseline_secs, baseline_digest = secs, digest
+        identical = digest == baseline_digest
+        all_identical = all_identical and identical
+
+        print(f"{workers:>2} workers: {secs:>7.2f}s | {len(big) / secs:>12,.0f} rows/sec | "
+              f"speedup {baseline_secs / secs:>4.2f}x | identical output CSV: {identical}")
+
+    return all_identical
+
+
+class ClusterSummary:
+    """
+    Running aggregates behind the cluster distribution tables.
+
+    Counts and MRR sums per cluster are additive, so summaries of separate
+    chunks can be combined with update()/merge() without keeping the rows.
+    """
+
+    def __init__(self):
+        self.total_accounts = 0
+        self.active_accounts = 0
+        self.cluster_counts = {}
+        self.active_counts = {}
+        self.active_mrr_sum = {}
+        self.active_mrr_count = {}
+
+    @staticmethod
+    def _add(target: dict, values: dict):
+        for key, value in values.items():
+            target[key] = target.get(key, 0) + value
+
+    def update(self, df: pd.DataFrame):
+        """Add the rows of a re-clustered frame (or chunk)."""
+        self.total_accounts += len(df)
+        self._add(self.cluster_counts, df['Industry_Cluster_Enhanced_V2'].value_counts(sort=False).to_dict())
+
+        active = df[df['Active?'] == True]
+        self.active_accounts += len(active)
+        grouped = active.groupby('Industry_Cluster_Enhanced_V2', sort=False)['MRR_Calculated']
+        self._add(self.active_counts, grouped.size().to_dict())
+        self._add(self.active_mrr_sum, grouped.sum().to_dict())
+        self._add(self.active_mrr_count, grouped.count().to_dict())
+
+    def merge(self, other: 'ClusterSummary'):
+        """Fold another summary into this one."""
+        self.total_accounts += other.total_accounts
+        self.active_accounts += other.active_accounts
+        self._add(self.cluster_counts, other.cluster_counts)
+        self._add(self.active_counts, other.active_counts)
+        self._add(self.active_mrr_sum, other.active_mrr_sum)
+        self._add(self.active_mrr_count, other.active_mrr_count)
+
+    def print_tables(self):
+        """Print the all-accounts and active-accounts cluster distributions."""
+        print("\n" + "="*80)
+        print("CLUSTER DISTRIBUTION (ALL ACCOUNTS)")
+        print("="*80)
+        for cluster, count in sorted(self.cluster_counts.items(), key=lambda x: -x[1]):
+            pct = count / self.total_accounts * 100
+            print(f"{cluster:<40} {count:>6,} ({pct:>5.1f}%)")
+
+        # Active accounts only
+        print("\n" + "="*80)
+        print(f"CLUSTER DISTRIBUTION (ACTIVE ACCOUNTS, n={self.active_accounts:,})")
+        print("="*80)
+        for cluster, count in sorted(self.active_counts.items(), key=lambda x: -x[1]):
+            pct = count / self.active_accounts * 100
+            total_mrr = self.active_mrr_sum[cluster]
+            mrr_count = self.active_mrr_count[cluster]
+            avg_mrr = total_mrr / mrr_count if mrr_count else np.nan
+            print(f"{cluster:<40} {count:>6,} ({pct:>5.1f}%) | MRR: ${total_mrr:>8,.0f} | Avg: ${avg_mrr:>6,.0f}")
+
+
+def recluster_streaming(input_file: str, output_file: str, chunksize: int,
+                        row_by_row: bool = False, workers: int = 1,
+                        profile: RuleProfile = None) -> ClusterSummary:
+    """
+    Re-cluster input_file in chunks of `chunksize` rows, appending each
+    classified chunk to output_file. Peak memory is bounded by the chunk size;
+    only the ClusterSummary running aggregates are kept between chunks.
+
+    If profile is given, it is updated with every chunk. With workers > 1 one
+    process pool is started for the whole run and shared by every chunk.
+
+    Note: pandas infers dtypes per chunk, so a column that is integral in one
+    chunk and has missing values in another may be written as 5 vs 5.0.
+    """
+    matcher = IndustryMatcher()
+    summary = ClusterSummary()
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+    with pool as executor:
+        for chunk_number, chunk in enumerate(pd.read_csv(input_file, chunksize=chunksize)):
+            chunk = recluster_frame(chunk, row_by_row=row_by_row, matcher=matcher, workers=workers,
+                                    executor=executor)
+            chunk.to_csv(output_file, index=False, mode='w' if chunk_number == 0 else 'a',
+                         header=chunk_number == 0)
+            summary.update(chunk)
+            if profile is not None:
+                profile.update(chunk)
+            print(f"Processed chunk {chunk_number + 1} ({summary.total_accounts:,} rows so far)")
+
+    return summary
+
+
+# Incremental mode: a row is only re-classified when its INPUT_COLUMNS change
+HASH_NUMERIC_COLUMNS = ['Customers', 'Employees', 'Last Invoice $']
+
+
+def account_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Row identity across exports: Account Name, plus an occurrence number so
+    duplicate account names still get distinct keys.
+    """
+    names = df['Account Name'].astype(str)
+    occurrence = names.groupby(names).cumcount()
+    return names.where(occurrence == 0, names + '#' + occurrence.astype(str))
+
+
+def row_content_hashes(df: pd.DataFrame) -> pd.Series:
+    """
+    Stable 64-bit hash of each row's INPUT_COLUMNS values.
+
+    Values are normalized first (numbers as float, text as str, missing as None)
+    so the hash does not depend on the dtypes pandas infers for a given export.
+    """
+    normalized = pd.DataFrame(index=df.index)
+    for col in INPUT_COLUMNS:
+        if col in HASH_NUMERIC_COLUMNS:
+            normalized[col] = pd.to_numeric(df[col], errors='coerce').astype(float)
+        else:
+            normalized[col] = df[col].astype(object).where(df[col].notna(), None).astype(str)
+    return pd.util.hash_pandas_object(normalized, index=False).astype('uint64')
+
+
+# Code the DERIVED_COLUMNS are computed by, on both the compiled and the row-by-row path
+DERIVATION_CODE = [categorize_generic, categorize_industry_strict, KeywordMatcher, IndustryMatcher,
+                   distinct_row_codes, classify_distinct_rows, categorize_industry_column, calculate_mrr,
+                   classify_b2b_b2c, classify_company_size, compute_derived_columns, recluster_frame]
+
+
+def derivation_fingerprint() -> str:
+    """
+    SHA-256 of the rule tables and the source of DERIVATION_CODE. Stored input
+    hashes are only valid for the fingerprint they were written with: a rule or
+    code change can relabel rows whose inputs did not change.
+    """
+    digest = hashlib.sha256(repr((INDUSTRY_RULES, GENERIC_RULES, DEFAULT_CLUSTER,
+                                  COMPANY_SIZE_BINS, COMPANY_SIZE_LABELS)).encode('utf-8'))
+    for obj in DERIVATION_CODE:
+        digest.update(inspect.getsource(obj).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def incremental_paths(output_file: str):
+    """Hash store and change log written beside output_file."""
+    stem = output_file[:-4] if output_file.endswith('.csv') else output_file
+    return stem + '_INPUT_HASHES.json', stem + '_CHANGELOG.csv'
+
+
+def recluster_incremental(df: pd.DataFrame, output_file: str, row_by_row: bool = False,
+                          workers: int = 1):
+    """
+    Re-cluster df, reusing the previous output for rows whose inputs are unchanged.
+
+    Rows are matched to the previous run by account_keys, in both the previous
+    output and the hash store; a row is recomputed if it is new, missing from
+    either, or its row_content_hashes value differs from the stored one. If the
+    store was written under a different derivation_fingerprint, every row is
+    recomputed. Writes the hash store beside output_file and returns
+    (df, change_log) where change_log lists new, reclassified and removed accounts.
+    """
+    hash_file, _ = incremental_paths(output_file)
+    keys = account_keys(df)
+    hashes = row_content_hashes(df).map('{:016x}'.format)
+    fingerprint = derivation_fingerprint()
+
+    previous = pd.DataFrame(columns=['Account Name'] + DERIVED_COLUMNS)
+    stored_hashes = {}
+    try:
+        with open(hash_file) as f:
+            store = json.load(f)
+        previous = pd.read_csv(output_file, usecols=['Account Name'] + DERIVED_COLUMNS,
+                               float_precision='round_trip')
+    except (FileNotFoundError, ValueError):
+        print(f"No previous run found beside {output_file} - classifying all rows")
+    else:
+        if store.get('fingerprint') == fingerprint:
+            stored_hashes = store['hashes']
+        else:
+            print("Rules or derivation code changed since the previous run - classifying all rows")
+    previous.index = account_keys(previous)
+
+    reuse = (keys.isin(previous.index) & (keys.map(stored_hashes) == hashes)).to_numpy()
+
+    print(f"Unchanged rows reused: {reuse.sum():,} | rows to classify: {(~reuse).sum():,}")
+
+    recomputed = recluster_frame(df.loc[~reuse].copy(), row_by_row=row_by_row, workers=workers)
+    reused = previous.loc[keys[reuse], DERIVED_COLUMNS].set_axis(df.index[reuse])
+    parts = [part for part in [recomputed[DERIVED_COLUMNS], reused] if len(part)]
+    merged = pd.concat(parts).loc[df.index]
+    for col in DERIVED_COLUMNS:
+        df[col] = merged[col]
+
+    # Change log: recomputed rows whose outputs differ, new accounts, removed accounts
+    changed_keys = keys[~reuse]
+    before = previous.reindex(changed_keys)[DERIVED_COLUMNS]
+    after = recomputed[DERIVED_COLUMNS].set_axis(changed_keys.to_numpy())
+    is_new = ~changed_keys.isin(previous.index).to_numpy()
+    differs = ~((before == after) | (before.isna() & after.isna())).all(axis=1).to_numpy()
+
+    log = pd.DataFrame({'Account Name': df.loc[~reuse, 'Account Name'].to_numpy()})
+    log['Change'] = np.where(is_new, 'New', 'Reclassified')
+    for col in DERIVED_COLUMNS:
+        log[f'Previous_{col}'] = before[col].to_numpy()
+        log[f'New_{col}'] = after[col].to_numpy()
+    log = log[is_new | differs]
+
+    removed = previous.loc[~previous.index.isin(keys)]
+    if len(removed):
+        removed_log = pd.DataFrame({'Account Name': removed['Account Name'].to_numpy(), 'Change': 'Removed'})
+        for col in DERIVED_COLUMNS:
+            removed_log[f'Previous_{col}'] = removed[col].to_numpy()
+        log = pd.concat([log, removed_log], ignore_index=True)
+
+    with open(hash_file, 'w') as f:
+        json.dump({'fingerprint': fingerprint, 'hashes': dict(zip(keys, hashes))}, f)
+    return df, log.reset_index(drop=True)
+
 # Main execution
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='V2 strict industry re-clustering')
+    parser.add_argument('--input', default='../data/customermethodaccount_01-07-2026_11_10_09_am.csv')
+    parser.add_argument('--output', default='../data/customermethodaccount_01-07-2026_RECLUSTERED_V2.csv')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Benchmark the compiled industry matcher against the row-by-row rules and exit')
+    parser.add_argument('--row-by-row', action='store_true',
+                        help='Classify every row with df.apply instead of once per distinct input tuple')
+    parser.add_argument('--verify', action='store_true',
+                        help='Check the vectorized derived columns against the row-by-row functions')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only re-classify rows whose inputs changed since the previous run of --output')
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help='Stream the input in chunks of N rows instead of loading it whole')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Shard classification across N processes')
+    parser.add_argument('--benchmark-workers', action='store_true',
+                        help='Report re-clustering speedup at 1, 2, 4 and 8 workers and exit')
+    parser.add_argument('--profile', action='store_true',
+                        help='Write per-rule evaluation/hit/keyword/time profile beside the output')
+    args = parser.parse_args()
+
+    if args.chunksize:
+        if args.incremental or args.verify or args.benchmark or args.benchmark_workers:
+            parser.error('--chunksize cannot be combined with --incremental, --verify or benchmarks')
+
+        print(f"Streaming re-clustering in chunks of {args.chunksize:,} rows...")
+        profile = RuleProfile() if args.profile else None
+        summary = recluster_streaming(args.input, args.output, args.chunksize,
+                                      row_by_row=args.row_by_row, workers=args.workers,
+                                      profile=profile)
+        summary.print_tables()
+        print(f"\n✅ Saved re-clustered data to: {args.output}")
+        if profile is not None:
+            print(f"✅ Saved rule profile to: {', '.join(profile.write(args.output))}")
+        print("\n" + "="*80)
+        print("Re-clustering complete! Next step: Review uncertain accounts and validate with websites.")
+        print("="*80)
+        raise SystemExit(0)
+
     print("Loading data...")
-    df = pd.read_csv('../data/customermethodaccount_01-07-2026_11_10_09_am.csv')
+    df = pd.read_csv(args.input)
 
     print(f"Total records: {len(df):,}")
 
-    # Apply strict clustering
-    print("\nApplying strict industry clustering...")
-    df['Industry_Cluster_Enhanced_V2'] = df.apply(categorize_industry_strict, axis=1)
+    if args.benchmark:
+        benchmark_industry_matcher(df)
+        raise SystemExit(0)
 
-    # Calculate MRR
-    print("Calculating MRR...")
-    df['MRR_Calculated'] = df.apply(calculate_mrr, axis=1)
+    if args.benchmark_workers:
+        benchmark_workers(df)
+        raise SystemExit(0)
 
-    # Classify B2B/B2C
-    print("Classifying business type...")
-    df['Business_Type_V2'] = df.apply(classify_b2b_b2c, axis=1)
+    # Apply strict clustering, MRR, business type and company size
+    print("\nApplying strict industry clustering, MRR, business type and company size...")
+    if args.incremental:
+        df, change_log = recluster_incremental(df, args.output, row_by_row=args.row_by_row,
+                                               workers=args.workers)
+    else:
+        df = recluster_frame(df, row_by_row=args.row_by_row, workers=args.workers)
 
-    # Classify company size
-    print("Classifying company size...")
-    df['Company_Size_V2'] = df['Employees'].apply(classify_company_size)
+    if args.verify:
+        verify_derived_columns(df)
 
     # Summary statistics
-    print("\n" + "="*80)
-    print("CLUSTER DISTRIBUTION (ALL ACCOUNTS)")
-    print("="*80)
-    cluster_counts = df['Industry_Cluster_Enhanced_V2'].value_counts()
-    for cluster, count in cluster_counts.items():
-        pct = count / len(df) * 100
-        print(f"{cluster:<40} {count:>6,} ({pct:>5.1f}%)")
-
-    # Active accounts only
-    active = df[df['Active?'] == True]
-    print("\n" + "="*80)
-    print(f"CLUSTER DISTRIBUTION (ACTIVE ACCOUNTS, n={len(active):,})")
-    print("="*80)
-    active_cluster_counts = active['Industry_Cluster_Enhanced_V2'].value_counts()
-    for cluster, count in active_cluster_counts.items():
-        pct = count / len(active) * 100
-        total_mrr = active[active['Industry_Cluster_Enhanced_V2'] == cluster]['MRR_Calculated'].sum()
-        avg_mrr = active[active['Industry_Cluster_Enhanced_V2'] == cluster]['MRR_Calculated'].mean()
-        print(f"{cluster:<40} {count:>6,} ({pct:>5.1f}%) | MRR: ${total_mrr:>8,.0f} | Avg: ${avg_mrr:>6,.0f}")
+    summary = ClusterSummary()
+    summary.update(df)
+    summary.print_tables()
 
     # Save enhanced file
-    output_file = '../data/customermethodaccount_01-07-2026_RECLUSTERED_V2.csv'
+    output_file = args.output
     df.to_csv(output_file, index=False)
     print(f"\n✅ Saved re-clustered data to: {output_file}")
 
+    if args.profile:
+        profile = RuleProfile()
+        profile.update(df)
+        print(f"✅ Saved rule profile to: {', '.join(profile.write(output_file))}")
+
+    if args.incremental:
+        hash_file, change_log_file = incremental_paths(output_file)
+        change_log.to_csv(change_log_file, index=False)
+        print(f"✅ Saved input hashes to: {hash_file}")
+        print(f"✅ Saved change log ({len(change_log):,} accounts) to: {change_log_file}")
+
     print("\n" + "="*80)
     print("Re-clustering complete! Next step: Review uncertain accounts and validate with websites.")
     print("="*80)
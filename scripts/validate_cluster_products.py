@@ -8,9 +8,16 @@ Author: Evidence-Based Analysis
 Date: January 7, 2026
 """
 
+import argparse
+import numpy as np
 import pandas as pd
 import re
-from typing import Dict, List, Tuple
+import time
+from scipy import sparse
+from typing import Dict, List, Optional, Tuple
+
+from keyword_matcher import KeywordMatcher
+from product_offerings_store import load_product_offerings
 
 # Product keyword patterns for each cluster
 # Based on what customers actually sell (not what they say they do)
@@ -173,6 +180,77 @@ def classify_product_item(item_name: str, cluster_definitions: Dict) -> Dict[str
     return cluster_scores
 
 
+class ProductKeywordIndex:
+    """
+    Inverted index over cluster definitions: keyword -> [(cluster, weight)] for
+    keywords and keyword -> [cluster] for exclude lists, all compiled into one
+    KeywordMatcher. An item is scanned once and only the clusters touched by the
+    keywords it contains are scored; every other cluster scores 0.0.
+
+    weight is how many times the keyword appears in the cluster's keyword list,
+    so a cluster's score is sum(weights hit) / len(keywords), exactly the
+    classify_product_item confidence.
+    """
+
+    def __init__(self, cluster_definitions: Dict):
+        self.clusters: List[str] = list(cluster_definitions)
+        self.keyword_counts: List[int] = [max(len(cluster_definitions[c]['keywords']), 1)
+                                          for c in self.clusters]
+
+        postings: Dict[str, Dict[int, int]] = {}
+        exclude_postings: Dict[str, List[int]] = {}
+        for cluster_idx, cluster in enumerate(self.clusters):
+            definition = cluster_definitions[cluster]
+            for keyword in definition['keywords']:
+                weights = postings.setdefault(keyword, {})
+                weights[cluster_idx] = weights.get(cluster_idx, 0) + 1
+            for keyword in definition.get('exclude', []):
+                exclude_postings.setdefault(keyword, []).append(cluster_idx)
+
+        self.matcher = KeywordMatcher(list(postings) + list(exclude_postings))
+        self.postings: List[List[Tuple[int, int]]] = [[] for _ in self.matcher.keywords]
+        self.exclude_postings: List[List[int]] = [[] for _ in self.matcher.keywords]
+        for keyword, weights in postings.items():
+            self.postings[self.matcher.keyword_id(keyword)] = list(weights.items())
+        for keyword, cluster_ids in exclude_postings.items():
+            self.exclude_postings[self.matcher.keyword_id(keyword)] = cluster_ids
+
+    def touched_scores(self, item_name: str) -> Dict[int, float]:
+        """Scores for the clusters whose keywords or excludes occur in the item."""
+        matches: Dict[int, int] = {}
+        excluded = set()
+        for keyword_id in self.matcher.find_ids(item_name.lower()):
+            for cluster_idx, weight in self.postings[keyword_id]:
+                matches[cluster_idx] = matches.get(cluster_idx, 0) + weight
+            excluded.update(self.exclude_postings[keyword_id])
+
+        scores = {cluster_idx: min(count / self.keyword_counts[cluster_idx], 1.0)
+                  for cluster_idx, count in matches.items()}
+        for cluster_idx in excluded:
+            scores[cluster_idx] = 0.0
+        return scores
+
+    def score(self, item_name: str) -> Dict[str, float]:
+        """Same result as classify_product_item(item_name, cluster_definitions)."""
+        touched = self.touched_scores(item_name)
+        return {cluster: touched.get(cluster_idx, 0.0) for cluster_idx, cluster in enumerate(self.clusters)}
+
+    def best_cluster(self, item_name: str) -> Optional[str]:
+        """
+        Highest-scoring cluster, or None when nothing scores above 0. Ties go to
+        the cluster defined first, as with max() over the score dict.
+        """
+        touched = self.touched_scores(item_name)
+        best_idx, best_score = None, 0.0
+        for cluster_idx, score in touched.items():
+            if score > best_score or (score == best_score and best_idx is not None and cluster_idx < best_idx):
+                best_idx, best_score = cluster_idx, score
+        return self.clusters[best_idx] if best_idx is not None else None
+
+
+PRODUCT_KEYWORD_INDEX = ProductKeywordIndex(CLUSTER_PRODUCT_KEYWORDS)
+
+
 def classify_account_products(products: List[str]) -> Dict[str, any]:
     """
     Classify an account based on its product mix.
@@ -191,13 +269,10 @@ def classify_account_products(products: List[str]) -> Dict[str, any]:
     cluster_item_counts = {cluster: 0 for cluster in CLUSTER_PRODUCT_KEYWORDS.keys()}
 
     for product in products:
-        scores = classify_product_item(product, CLUSTER_PRODUCT_KEYWORDS)
-
         # Assign to cluster with highest score (if > 0)
-        if scores:
-            best_cluster = max(scores, key=scores.get)
-            if scores[best_cluster] > 0:
-                cluster_item_counts[best_cluster] += 1
+        best_cluster = PRODUCT_KEYWORD_INDEX.best_cluster(product)
+        if best_cluster is not None:
+            cluster_item_counts[best_cluster] += 1
 
     # Calculate percentages
     total_items = len(products)
@@ -227,33 +302,144 @@ def classify_account_products(products: List[str]) -> Dict[str, any]:
     }
 
 
-def validate_cluster_products(cluster_name: str = None,
-                                sample_size: int = None,
-                                output_file: str = 'product_validation_results.csv'):
+def item_cluster_score_matrix(items: List[str],
+                              index: ProductKeywordIndex = PRODUCT_KEYWORD_INDEX) -> sparse.csr_matrix:
     """
-    Validate accounts via product data analysis.
+    (items x clusters) CSR matrix of classify_product_item scores, one automaton
+    pass per item. Only positive scores are stored; column order is index.clusters.
+    """
+    rows, cols, data = [], [], []
+    for row, item in enumerate(items):
+        for cluster_idx, score in index.touched_scores(item).items():
+            if score > 0:
+                rows.append(row)
+                cols.append(cluster_idx)
+                data.append(score)
+    matrix = sparse.csr_matrix((data, (rows, cols)), shape=(len(items), len(index.clusters)))
+    matrix.sum_duplicates()
+    return matrix
+
+
+def best_cluster_assignments(scores: sparse.csr_matrix) -> sparse.csr_matrix:
+    """
+    One-hot (items x clusters) matrix of each item's best cluster. Rows with no
+    positive score stay empty; ties go to the lowest column (first-defined cluster),
+    as with max() over the classify_product_item dict.
+    """
+    best = np.asarray(scores.argmax(axis=1)).ravel()
+    assigned = np.flatnonzero(np.diff(scores.indptr) > 0)
+    return sparse.csr_matrix((np.ones(len(assigned)), (assigned, best[assigned])), shape=scores.shape)
 
-    Args:
-        cluster_name: If specified, only validate this cluster
-        sample_size: If specified, limit to N accounts per cluster
-        output_file: Output CSV filename
+
+def classify_accounts_products(products_df: pd.DataFrame) -> pd.DataFrame:
     """
+    classify_account_products for every account in products_df at once.
+
+    Distinct items are scored into a sparse item x cluster matrix, reduced to a
+    one-hot best-cluster matrix, and summed per account with a sparse
+    (accounts x items) row-count matrix. Returns one row per account with
+    Classification, Confidence, Item_Match_Count, Item_Match_Pct, Top_3_Clusters
+    and Items_Analyzed.
+    """
+    clusters = PRODUCT_KEYWORD_INDEX.clusters
+    account_codes, accounts = pd.factorize(products_df['Account'], sort=False)
+    item_codes, items = pd.factorize(products_df['Item'], sort=False)
+
+    assignments = best_cluster_assignments(item_cluster_score_matrix(list(items)))
+    account_items = sparse.csr_matrix(
+        (np.ones(len(products_df)), (account_codes, item_codes)), shape=(len(accounts), len(items)))
+    cluster_counts = np.asarray((account_items @ assignments).todense())
+
+    total_items = np.bincount(account_codes, minlength=len(accounts))
+    percentages = cluster_counts / total_items[:, None] * 100
+
+    best = percentages.argmax(axis=1)
+    best_percentage = percentages[np.arange(len(accounts)), best]
+    top_3 = np.argsort(-percentages, axis=1, kind='stable')[:, :3]
+    top_3_str = [', '.join([f"{clusters[c]}: {pct[c]:.1f}%" for c in order if pct[c] > 0])
+                 for pct, order in zip(percentages, top_3)]
+
+    return pd.DataFrame({
+        'Account': accounts,
+        'Classification': np.where(best_percentage >= 20, np.array(clusters, dtype=object)[best],
+                                   'General Wholesale/Distribution'),
+        'Confidence': best_percentage,
+        'Item_Match_Count': cluster_counts[np.arange(len(accounts)), best].astype(int),
+        'Item_Match_Pct': best_percentage,
+        'Top_3_Clusters': top_3_str,
+        'Items_Analyzed': total_items,
+    })
+
+
+def round_values(values, digits: int) -> List[float]:
+    """Python round() on plain floats (numpy rounds some halves the other way)."""
+    return [round(float(v), digits) for v in values]
+
+
+def conflict_note(matches_expected: bool, classification: str, confidence: float,
+                  expected_cluster: str) -> str:
+    """Notes column text for an account whose products disagree with its cluster."""
+    if matches_expected:
+        return ''
+    if confidence >= 40:
+        return (f"HIGH CONFIDENCE CONFLICT: Products suggest {classification} "
+                f"({confidence:.1f}%) but classified as {expected_cluster}")
+    if confidence >= 20:
+        return f"POSSIBLE CONFLICT: Products suggest {classification} ({confidence:.1f}%)"
+    return f"General/Mixed: No strong cluster match ({confidence:.1f}%)"
+
+
+def verify_product_keyword_index(products_df: pd.DataFrame) -> bool:
+    """
+    Check PRODUCT_KEYWORD_INDEX against classify_product_item on every distinct
+    item (full score dict and best cluster) and report per-item throughput.
+    """
+    print("\n" + "="*80)
+    print("PRODUCT KEYWORD INDEX CHECK")
     print("="*80)
-    print("PRODUCT-BASED CLUSTER VALIDATION")
-    print("="*80)
 
-    # Load main dataset
+    items = products_df['Item'].dropna().astype(str).unique().tolist()
+
+    start = time.perf_counter()
+    reference = [classify_product_item(item, CLUSTER_PRODUCT_KEYWORDS) for item in items]
+    reference_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed_best = [PRODUCT_KEYWORD_INDEX.best_cluster(item) for item in items]
+    indexed_secs = time.perf_counter() - start
+
+    score_mismatches = sum(PRODUCT_KEYWORD_INDEX.score(item) != scores
+                           for item, scores in zip(items, reference))
+    best_mismatches = 0
+    for scores, best in zip(reference, indexed_best):
+        expected = max(scores, key=scores.get)
+        if (expected if scores[expected] > 0 else None) != best:
+            best_mismatches += 1
+
+    print(f"Distinct items checked: {len(items):,}")
+    print(f"Score mismatches: {score_mismatches}, best-cluster mismatches: {best_mismatches}")
+    print(f"classify_product_item: {len(items) / reference_secs:>10,.0f} items/sec")
+    print(f"ProductKeywordIndex:   {len(items) / indexed_secs:>10,.0f} items/sec")
+
+    return score_mismatches == 0 and best_mismatches == 0
+
+
+def load_validation_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Load the active accounts and the product offerings once."""
     print("\nLoading datasets...")
     df = pd.read_csv('data/customermethodaccount_01-07-2026_RECLUSTERED_V2_WITH_PRODUCT_TYPES.csv')
     active = df[df['Active?'] == True].copy()
 
-    # Load product data
-    products_df = pd.read_csv('customer_product_offerings_with_type.csv')
+    products_df = load_product_offerings('customer_product_offerings_with_type.csv')
 
     print(f"Total active accounts: {len(active)}")
     print(f"Product data available: {products_df['Account'].nunique()} accounts")
+    return active, products_df
 
-    # Filter by cluster if specified
+
+def select_cluster_accounts(active: pd.DataFrame, products_df: pd.DataFrame,
+                            cluster_name: str = None, sample_size: int = None) -> pd.DataFrame:
+    """Active accounts (optionally one cluster) that have product data, sampled if requested."""
     if cluster_name:
         active = active[active['Industry_Cluster_Enhanced_V2'] == cluster_name]
         print(f"\nFiltering to cluster: {cluster_name}")
@@ -264,75 +450,56 @@ def validate_cluster_products(cluster_name: str = None,
         active['Account Name'].isin(products_df['Account'].unique())
     ].copy()
 
-    print(f"Accounts with product data: {len(accounts_with_products)} "
-          f"({len(accounts_with_products)/len(active)*100:.1f}%)")
+    pct_with_products = len(accounts_with_products) / len(active) * 100 if len(active) else 0.0
+    print(f"Accounts with product data: {len(accounts_with_products)} ({pct_with_products:.1f}%)")
 
     # Sample if specified
     if sample_size and len(accounts_with_products) > sample_size:
         accounts_with_products = accounts_with_products.sample(n=sample_size, random_state=42)
         print(f"\nSampling {sample_size} accounts for validation")
 
-    # Validate each account
-    print("\n" + "="*80)
-    print("VALIDATION PROCESS")
-    print("="*80)
-
-    results = []
-    for idx, row in accounts_with_products.iterrows():
-        account = row['Account Name']
-        expected_cluster = row['Industry_Cluster_Enhanced_V2']
-        sample_products = row.get('Sample_Products', '')
-
-        # Get product list for this account
-        account_products = products_df[products_df['Account'] == account]['Item'].tolist()
-
-        if not account_products:
-            continue
-
-        # Classify based on products
-        classification = classify_account_products(account_products)
-
-        # Check if matches expected cluster
-        matches_expected = (classification['Classification'] == expected_cluster)
-        product_confidence = classification['Confidence']
-
-        result = {
-            'Account_Name': account,
-            'Expected_Cluster': expected_cluster,
-            'Product_Classification': classification['Classification'],
-            'Product_Confidence': round(product_confidence, 1),
-            'Items_Analyzed': len(account_products),
-            'Items_Matching_Expected': classification['Item_Match_Count'] if matches_expected else 0,
-            'Items_Matching_Pct': round(classification['Item_Match_Pct'], 1) if matches_expected else 0,
-            'Matches_Expected': matches_expected,
-            'Top_3_Clusters': classification['Top_3_Clusters'],
-            'Sample_Products': sample_products[:200] if pd.notna(sample_products) else '',  # First 200 chars
-            'Notes': ''
-        }
-
-        # Add notes for conflicts
-        if not matches_expected and product_confidence >= 40:
-            result['Notes'] = f"HIGH CONFIDENCE CONFLICT: Products suggest {classification['Classification']} " \
-                              f"({product_confidence:.1f}%) but classified as {expected_cluster}"
-        elif not matches_expected and product_confidence >= 20:
-            result['Notes'] = f"POSSIBLE CONFLICT: Products suggest {classification['Classification']} " \
-                              f"({product_confidence:.1f}%)"
-        elif not matches_expected:
-            result['Notes'] = f"General/Mixed: No strong cluster match ({product_confidence:.1f}%)"
-
-        results.append(result)
-
-        if (idx + 1) % 50 == 0:
-            print(f"Processed {idx + 1} accounts...")
+    return accounts_with_products
 
-    # Create results DataFrame
-    results_df = pd.DataFrame(results)
 
-    # Save results
-    results_df.to_csv(output_file, index=False)
-    print(f"\nSaved validation results to: {output_file}")
+def build_validation_results(accounts_with_products: pd.DataFrame,
+                             account_classifications: pd.DataFrame) -> pd.DataFrame:
+    """
+    One result row per account row, from classify_accounts_products output
+    (which may cover more accounts than are being validated).
+    """
+    classified = accounts_with_products[['Account Name', 'Industry_Cluster_Enhanced_V2']].merge(
+        account_classifications,
+        left_on='Account Name', right_on='Account', how='left'
+    )
 
-    # Summary statistics
+    matches_expected = (classified['Classification'] == classified['Industry_Cluster_Enhanced_V2']).to_numpy()
+    if 'Sample_Products' in accounts_with_products.columns:
+        sample_products = accounts_with_products['Sample_Products'].fillna('').astype(str).str[:200]
+    else:
+        sample_products = pd.Series('', index=accounts_with_products.index)
+
+    return pd.DataFrame({
+        'Account_Name': classified['Account Name'],
+        'Expected_Cluster': classified['Industry_Cluster_Enhanced_V2'],
+        'Product_Classification': classified['Classification'],
+        'Product_Confidence': round_values(classified['Confidence'], 1),
+        'Items_Analyzed': classified['Items_Analyzed'],
+        'Items_Matching_Expected': np.where(matches_expected, classified['Item_Match_Count'], 0),
+        # A list, so a column of only non-matches stays integer 0 as in the per-row loop
+        'Items_Matching_Pct': [pct if match else 0 for match, pct in
+                               zip(matches_expected, round_values(classified['Item_Match_Pct'], 1))],
+        'Matches_Expected': matches_expected,
+        'Top_3_Clusters': classified['Top_3_Clusters'],
+        'Sample_Products': sample_products.to_numpy(),
+        'Notes': [conflict_note(match, classification, float(confidence), expected)
+                  for match, classification, confidence, expected in zip(
+                      matches_expected, classified['Classification'],
+                      classified['Confidence'], classified['Industry_Cluster_Enhanced_V2'])],
+    })
+
+
+def print_validation_summary(results_df: pd.DataFrame):
+    """Accuracy and high-confidence conflicts for one validation run."""
     print("\n" + "="*80)
     print("VALIDATION SUMMARY")
     print("="*80)
@@ -360,10 +527,147 @@ def validate_cluster_products(cluster_name: str = None,
             print(f"    Products suggest: {row['Product_Classification']} ({row['Product_Confidence']:.1f}%)")
             print()
 
+
+def cluster_validation_summary(results_df: pd.DataFrame) -> pd.DataFrame:
+    """Per-cluster match rate and conflict counts from combined validation results."""
+    conflicts = ~results_df['Matches_Expected']
+    summary = results_df.assign(
+        Conflict=conflicts,
+        High_Confidence_Conflict=conflicts & (results_df['Product_Confidence'] >= 40),
+        Possible_Conflict=conflicts & results_df['Product_Confidence'].between(20, 40, inclusive='left'),
+    ).groupby('Expected_Cluster', sort=False).agg(
+        Accounts_Validated=('Account_Name', 'size'),
+        Matches_Expected=('Matches_Expected', 'sum'),
+        Conflicts=('Conflict', 'sum'),
+        High_Confidence_Conflicts=('High_Confidence_Conflict', 'sum'),
+        Possible_Conflicts=('Possible_Conflict', 'sum'),
+        Avg_Product_Confidence=('Product_Confidence', 'mean'),
+        Items_Analyzed=('Items_Analyzed', 'sum'),
+    )
+    summary.insert(2, 'Accuracy_Pct', (summary['Matches_Expected'] / summary['Accounts_Validated'] * 100).round(1))
+    summary['Avg_Product_Confidence'] = summary['Avg_Product_Confidence'].round(1)
+    return summary.reset_index().rename(columns={'Expected_Cluster': 'Cluster'})
+
+
+def validate_cluster_products(cluster_name: str = None,
+                                sample_size: int = None,
+                                output_file: str = 'product_validation_results.csv'):
+    """
+    Validate accounts via product data analysis.
+
+    Args:
+        cluster_name: If specified, only validate this cluster
+        sample_size: If specified, limit to N accounts per cluster
+        output_file: Output CSV filename
+    """
+    print("="*80)
+    print("PRODUCT-BASED CLUSTER VALIDATION")
+    print("="*80)
+
+    active, products_df = load_validation_data()
+    accounts_with_products = select_cluster_accounts(active, products_df, cluster_name, sample_size)
+
+    # Validate each account
+    print("\n" + "="*80)
+    print("VALIDATION PROCESS")
+    print("="*80)
+
+    # Score all accounts' products in one sparse pass, then line up with the account rows
+    account_products = products_df[products_df['Account'].isin(accounts_with_products['Account Name'])]
+    results_df = build_validation_results(accounts_with_products,
+                                          classify_accounts_products(account_products))
+    print(f"Classified {len(results_df)} accounts from {len(account_products):,} product rows")
+
+    # Save results
+    results_df.to_csv(output_file, index=False)
+    print(f"\nSaved validation results to: {output_file}")
+
+    print_validation_summary(results_df)
+
     return results_df
 
 
+def validate_all_clusters(cluster_names: List[str] = None,
+                          sample_size: int = None,
+                          output_file: str = 'product_validation_all_clusters.csv',
+                          summary_file: str = 'product_validation_cluster_summary.csv'):
+    """
+    Validate every cluster (or the given clusters) in one process.
+
+    Accounts and products are loaded once and every account with product data is
+    classified in a single classify_accounts_products pass; each cluster then only
+    selects and samples its accounts, so its rows match a validate_cluster_products
+    run for that cluster. Writes one combined result file and a per-cluster summary.
+
+    Args:
+        cluster_names: Clusters to validate (default: all clusters in the dataset)
+        sample_size: If specified, limit to N accounts per cluster
+        output_file: Combined results CSV
+        summary_file: Per-cluster summary CSV
+    """
+    print("="*80)
+    print("PRODUCT-BASED CLUSTER VALIDATION (ALL CLUSTERS)")
+    print("="*80)
+
+    active, products_df = load_validation_data()
+    if cluster_names is None:
+        cluster_names = active['Industry_Cluster_Enhanced_V2'].dropna().unique().tolist()
+
+    account_products = products_df[products_df['Account'].isin(active['Account Name'])]
+    account_classifications = classify_accounts_products(account_products)
+    print(f"\nClassified {len(account_classifications)} accounts from {len(account_products):,} product rows")
+
+    cluster_results = []
+    for cluster_name in cluster_names:
+        accounts_with_products = select_cluster_accounts(active, products_df, cluster_name, sample_size)
+        if len(accounts_with_products):
+            cluster_results.append(build_validation_results(accounts_with_products, account_classifications))
+
+    results_df = pd.concat(cluster_results, ignore_index=True) if cluster_results else \
+        build_validation_results(active.iloc[:0], account_classifications)
+    results_df.to_csv(output_file, index=False)
+    print(f"\nSaved combined validation results to: {output_file}")
+
+    summary_df = cluster_validation_summary(results_df)
+    summary_df.to_csv(summary_file, index=False)
+    print(f"Saved per-cluster summary to: {summary_file}")
+
+    print("\n" + "="*80)
+    print("PER-CLUSTER SUMMARY")
+    print("="*80)
+    print(summary_df[['Cluster', 'Accounts_Validated', 'Accuracy_Pct', 'Conflicts',
+                      'High_Confidence_Conflicts']].to_string(index=False))
+
+    print_validation_summary(results_df)
+
+    return results_df, summary_df
+
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Product-based cluster validation')
+    parser.add_argument('--verify-index', action='store_true',
+                        help='Check the keyword index against classify_product_item and exit')
+    parser.add_argument('--all-clusters', action='store_true',
+                        help='Validate every cluster in one run (combined file + per-cluster summary)')
+    parser.add_argument('--clusters', nargs='+', metavar='CLUSTER',
+                        help='Validate only these clusters in one run')
+    parser.add_argument('--sample-size', type=int, default=None,
+                        help='Limit to N accounts per cluster')
+    parser.add_argument('--output', default='product_validation_all_clusters.csv',
+                        help='Combined results CSV for --all-clusters/--clusters')
+    parser.add_argument('--summary-output', default='product_validation_cluster_summary.csv',
+                        help='Per-cluster summary CSV for --all-clusters/--clusters')
+    args = parser.parse_args()
+
+    if args.verify_index:
+        verify_product_keyword_index(load_product_offerings('customer_product_offerings_with_type.csv'))
+        raise SystemExit(0)
+
+    if args.all_clusters or args.clusters:
+        validate_all_clusters(cluster_names=args.clusters, sample_size=args.sample_size,
+                              output_file=args.output, summary_file=args.summary_output)
+        raise SystemExit(0)
+
     # Example: Validate Building Materials cluster (for pilot testing)
     print("\nPILOT TEST MODE: Building Materials & Construction")
     print("This will validate the cluster known to have 100% accuracy")
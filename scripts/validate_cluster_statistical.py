@@ -8,16 +8,34 @@ Author: Evidence-Based Analysis
 Date: January 7, 2026
 """
 
+import argparse
+import time
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-def calculate_cluster_profiles(df: pd.DataFrame) -> pd.DataFrame:
+from cluster_profile_cache import cached_profiles
+
+# Result-name prefix -> source column for the three coherence metrics
+METRIC_COLUMNS = {
+    'MRR': 'MRR_Calculated',
+    'Users': 'Users',
+    'Screens': 'Custom_Screens_Total',
+}
+
+DATASET_FILE = 'data/customermethodaccount_01-07-2026_RECLUSTERED_V2_WITH_PRODUCT_TYPES.csv'
+CLUSTER_COLUMN = 'Industry_Cluster_Enhanced_V2'
+
+# Kept in the profile cache for other scripts, but not written to cluster_statistical_profiles.csv
+CACHE_ONLY_COLUMNS = ['MRR_Total']
+
+
+def calculate_cluster_profiles(df: pd.DataFrame, cluster_column: str = CLUSTER_COLUMN) -> pd.DataFrame:
     """
     Calculate statistical profiles for each cluster.
     Returns DataFrame with cluster metrics.
     """
-    profiles = df.groupby('Industry_Cluster_Enhanced_V2').agg({
+    profiles = df.groupby(cluster_column).agg({
         'Account Name': 'count',
         'MRR_Calculated': ['mean', 'median', 'std', 'min', 'max'],
         'Users': ['mean', 'median', 'std', 'min', 'max'],
@@ -50,6 +68,25 @@ def calculate_cluster_profiles(df: pd.DataFrame) -> pd.DataFrame:
     return profiles
 
 
+def load_cluster_profiles(dataset_file: str = DATASET_FILE, cluster_column: str = CLUSTER_COLUMN,
+                          df: pd.DataFrame = None, refresh: bool = False) -> pd.DataFrame:
+    """
+    Cluster profiles for the active accounts in dataset_file, from the profile
+    cache when the dataset and cluster column are unchanged. Pass df when the
+    dataset is already loaded so a cache miss does not read it again. The
+    cached profiles also carry MRR_Total, each cluster's summed MRR
+    (see CACHE_ONLY_COLUMNS).
+    """
+    def compute():
+        data = pd.read_csv(dataset_file) if df is None else df
+        active = prepare_active_accounts(data)
+        profiles = calculate_cluster_profiles(active, cluster_column)
+        profiles['MRR_Total'] = active.groupby(cluster_column)['MRR_Calculated'].sum().round(2)
+        return profiles
+
+    return cached_profiles(dataset_file, cluster_column, compute, refresh=refresh)
+
+
 def calculate_z_scores(value: float, mean: float, std: float) -> float:
     """
     Calculate z-score (standard deviations from mean).
@@ -106,26 +143,298 @@ def detect_outliers(account: pd.Series, cluster_profile: pd.Series,
     }
 
 
-def validate_cluster_statistical(cluster_name: str = None,
-                                   sample_size: int = None,
-                                   outlier_threshold: float = 2.5,
-                                   output_file: str = 'statistical_validation_results.csv'):
+def calculate_outlier_frame(active: pd.DataFrame, cluster_profiles: pd.DataFrame,
+                            threshold: float = 2.5) -> pd.DataFrame:
     """
-    Validate accounts via statistical coherence checks.
+    detect_outliers for every account at once.
 
-    Args:
-        cluster_name: If specified, only validate this cluster
-        sample_size: If specified, limit to N accounts per cluster
-        outlier_threshold: Z-score threshold for outlier detection (default 2.5)
-        output_file: Output CSV filename
+    Cluster means and standard deviations are read from cluster_profiles (as
+    detect_outliers does), so cached profiles are not recomputed; a missing or
+    zero std gives a z-score of 0. Rows without a profile get no scores (NaN).
+    """
+    clusters = active['Industry_Cluster_Enhanced_V2']
+    outliers = pd.DataFrame(index=active.index)
+
+    flags = []
+    for name, column in METRIC_COLUMNS.items():
+        mean = clusters.map(cluster_profiles[f'{name}_Mean'])
+        std = clusters.map(cluster_profiles[f'{name}_StdDev'])
+        valid = std.notna() & (std != 0) & mean.notna()
+        z_score = ((active[column] - mean) / std).where(valid, 0.0).where(mean.notna())
+
+        outliers[f'{name}_ZScore'] = z_score
+        outliers[f'Is_{name}_Outlier'] = z_score.abs() > threshold
+        outliers[f'Cluster_{name}_Mean'] = mean
+        flags.append(outliers[f'Is_{name}_Outlier'])
+
+    # Overall outlier if 2+ metrics are outliers
+    outliers['Is_Overall_Outlier'] = (flags[0].astype(int) + flags[1] + flags[2]) >= 2
+    outliers['Outlier_Score'] = (outliers['MRR_ZScore'].abs() + outliers['Users_ZScore'].abs() +
+                                 outliers['Screens_ZScore'].abs())
+    return outliers
+
+
+def outlier_notes(results_df: pd.DataFrame) -> pd.Series:
+    """'STATISTICAL OUTLIER: ...' notes for overall outliers, '' otherwise."""
+    notes = pd.Series('', index=results_df.index, dtype=object)
+    outliers = results_df[results_df['Is_Overall_Outlier']]
+    if len(outliers) == 0:
+        return notes
+
+    flags = ''
+    for name in METRIC_COLUMNS:
+        text = name + ' (z=' + outliers[f'{name}_ZScore'].map('{:.1f}'.format) + '), '
+        flags = flags + text.where(outliers[f'Is_{name}_Outlier'], '')
+    notes[outliers.index] = 'STATISTICAL OUTLIER: ' + flags.str[:-2]
+    return notes
+
+
+def round_like_python(values: pd.Series, digits: int) -> np.ndarray:
+    """
+    Python round() on plain floats, vectorized. numpy's round (scale, rint,
+    unscale) only disagrees near a decimal half, so only those values take the
+    slow path.
+    """
+    values = values.to_numpy(dtype=float)
+    rounded = np.round(values, digits)
+    scaled = values * 10 ** digits
+    near_half = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6
+    rounded[near_half] = [round(float(v), digits) for v in values[near_half]]
+    return rounded
+
+
+def build_statistical_results(active: pd.DataFrame, outliers: pd.DataFrame) -> pd.DataFrame:
+    """Result rows (same columns as the per-account loop) for accounts with a cluster profile."""
+    scored = outliers['MRR_ZScore'].notna()
+    active = active[scored]
+    outliers = outliers[scored]
+
+    results_df = pd.DataFrame({
+        'Account_Name': active['Account Name'],
+        'Cluster': active['Industry_Cluster_Enhanced_V2'],
+        # Plain-float rounding for MRR, numpy rounding for the z-scores (as before)
+        'MRR': round_like_python(active['MRR_Calculated'], 2),
+        'Users': active['Users'].astype(int),
+        'Custom_Screens': active['Custom_Screens_Total'].astype(int),
+        'Cluster_MRR_Mean': outliers['Cluster_MRR_Mean'].round(2),
+        'Cluster_Users_Mean': outliers['Cluster_Users_Mean'].round(2),
+        'MRR_ZScore': outliers['MRR_ZScore'].round(2),
+        'Users_ZScore': outliers['Users_ZScore'].round(2),
+        'Screens_ZScore': outliers['Screens_ZScore'].round(2),
+        'Is_MRR_Outlier': outliers['Is_MRR_Outlier'],
+        'Is_Users_Outlier': outliers['Is_Users_Outlier'],
+        'Is_Screens_Outlier': outliers['Is_Screens_Outlier'],
+        'Is_Overall_Outlier': outliers['Is_Overall_Outlier'],
+        'Outlier_Score': outliers['Outlier_Score'].round(2),
+        'Statistical_Confidence': np.where(outliers['Is_Overall_Outlier'], 'Low', 'High'),
+    }).reset_index(drop=True)
+    results_df['Notes'] = outlier_notes(results_df)
+    return results_df
+
+
+# Robust detectors. 'zscore' is the mean/std test above; the others resist the
+# heavy-tailed MRR/Users distributions where one large account inflates the std.
+OUTLIER_METHODS = ['zscore', 'modified_z', 'iqr', 'mahalanobis']
+MODIFIED_Z_THRESHOLD = 3.5       # Iglewicz & Hoaglin
+IQR_MULTIPLIER = 1.5             # Tukey fences
+MAHALANOBIS_THRESHOLD = 9.348    # chi-square, 3 dof, 97.5th percentile (squared distance)
+
+
+def _modified_z_scores(values: np.ndarray) -> np.ndarray:
+    """
+    0.6745 * (x - median) / MAD per column. When MAD is 0 (over half the
+    cluster shares one value) fall back to 0.7979 * mean absolute deviation;
+    if that is 0 too the column scores 0.
+    """
+    median = np.median(values, axis=0)
+    deviation = values - median
+    mad = np.median(np.abs(deviation), axis=0)
+    mean_ad = np.mean(np.abs(deviation), axis=0)
+    scale = np.where(mad > 0, mad / 0.6745, mean_ad / 0.7979)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(scale > 0, deviation / scale, 0.0)
+
+
+def _iqr_fences(values: np.ndarray, multiplier: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower and upper Tukey fences per column."""
+    q1, q3 = np.percentile(values, [25, 75], axis=0)
+    iqr = q3 - q1
+    return q1 - multiplier * iqr, q3 + multiplier * iqr
+
+
+def _mahalanobis_squared(values: np.ndarray) -> np.ndarray:
+    """
+    Squared Mahalanobis distance of each row from the cluster mean over all
+    columns. A pseudo-inverse keeps degenerate clusters (e.g. all-zero screens)
+    usable; clusters smaller than columns + 1 get NaN.
+    """
+    if len(values) <= values.shape[1]:
+        return np.full(len(values), np.nan)
+    centered = values - values.mean(axis=0)
+    precision = np.linalg.pinv(np.cov(values, rowvar=False))
+    return np.einsum('ij,jk,ik->i', centered, precision, centered)
+
+
+def calculate_robust_outlier_frame(active: pd.DataFrame, methods: List[str] = None,
+                                   modified_z_threshold: float = MODIFIED_Z_THRESHOLD,
+                                   iqr_multiplier: float = IQR_MULTIPLIER,
+                                   mahalanobis_threshold: float = MAHALANOBIS_THRESHOLD) -> pd.DataFrame:
+    """
+    Median/MAD modified z-scores, IQR fences and Mahalanobis distance for every
+    account, all computed in one pass over the clusters: rows are sorted by
+    cluster once and each cluster's (accounts x metrics) block is scored with
+    NumPy. Univariate methods flag an overall outlier on 2+ metrics like the
+    z-score test; Mahalanobis flags on the joint distance.
+    """
+    methods = [m for m in (methods or OUTLIER_METHODS) if m != 'zscore']
+    names = list(METRIC_COLUMNS)
+    values = active[list(METRIC_COLUMNS.values())].to_numpy(dtype=float)
+    n_rows, n_metrics = values.shape
+
+    modified_z = np.full((n_rows, n_metrics), np.nan)
+    lower = np.full((n_rows, n_metrics), np.nan)
+    upper = np.full((n_rows, n_metrics), np.nan)
+    mahalanobis = np.full(n_rows, np.nan)
+
+    codes, _ = pd.factorize(active['Industry_Cluster_Enhanced_V2'])
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+    for rows in np.split(order, boundaries):
+        if len(rows) == 0 or codes[rows[0]] < 0:
+            continue  # no cluster -> no profile, as in the z-score test
+        block = values[rows]
+        if 'modified_z' in methods:
+            modified_z[rows] = _modified_z_scores(block)
+        if 'iqr' in methods:
+            fence_low, fence_high = _iqr_fences(block, iqr_multiplier)
+            lower[rows] = fence_low
+            upper[rows] = fence_high
+        if 'mahalanobis' in methods:
+            mahalanobis[rows] = _mahalanobis_squared(block)
+
+    robust = pd.DataFrame(index=active.index)
+    if 'modified_z' in methods:
+        flags = np.abs(modified_z) > modified_z_threshold
+        for k, name in enumerate(names):
+            robust[f'{name}_ModZ'] = modified_z[:, k]
+            robust[f'Is_{name}_ModZ_Outlier'] = flags[:, k]
+        robust['Is_Overall_Outlier_ModZ'] = flags.sum(axis=1) >= 2
+    if 'iqr' in methods:
+        flags = (values < lower) | (values > upper)
+        for k, name in enumerate(names):
+            robust[f'{name}_IQR_Upper_Fence'] = upper[:, k]
+            robust[f'Is_{name}_IQR_Outlier'] = flags[:, k]
+        robust['Is_Overall_Outlier_IQR'] = flags.sum(axis=1) >= 2
+    if 'mahalanobis' in methods:
+        robust['Mahalanobis_Distance'] = np.sqrt(mahalanobis)
+        robust['Is_Overall_Outlier_Mahalanobis'] = mahalanobis > mahalanobis_threshold
+    return robust
+
+
+def overall_outlier_columns(results_df: pd.DataFrame) -> Dict[str, str]:
+    """Method -> overall-outlier flag column, for the methods present in results_df."""
+    columns = {'zscore': 'Is_Overall_Outlier', 'modified_z': 'Is_Overall_Outlier_ModZ',
+               'iqr': 'Is_Overall_Outlier_IQR', 'mahalanobis': 'Is_Overall_Outlier_Mahalanobis'}
+    return {method: col for method, col in columns.items() if col in results_df.columns}
+
+
+def compare_outlier_methods(results_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Side-by-side overall-outlier counts per cluster for each method, and the
+    number of accounts each pair of methods both flag.
+    """
+    flag_columns = overall_outlier_columns(results_df)
+    flags = results_df[list(flag_columns.values())].astype(int)
+    flags.columns = list(flag_columns)
+
+    by_cluster = flags.groupby(results_df['Cluster']).sum()
+    by_cluster.insert(0, 'Accounts', results_df.groupby('Cluster').size())
+    by_cluster.loc['All clusters'] = by_cluster.sum()
+
+    overlap = flags.T @ flags
+    return by_cluster, overlap
+
+
+def threshold_grid(start: float = 1.5, stop: float = 4.0, step: float = 0.1) -> np.ndarray:
+    """Inclusive threshold grid, rounded so 2.5 in the grid is the literal 2.5."""
+    return np.round(np.arange(start, stop + step / 2, step), 6)
+
+
+def sweep_outlier_thresholds(active: pd.DataFrame, thresholds: np.ndarray,
+                             cluster_profiles: pd.DataFrame) -> pd.DataFrame:
+    """
+    Outlier counts for every threshold in one pass.
+
+    |z| per metric is computed once. An account is an overall outlier at t when
+    its second-largest |z| exceeds t, so sorting each cluster's |z| columns and
+    that second-largest value lets searchsorted count "> t" for the whole grid.
+    Counts match calculate_outlier_frame run separately at each threshold.
+    """
+    outliers = calculate_outlier_frame(active, cluster_profiles)
+    scored = outliers['MRR_ZScore'].notna().to_numpy()
+    abs_z = outliers.loc[scored, [f'{name}_ZScore' for name in METRIC_COLUMNS]].abs().to_numpy()
+    second_largest = np.sort(abs_z, axis=1)[:, 1]
+    clusters = active.loc[scored, 'Industry_Cluster_Enhanced_V2'].to_numpy()
+
+    codes, cluster_names = pd.factorize(clusters)
+    order = np.argsort(codes, kind='stable')
+    boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+
+    tables = []
+    for rows in np.split(order, boundaries):
+        if len(rows) == 0:
+            continue
+        n = len(rows)
+        table = pd.DataFrame({'Threshold': thresholds,
+                              'Cluster': cluster_names[codes[rows[0]]],
+                              'Accounts': n})
+        for k, name in enumerate(METRIC_COLUMNS):
+            table[f'{name}_Outliers'] = n - np.searchsorted(np.sort(abs_z[rows, k]), thresholds, side='right')
+        table['Overall_Outliers'] = n - np.searchsorted(np.sort(second_largest[rows]), thresholds, side='right')
+        tables.append(table)
+
+    sweep = pd.concat(tables, ignore_index=True).sort_values(['Threshold', 'Cluster'], ignore_index=True)
+    sweep['Overall_Outlier_Pct'] = (sweep['Overall_Outliers'] / sweep['Accounts'] * 100).round(1)
+    return sweep
+
+
+def validate_threshold_sweep(thresholds: np.ndarray = None, cluster_name: str = None,
+                             output_file: str = 'statistical_threshold_sweep.csv') -> pd.DataFrame:
+    """
+    Load once and report outlier counts for a grid of z-score thresholds
+    (default 1.5 to 4.0 in 0.1 steps) as a threshold-by-cluster table.
     """
     print("="*80)
-    print("STATISTICAL VALIDATION")
+    print("STATISTICAL VALIDATION THRESHOLD SWEEP")
     print("="*80)
 
-    # Load data
+    thresholds = threshold_grid() if thresholds is None else np.asarray(thresholds, dtype=float)
+
     print("\nLoading dataset...")
-    df = pd.read_csv('data/customermethodaccount_01-07-2026_RECLUSTERED_V2_WITH_PRODUCT_TYPES.csv')
+    df = pd.read_csv(DATASET_FILE)
+    active = prepare_active_accounts(df)
+    print(f"Total active accounts: {len(active)}")
+
+    sweep = sweep_outlier_thresholds(active, thresholds, load_cluster_profiles(df=df))
+    if cluster_name:
+        sweep = sweep[sweep['Cluster'] == cluster_name].reset_index(drop=True)
+        print(f"Filtering to cluster: {cluster_name}")
+
+    sweep.to_csv(output_file, index=False)
+    print(f"\nSaved threshold sweep ({len(thresholds)} thresholds) to: {output_file}")
+
+    # Threshold x cluster table, printed with clusters as rows to keep it readable
+    overall = sweep.pivot(index='Threshold', columns='Cluster', values='Overall_Outliers')
+    overall['All clusters'] = overall.sum(axis=1)
+    print("\nOverall outliers (2+ metrics) by cluster (rows) and threshold (columns):")
+    print(overall.T.rename(columns='{:g}'.format).to_string())
+
+    return sweep
+
+
+def prepare_active_accounts(df: pd.DataFrame) -> pd.DataFrame:
+    """Active accounts with Custom_Screens_Total and zero-filled metric columns."""
     active = df[df['Active?'] == True].copy()
 
     # Calculate Custom_Screens_Total if not present
@@ -139,14 +448,103 @@ def validate_cluster_statistical(cluster_name: str = None,
     active['MRR_Calculated'] = active['MRR_Calculated'].fillna(0)
     active['Users'] = active['Users'].fillna(0)
     active['Custom_Screens_Total'] = active['Custom_Screens_Total'].fillna(0)
+    return active
+
+
+def synthetic_accounts(n_accounts: int, n_clusters: int = 23, seed: int = 42) -> pd.DataFrame:
+    """Heavy-tailed synthetic account table with the columns the validation reads."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Account Name': [f'account{i}' for i in range(n_accounts)],
+        'Industry_Cluster_Enhanced_V2': [f'Cluster {c}' for c in rng.integers(0, n_clusters, n_accounts)],
+        'Active?': True,
+        'MRR_Calculated': np.round(rng.lognormal(5, 1.2, n_accounts), 2),
+        'Users': rng.zipf(2.0, n_accounts).clip(max=500),
+        'Custom_Screens_Total': rng.poisson(2, n_accounts) * rng.integers(0, 2, n_accounts),
+    })
+
+
+def benchmark_statistical_validation(n_accounts: int = 1_000_000, threshold: float = 2.5,
+                                     check_rows: int = 2000):
+    """
+    Time profiles + vectorized outlier detection on a synthetic dataset and check
+    a slice of rows against the per-row detect_outliers.
+    """
+    print("\n" + "="*80)
+    print(f"STATISTICAL VALIDATION BENCHMARK ({n_accounts:,} synthetic accounts)")
+    print("="*80)
+
+    active = prepare_active_accounts(synthetic_accounts(n_accounts))
+
+    start = time.perf_counter()
+    cluster_profiles = calculate_cluster_profiles(active)
+    results_df = build_statistical_results(active, calculate_outlier_frame(active, cluster_profiles, threshold))
+    elapsed = time.perf_counter() - start
+    print(f"Profiles + outlier flags for {len(results_df):,} accounts: {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    robust = calculate_robust_outlier_frame(active)
+    elapsed = time.perf_counter() - start
+    print(f"Modified z + IQR + Mahalanobis for {len(robust):,} accounts: {elapsed:.2f}s")
+
+    mismatches = 0
+    for position, (_, row) in enumerate(active.head(check_rows).iterrows()):
+        expected = detect_outliers(row, cluster_profiles.loc[row['Industry_Cluster_Enhanced_V2']], threshold)
+        actual = results_df.iloc[position]
+        if (round(expected['Outlier_Score'], 2) != actual['Outlier_Score'] or
+                expected['Is_Overall_Outlier'] != actual['Is_Overall_Outlier'] or
+                any(expected[f'{name}_ZScore'] != actual[f'{name}_ZScore'] for name in METRIC_COLUMNS)):
+            mismatches += 1
+    print(f"Rows differing from detect_outliers (first {check_rows:,}): {mismatches}")
+
+    return mismatches == 0
+
+
+def validate_cluster_statistical(cluster_name: str = None,
+                                   sample_size: int = None,
+                                   outlier_threshold: float = 2.5,
+                                   output_file: str = 'statistical_validation_results.csv',
+                                   methods: List[str] = None,
+                                   refresh_profiles: bool = False):
+    """
+    Validate accounts via statistical coherence checks.
+
+    Args:
+        cluster_name: If specified, only validate this cluster
+        sample_size: If specified, limit to N accounts per cluster
+        outlier_threshold: Z-score threshold for outlier detection (default 2.5)
+        output_file: Output CSV filename
+        methods: Detectors to run from OUTLIER_METHODS (default: z-score only).
+                 Robust detectors add their columns next to the z-score ones and
+                 a side-by-side comparison is printed.
+        refresh_profiles: Recompute cluster profiles even if the cache is current
+    """
+    methods = methods or ['zscore']
+    unknown = set(methods) - set(OUTLIER_METHODS)
+    if unknown:
+        raise ValueError(f"Unknown outlier methods: {sorted(unknown)} (choose from {OUTLIER_METHODS})")
+    print("="*80)
+    print("STATISTICAL VALIDATION")
+    print("="*80)
+
+    # Load data
+    print("\nLoading dataset...")
+    df = pd.read_csv(DATASET_FILE)
+    active = prepare_active_accounts(df)
 
     print(f"Total active accounts: {len(active)}")
 
-    # Calculate cluster profiles
+    # Cluster profiles (reused from the profile cache when the dataset is unchanged)
     print("\nCalculating cluster statistical profiles...")
-    cluster_profiles = calculate_cluster_profiles(active)
+    cluster_profiles = load_cluster_profiles(df=df, refresh=refresh_profiles)
     print(f"Cluster profiles calculated for {len(cluster_profiles)} clusters")
 
+    # Z-scores (and robust scores) for every account against its full cluster, before any filtering
+    outliers = calculate_outlier_frame(active, cluster_profiles, outlier_threshold)
+    robust_methods = [m for m in methods if m != 'zscore']
+    if robust_methods:
+        robust = calculate_robust_outlier_frame(active, robust_methods)
+
     # Filter by cluster if specified
     if cluster_name:
         active = active[active['Industry_Cluster_Enhanced_V2'] == cluster_name]
@@ -164,59 +562,11 @@ def validate_cluster_statistical(cluster_name: str = None,
     print("="*80)
     print(f"Outlier threshold: ±{outlier_threshold} standard deviations")
 
-    results = []
-    for idx, row in active.iterrows():
-        account = row['Account Name']
-        cluster = row['Industry_Cluster_Enhanced_V2']
-
-        # Get cluster profile
-        if cluster not in cluster_profiles.index:
-            continue
-
-        cluster_profile = cluster_profiles.loc[cluster]
-
-        # Detect outliers
-        outlier_analysis = detect_outliers(row, cluster_profile, outlier_threshold)
-
-        result = {
-            'Account_Name': account,
-            'Cluster': cluster,
-            'MRR': round(outlier_analysis['MRR'], 2),
-            'Users': int(outlier_analysis['Users']),
-            'Custom_Screens': int(outlier_analysis['Screens']),
-            'Cluster_MRR_Mean': round(outlier_analysis['Cluster_MRR_Mean'], 2),
-            'Cluster_Users_Mean': round(outlier_analysis['Cluster_Users_Mean'], 2),
-            'MRR_ZScore': outlier_analysis['MRR_ZScore'],
-            'Users_ZScore': outlier_analysis['Users_ZScore'],
-            'Screens_ZScore': outlier_analysis['Screens_ZScore'],
-            'Is_MRR_Outlier': outlier_analysis['Is_MRR_Outlier'],
-            'Is_Users_Outlier': outlier_analysis['Is_Users_Outlier'],
-            'Is_Screens_Outlier': outlier_analysis['Is_Screens_Outlier'],
-            'Is_Overall_Outlier': outlier_analysis['Is_Overall_Outlier'],
-            'Outlier_Score': round(outlier_analysis['Outlier_Score'], 2),
-            'Statistical_Confidence': 'Low' if outlier_analysis['Is_Overall_Outlier'] else 'High',
-            'Notes': ''
-        }
-
-        # Add notes for outliers
-        if outlier_analysis['Is_Overall_Outlier']:
-            outlier_flags = []
-            if outlier_analysis['Is_MRR_Outlier']:
-                outlier_flags.append(f"MRR (z={outlier_analysis['MRR_ZScore']:.1f})")
-            if outlier_analysis['Is_Users_Outlier']:
-                outlier_flags.append(f"Users (z={outlier_analysis['Users_ZScore']:.1f})")
-            if outlier_analysis['Is_Screens_Outlier']:
-                outlier_flags.append(f"Screens (z={outlier_analysis['Screens_ZScore']:.1f})")
-
-            result['Notes'] = f"STATISTICAL OUTLIER: {', '.join(outlier_flags)}"
-
-        results.append(result)
-
-        if (idx + 1) % 100 == 0:
-            print(f"Processed {len(results)} accounts...")
-
-    # Create results DataFrame
-    results_df = pd.DataFrame(results)
+    results_df = build_statistical_results(active, outliers.loc[active.index])
+    if robust_methods:
+        scored = outliers.loc[active.index, 'MRR_ZScore'].notna()
+        robust_rows = robust.loc[active.index][scored.to_numpy()].reset_index(drop=True)
+        results_df = pd.concat([results_df, robust_rows], axis=1)
 
     # Save results
     results_df.to_csv(output_file, index=False)
@@ -262,15 +612,45 @@ def validate_cluster_statistical(cluster_name: str = None,
             print(f"    Users: {row['Users']} (cluster avg: {row['Cluster_Users_Mean']:.1f}, z={row['Users_ZScore']:.1f})")
             print()
 
+    if robust_methods:
+        print("\n" + "="*80)
+        print("OUTLIER METHOD COMPARISON (overall outliers)")
+        print("="*80)
+        by_cluster, overlap = compare_outlier_methods(results_df)
+        print(by_cluster.to_string())
+        print("\nAccounts flagged by both methods:")
+        print(overlap.to_string())
+
     # Save cluster profiles
     cluster_profiles_file = 'cluster_statistical_profiles.csv'
-    cluster_profiles.to_csv(cluster_profiles_file)
+    cluster_profiles.drop(columns=CACHE_ONLY_COLUMNS).to_csv(cluster_profiles_file)
     print(f"\nSaved cluster profiles to: {cluster_profiles_file}")
 
     return results_df, cluster_profiles
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Statistical cluster validation')
+    parser.add_argument('--benchmark', type=int, nargs='?', const=1_000_000, metavar='N',
+                        help='Time outlier detection on N synthetic accounts (default 1,000,000) and exit')
+    parser.add_argument('--methods', nargs='+', choices=OUTLIER_METHODS, default=['zscore'],
+                        help='Outlier detectors to run side by side (default: zscore)')
+    parser.add_argument('--refresh-profiles', action='store_true',
+                        help='Recompute cluster profiles instead of reading the profile cache')
+    parser.add_argument('--sweep', action='store_true',
+                        help='Report outlier counts for a grid of z-score thresholds and exit')
+    parser.add_argument('--sweep-range', nargs=3, type=float, default=[1.5, 4.0, 0.1],
+                        metavar=('START', 'STOP', 'STEP'), help='Threshold grid for --sweep')
+    args = parser.parse_args()
+
+    if args.sweep:
+        validate_threshold_sweep(threshold_grid(*args.sweep_range))
+        raise SystemExit(0)
+
+    if args.benchmark:
+        benchmark_statistical_validation(args.benchmark)
+        raise SystemExit(0)
+
     # Example: Validate Building Materials cluster (for pilot testing)
     print("\nPILOT TEST MODE: Building Materials & Construction")
     print("This will validate the cluster known to have 100% accuracy")
@@ -279,7 +659,9 @@ if __name__ == '__main__':
     results, profiles = validate_cluster_statistical(
         cluster_name='Building Materials & Construction',
         outlier_threshold=2.5,
-        output_file='statistical_validation_pilot_test.csv'
+        output_file='statistical_validation_pilot_test.csv',
+        methods=args.methods,
+        refresh_profiles=args.refresh_profiles
     )
 
     print("\n" + "="*80)
@@ -1,16 +1,45 @@
 #!/usr/bin/env python3
 """
 Website-Based Cluster Validation Script
-Uses WebFetch tool to retrieve website content and validate industry classifications.
+Fetches account websites concurrently (website_fetcher) and scores the page
+text against the cluster keyword lists to validate industry classifications.
+Accounts are mapped to a canonical host first (website_hosts) and each host
+is fetched once, however many accounts share it.
+Pages are cached on disk (website_cache), so rerunning a cluster within the
+cache TTL makes no network requests. A crawl can also be written to an
+offline snapshot (website_snapshot) and re-scored from it later without any
+network access.
+
+Usage:
+    python scripts/validate_cluster_websites.py
+    python scripts/validate_cluster_websites.py --cluster "General Retail" --sample-size 50
+    python scripts/validate_cluster_websites.py --snapshot-out data/snapshots/building.pack
+    python scripts/validate_cluster_websites.py --from-snapshot data/snapshots/building.pack
+    python scripts/validate_cluster_websites.py --self-test
 
 Author: Evidence-Based Analysis
 Date: January 7, 2026
 """
 
+import argparse
+import gzip
+import os
+import random
+import shutil
+import tempfile
+import time
 import pandas as pd
 import re
+from collections import Counter
+from contextlib import ExitStack
 from typing import Dict, List, Tuple
 
+from html_text_stream import HtmlTextExtractor, extract_text
+from website_cache import WEBSITE_CACHE_DIR, WebsiteCache, self_test as cache_self_test
+from website_fetcher import fetch_websites, self_test as fetcher_self_test, serve_canned_pages
+from website_hosts import canonical_hosts, host_fetch_plan, print_fetch_plan, self_test as hosts_self_test
+from website_snapshot import SnapshotWriter, WebsiteSnapshot, self_test as snapshot_self_test
+
 # Import cluster keyword definitions from recluster_analysis.py
 # These are the same keywords used for initial clustering
 CLUSTER_KEYWORDS = {
@@ -131,6 +160,174 @@ def extract_keywords_from_text(text: str, keywords: List[str]) -> Dict[str, int]
     return keyword_counts
 
 
+WORD_SPLIT_PATTERN = re.compile(r'(\W+)')
+WORD_KEYWORD_PATTERN = re.compile(r'\w+(?: \w+)*')
+
+
+class WebsiteKeywordScanner:
+    """
+    Counts every keyword of every cluster in one pass over a page.
+
+    The lowercased page is split once into word tokens and the separators
+    between them. With word boundaries on both sides, a one-word keyword
+    matches exactly the tokens equal to it, so all of those are counted by one
+    Counter over the tokens. A phrase such as 'building materials' matches a
+    run of tokens joined by single spaces and is only checked where its first
+    word occurs, taking non-overlapping matches left to right as re.findall
+    does. Keywords that are not plain words fall back to their own regex.
+    Counts are identical to extract_keywords_from_text for every cluster.
+    """
+
+    def __init__(self, cluster_keywords: Dict[str, List[str]]):
+        self.cluster_keywords = cluster_keywords
+        self.words = set()
+        self.phrases: Dict[str, List[Tuple[str, ...]]] = {}
+        self.patterns: Dict[str, re.Pattern] = {}
+
+        for keywords in cluster_keywords.values():
+            for keyword in keywords:
+                lowered = keyword.lower()
+                if not WORD_KEYWORD_PATTERN.fullmatch(lowered):
+                    self.patterns[lowered] = re.compile(r'\b' + re.escape(lowered) + r'\b')
+                elif ' ' in lowered:
+                    phrase = tuple(lowered.split(' '))
+                    if phrase not in self.phrases.setdefault(phrase[0], []):
+                        self.phrases[phrase[0]].append(phrase)
+                else:
+                    self.words.add(lowered)
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Occurrences of each lowercased keyword found in text."""
+        text_lower = text.lower()
+        parts = WORD_SPLIT_PATTERN.split(text_lower)
+        tokens, separators = parts[0::2], parts[1::2]
+
+        counts = {token: n for token, n in Counter(tokens).items() if token in self.words}
+
+        next_free: Dict[Tuple[str, ...], int] = {}
+        for i, token in enumerate(tokens):
+            candidates = self.phrases.get(token)
+            if candidates is None:
+                continue
+            for phrase in candidates:
+                end = i + len(phrase)
+                if (i >= next_free.get(phrase, 0) and tuple(tokens[i:end]) == phrase and
+                        all(sep == ' ' for sep in separators[i:end - 1])):
+                    key = ' '.join(phrase)
+                    counts[key] = counts.get(key, 0) + 1
+                    next_free[phrase] = end
+
+        for keyword, pattern in self.patterns.items():
+            matches = len(pattern.findall(text_lower))
+            if matches:
+                counts[keyword] = matches
+
+        return counts
+
+    def by_cluster(self, counts: Dict[str, int]) -> Dict[str, Dict[str, int]]:
+        """Per-cluster keyword -> count dicts, as extract_keywords_from_text returns them."""
+        return {cluster: {keyword: counts[keyword.lower()] for keyword in keywords
+                          if counts.get(keyword.lower())}
+                for cluster, keywords in self.cluster_keywords.items()}
+
+    def cluster_counts(self, text: str) -> Dict[str, Dict[str, int]]:
+        return self.by_cluster(self.count(text))
+
+    def stream(self, max_tokens: int = None) -> 'StreamingKeywordCounter':
+        """Counter for text that arrives in pieces (see StreamingKeywordCounter)."""
+        return StreamingKeywordCounter(self, max_tokens)
+
+
+class StreamingKeywordCounter:
+    """
+    WebsiteKeywordScanner counts over text that arrives in pieces.
+
+    Each piece is split the way WebsiteKeywordScanner.count splits a page, but
+    the trailing word (and a trailing separator, which may still grow) is
+    carried into the next piece instead of being counted. Phrase starts are
+    checked once the tokens a phrase could span are final, so only that many
+    tokens are kept between pieces. Counts over all pieces equal
+    scanner.count on their concatenation. feed() returns False once
+    max_tokens words have been seen.
+    """
+
+    def __init__(self, scanner: WebsiteKeywordScanner, max_tokens: int = None):
+        if scanner.patterns:
+            raise ValueError(f"Streaming counts need plain-word keywords, not {sorted(scanner.patterns)}")
+        self.scanner = scanner
+        self.max_tokens = max_tokens
+        self.tokens_seen = 0
+        self.counts = Counter()
+
+        phrases = [phrase for group in scanner.phrases.values() for phrase in group]
+        self._span = max((len(phrase) for phrase in phrases), default=1)
+        # A carried word longer than every keyword word can be clipped to this length
+        self._longest_word = max((len(word) for word in scanner.words | {w for p in phrases for w in p}),
+                                 default=0) + 1
+
+        self._carry = ''
+        self._tokens: List[str] = []      # final tokens from the first unchecked phrase start on
+        self._separators: List[str] = []  # separator following each of _tokens
+        self._offset = 0                  # stream position of _tokens[0]
+        self._next_free: Dict[Tuple[str, ...], int] = {}
+
+    def feed(self, text: str) -> bool:
+        parts = WORD_SPLIT_PATTERN.split(self._carry + text.lower())
+        tokens, separators = parts[0::2], parts[1::2]
+        if tokens[-1]:
+            # Ends inside a word, which may continue in the next piece
+            self._carry = tokens.pop()[:self._longest_word]
+        elif separators:
+            # Ends inside a separator, which may grow (and stop being a single space)
+            tokens.pop()
+            self._carry = tokens.pop()[:self._longest_word] + separators.pop()[:2]
+        else:
+            self._carry = ''
+        self._consume(tokens, separators, final=False)
+        return self.max_tokens is None or self.tokens_seen < self.max_tokens
+
+    def _consume(self, tokens: List[str], separators: List[str], final: bool):
+        self.tokens_seen += len(tokens) - tokens.count('')
+        words = self.scanner.words
+        for token, n in Counter(tokens).items():
+            if token in words:
+                self.counts[token] += n
+
+        self._tokens.extend(tokens)
+        self._separators.extend(separators)
+        stop = len(self._tokens) if final else len(self._tokens) - self._span + 1
+
+        phrases = self.scanner.phrases
+        for i in range(max(stop, 0)):
+            candidates = phrases.get(self._tokens[i])
+            if candidates is None:
+                continue
+            position = self._offset + i
+            for phrase in candidates:
+                end = i + len(phrase)
+                if (position >= self._next_free.get(phrase, 0) and tuple(self._tokens[i:end]) == phrase and
+                        all(sep == ' ' for sep in self._separators[i:end - 1])):
+                    key = ' '.join(phrase)
+                    self.counts[key] += 1
+                    self._next_free[phrase] = position + len(phrase)
+
+        checked = max(stop, 0)
+        del self._tokens[:checked]
+        del self._separators[:checked]
+        self._offset += checked
+
+    def close(self) -> Dict:
+        """Count the carried tail; returns {'keyword_counts': per-cluster counts, 'tokens_seen'}."""
+        parts = WORD_SPLIT_PATTERN.split(self._carry)
+        tokens, separators = parts[0::2], parts[1::2] + ['']
+        self._carry = ''
+        self._consume(tokens, separators, final=True)
+        return {'keyword_counts': self.scanner.by_cluster(self.counts), 'tokens_seen': self.tokens_seen}
+
+
+WEBSITE_KEYWORD_SCANNER = WebsiteKeywordScanner(CLUSTER_KEYWORDS)
+
+
 def calculate_cluster_confidence(keyword_counts: Dict[str, int],
                                   cluster_keywords: List[str]) -> float:
     """
@@ -159,28 +356,113 @@ def calculate_cluster_confidence(keyword_counts: Dict[str, int],
     return min(confidence, 100.0)
 
 
+def score_cluster_keywords(cluster_counts: Dict[str, Dict[str, int]]) -> Dict[str, float]:
+    """Cluster -> confidence from per-cluster keyword counts."""
+    cluster_scores = {}
+
+    for cluster, keywords in CLUSTER_KEYWORDS.items():
+        cluster_scores[cluster] = calculate_cluster_confidence(cluster_counts[cluster], keywords)
+
+    return cluster_scores
+
+
 def classify_website_content(website_content: str) -> Dict[str, float]:
     """
     Classify website content against all cluster definitions.
     Returns dict of cluster -> confidence score.
     """
-    cluster_scores = {}
+    return score_cluster_keywords(WEBSITE_KEYWORD_SCANNER.cluster_counts(website_content))
 
-    for cluster, keywords in CLUSTER_KEYWORDS.items():
-        keyword_counts = extract_keywords_from_text(website_content, keywords)
-        confidence = calculate_cluster_confidence(keyword_counts, keywords)
-        cluster_scores[cluster] = confidence
 
-    return cluster_scores
+def verify_keyword_scanner(texts: List[str]) -> bool:
+    """
+    Check WEBSITE_KEYWORD_SCANNER against extract_keywords_from_text (every
+    cluster's counts and the resulting scores) and report pages/sec for both.
+    """
+    start = time.perf_counter()
+    reference = [{cluster: extract_keywords_from_text(text, keywords)
+                  for cluster, keywords in CLUSTER_KEYWORDS.items()} for text in texts]
+    reference_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [WEBSITE_KEYWORD_SCANNER.cluster_counts(text) for text in texts]
+    scanned_secs = time.perf_counter() - start
+
+    mismatches = sum(ref != got or score_cluster_keywords(ref) != score_cluster_keywords(got)
+                     for ref, got in zip(reference, scanned))
+    print(f"\nKeyword scanner check: {len(texts)} pages, {mismatches} mismatches")
+    print(f"  per-cluster regex scans: {len(texts) / reference_secs:>8,.1f} pages/sec")
+    print(f"  one-pass scanner:        {len(texts) / scanned_secs:>8,.1f} pages/sec")
+    return mismatches == 0
+
+
+def verify_streaming_counts(texts: List[str], seed: int = 42) -> bool:
+    """Check StreamingKeywordCounter on random chunkings against one-shot counts."""
+    rng = random.Random(seed)
+    mismatches = 0
+    for text in texts:
+        counter = WEBSITE_KEYWORD_SCANNER.stream()
+        start = 0
+        while start < len(text):
+            size = rng.choice([1, 2, 3, 7, 64, 1000, 10000])
+            counter.feed(text[start:start + size])
+            start += size
+        mismatches += counter.close()['keyword_counts'] != WEBSITE_KEYWORD_SCANNER.cluster_counts(text)
+    print(f"Streaming counter check: {len(texts)} randomly chunked pages, {mismatches} mismatches")
+    return mismatches == 0
+
+
+def benchmark_snapshot_rescore(pack_path: str, n_sites: int = 1000) -> float:
+    """Write an n_sites synthetic crawl to pack_path and time re-scoring it; returns sites/sec."""
+    texts = synthetic_pages(100, words_per_page=3000)
+    accounts = pd.DataFrame({
+        'Account Name': [f'account{i}' for i in range(n_sites)],
+        'Website': [f'https://site{i}.example.com' for i in range(n_sites)],
+        'Industry_Cluster_Enhanced_V2': 'Building Materials & Construction',
+    })
+    with SnapshotWriter(pack_path) as writer:
+        for i, (account, url) in enumerate(zip(accounts['Account Name'], accounts['Website'])):
+            writer.add(url, {'status': 200, 'final_url': url, 'content': f'{texts[i % len(texts)]} site {i}',
+                             'content_is_text': True, 'truncated': False}, accounts=[account])
+
+    start = time.perf_counter()
+    results_df, _ = score_snapshot(accounts, pack_path)
+    elapsed = time.perf_counter() - start
+    print(f"Snapshot re-score: {len(results_df)} sites in {elapsed:.2f}s ({len(results_df)/elapsed:.0f} sites/sec)")
+    return len(results_df) / elapsed
+
+
+def synthetic_pages(n_pages: int = 200, words_per_page: int = 3000, seed: int = 42) -> List[str]:
+    """
+    Pages mixing cluster keywords (in varying case, split phrases, doubled
+    spaces, punctuation and word-joined forms) with filler words.
+    """
+    rng = random.Random(seed)
+    vocabulary = sorted({kw for keywords in CLUSTER_KEYWORDS.values() for kw in keywords})
+    filler = ['the', 'and', 'our', 'quality', 'since', '1985', 'café', 'über', 'x', 'building',
+              'metal-works', 'sheet', 'it\'s', 'LEDs', 'b2b2c', 'e-commerce', 'office']
+    separators = [' ', ' ', ' ', '  ', ', ', '. ', '\n', '-', '/', '_']
+    pages = []
+    for _ in range(n_pages):
+        words = []
+        for _ in range(words_per_page):
+            word = rng.choice(vocabulary) if rng.random() < 0.15 else rng.choice(filler)
+            if rng.random() < 0.2:
+                word = word.upper() if rng.random() < 0.5 else word.title()
+            if rng.random() < 0.05:
+                word = word.replace(' ', rng.choice(['  ', '\n', '-']))
+            words.append(word + rng.choice(separators))
+        pages.append(''.join(words))
+    return pages
 
 
 def validate_account_website(account_name: str, website_url: str,
-                               expected_cluster: str) -> Dict:
+                               expected_cluster: str, fetch_result: Dict = None) -> Dict:
     """
     Validate a single account's website against expected cluster.
 
-    NOTE: This is a placeholder that would use WebFetch tool in actual implementation.
-    For now, returns a template result.
+    fetch_result is the website_fetcher result for the account's URL; the page
+    text is scored with classify_website_content.
     """
     result = {
         'Account_Name': account_name,
@@ -197,17 +479,167 @@ def validate_account_website(account_name: str, website_url: str,
         'Notes': ''
     }
 
-    # In actual implementation, would use WebFetch here:
-    # Example: content = webfetch(website_url, "Extract business description, products, services")
-    # For now, mark as needs manual implementation
-    result['Notes'] = 'PLACEHOLDER - Requires WebFetch tool integration'
+    if fetch_result is None:
+        result['Notes'] = 'Not fetched'
+        return result
+
+    status = fetch_result['status']
+    if fetch_result['content'] is None or status is None or status >= 400:
+        result['Website_Accessible'] = False
+        result['Notes'] = fetch_result['error'] or f'HTTP {status}'
+        return result
+
+    result['Website_Accessible'] = True
+    if fetch_result['redirects']:
+        result['Notes'] = f"Redirected to {fetch_result['final_url']}"
+
+    # Streamed pages arrive already counted; cached or buffered ones are counted here
+    cluster_counts = fetch_result.get('keyword_counts')
+    if cluster_counts is None:
+        text = fetch_result['content']
+        if not fetch_result.get('content_is_text'):
+            text = extract_text(text)
+        cluster_counts = WEBSITE_KEYWORD_SCANNER.cluster_counts(text)
+    cluster_scores = score_cluster_keywords(cluster_counts)
+    best_cluster = max(cluster_scores, key=cluster_scores.get)
+    best_confidence = cluster_scores[best_cluster]
+    expected_confidence = cluster_scores.get(expected_cluster, 0.0)
+
+    if best_confidence == 0:
+        result['Notes'] = (result['Notes'] + '; ' if result['Notes'] else '') + 'No cluster keywords found'
+        return result
+
+    # A tie with the expected cluster counts as a match
+    if expected_confidence == best_confidence:
+        best_cluster = expected_cluster
+
+    result['Website_Classification'] = best_cluster
+    result['Website_Confidence'] = round(best_confidence, 1)
+    result['Expected_Confidence'] = round(expected_confidence, 1)
+    result['Matches_Expected'] = best_cluster == expected_cluster
+    if not result['Matches_Expected']:
+        result['Conflict_Cluster'] = best_cluster
+        result['Conflict_Confidence'] = round(best_confidence, 1)
+
+    keyword_counts = cluster_counts[best_cluster]
+    result['Keywords_Found'] = ', '.join(f'{kw} ({n})' for kw, n in
+                                         sorted(keyword_counts.items(), key=lambda kv: -kv[1]))
 
     return result
 
 
+def page_text_consumer(max_html_bytes: int = 1_000_000, max_tokens: int = 20000):
+    """
+    Factory for streaming page consumers: HTML is parsed as it arrives and its
+    visible text counted against every cluster's keywords, stopping at the
+    HTML byte or word budget. The budget is exposed as make_consumer.budget
+    so the website cache only reuses text extracted under the same budget.
+    """
+    def make_consumer():
+        return HtmlTextExtractor(WEBSITE_KEYWORD_SCANNER.stream(max_tokens), max_bytes=max_html_bytes)
+    make_consumer.budget = {'max_html_bytes': max_html_bytes, 'max_tokens': max_tokens}
+    return make_consumer
+
+
+def validate_websites(accounts: pd.DataFrame, fetch_options: Dict = None,
+                      cache: WebsiteCache = None, page_budget: Dict = None,
+                      snapshot_out: str = None) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Fetch every account's website concurrently (through cache when given),
+    streaming each page into the keyword counter, and score it. Each
+    canonical host (website_hosts) is fetched once and its result scored for
+    every account that shares it; accounts without a usable host are 'Not
+    fetched'. page_budget overrides page_text_consumer's max_html_bytes /
+    max_tokens. snapshot_out writes the crawl (page text and fetch fields)
+    to that .pack file so it can be re-scored offline with score_snapshot.
+    Returns (results DataFrame in account order, fetch/cache/dedup stats).
+    """
+    hosts = canonical_hosts(accounts)
+    plan, stats = host_fetch_plan(hosts)
+    fetch_results, fetch_stats = fetch_websites(plan['Fetch_URL'], cache=cache,
+                                                consumer_factory=page_text_consumer(**(page_budget or {})),
+                                                **(fetch_options or {}))
+    stats.update(fetch_stats)
+    by_host = dict(zip(plan['Canonical_Host'], fetch_results))
+
+    if snapshot_out:
+        host_accounts = accounts['Account Name'].groupby(hosts['Canonical_Host']).agg(list)
+        with SnapshotWriter(snapshot_out) as writer:
+            for host, url in zip(plan['Canonical_Host'], plan['Fetch_URL']):
+                writer.add(url, by_host[host], accounts=host_accounts[host])
+
+    results = []
+    for (_, row), host in zip(accounts.iterrows(), hosts['Canonical_Host']):
+        results.append(validate_account_website(
+            row['Account Name'], row['Website'], row['Industry_Cluster_Enhanced_V2'], by_host.get(host)))
+
+    results_df = pd.DataFrame(results)
+    results_df.insert(2, 'Website_Host', hosts['Canonical_Host'].to_numpy())
+    return results_df, stats
+
+
+def score_snapshot(accounts: pd.DataFrame, snapshot_path: str) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Score accounts from an offline snapshot instead of fetching. Each account
+    is looked up by name, then by its canonical host's root URL; accounts the
+    crawl did not cover are reported as 'Not fetched'.
+    Returns (results DataFrame in account order, snapshot stats).
+    """
+    hosts = canonical_hosts(accounts)
+    results = []
+    missing = 0
+    with WebsiteSnapshot(snapshot_path) as snapshot:
+        for account, url, cluster, fetch_url in zip(accounts['Account Name'], accounts['Website'],
+                                                    accounts['Industry_Cluster_Enhanced_V2'], hosts['Fetch_URL']):
+            stored = snapshot.result_for_account(account, None if pd.isna(fetch_url) else fetch_url)
+            missing += stored is None
+            results.append(validate_account_website(account, url, cluster, stored))
+        stats = snapshot.stats()
+    stats['missing'] = missing
+
+    results_df = pd.DataFrame(results)
+    results_df.insert(2, 'Website_Host', hosts['Canonical_Host'].to_numpy())
+    return results_df, stats
+
+
+def print_website_summary(results_df: pd.DataFrame):
+    """Accessibility, match rate and the most frequent conflict clusters."""
+    total = len(results_df)
+    if total == 0:
+        print("\nNo accounts validated")
+        return
+
+    accessible = (results_df['Website_Accessible'] == True).sum()
+    classified = results_df['Website_Classification'].notna().sum()
+    matches = (results_df['Matches_Expected'] == True).sum()
+    conflicts = (results_df['Matches_Expected'] == False).sum()
+
+    print(f"\nWebsites accessible: {accessible} / {total} ({accessible/total*100:.1f}%)")
+    print(f"Classified from page text: {classified}")
+    if classified:
+        print(f"  - Matches expected cluster: {matches} ({matches/classified*100:.1f}%)")
+        print(f"  - Conflicts: {conflicts} ({conflicts/classified*100:.1f}%)")
+
+    if conflicts:
+        print("\nTop conflict clusters:")
+        for cluster, count in results_df['Conflict_Cluster'].value_counts().head(5).items():
+            print(f"  - {cluster}: {count}")
+
+    errors = results_df.loc[results_df['Website_Accessible'] == False, 'Notes']
+    if len(errors):
+        print("\nMost common fetch errors:")
+        for error, count in errors.str.split(':').str[0].value_counts().head(5).items():
+            print(f"  - {error}: {count}")
+
+
 def validate_cluster_websites(cluster_name: str = None,
                                 sample_size: int = None,
-                                output_file: str = 'website_validation_results.csv'):
+                                output_file: str = 'website_validation_results.csv',
+                                fetch_options: Dict = None,
+                                cache_dir: str = WEBSITE_CACHE_DIR,
+                                cache_ttl_days: float = 30.0,
+                                snapshot_out: str = None,
+                                from_snapshot: str = None):
     """
     Validate accounts via website content analysis.
 
@@ -215,6 +647,12 @@ def validate_cluster_websites(cluster_name: str = None,
         cluster_name: If specified, only validate this cluster
         sample_size: If specified, limit to N accounts per cluster
         output_file: Output CSV filename
+        fetch_options: WebsiteFetcher settings (concurrency, per_host, timeout,
+                       retries, backoff, max_redirects, max_bytes)
+        cache_dir: Website page cache directory (None to always fetch)
+        cache_ttl_days: Age after which cached pages are revalidated
+        snapshot_out: Also write the crawl to this snapshot .pack file
+        from_snapshot: Score from this snapshot .pack file instead of fetching
     """
     print("="*80)
     print("WEBSITE-BASED CLUSTER VALIDATION")
@@ -225,15 +663,14 @@ def validate_cluster_websites(cluster_name: str = None,
     df = pd.read_csv('data/customermethodaccount_01-07-2026_RECLUSTERED_V2_WITH_PRODUCT_TYPES.csv')
     active = df[df['Active?'] == True].copy()
 
-    # Filter to accounts with websites
-    active_with_websites = active[
-        active['Website'].notna() &
-        (active['Website'] != '') &
-        (active['Website'] != 'nan')
-    ].copy()
+    # Filter to accounts whose Website or Domains give a usable host
+    hosts = canonical_hosts(active)
+    active_with_websites = active[hosts['Canonical_Host'].notna()].copy()
 
     print(f"Total active accounts: {len(active)}")
-    print(f"With website URLs: {len(active_with_websites)} ({len(active_with_websites)/len(active)*100:.1f}%)")
+    print(f"With a usable website host: {len(active_with_websites)} ({len(active_with_websites)/len(active)*100:.1f}%)")
+    print(f"  (Website: {(hosts['Host_Source'] == 'Website').sum()}, Domains: {(hosts['Host_Source'] == 'Domains').sum()}, "
+          f"{hosts['Free_Mail_Host'].sum()} skipped as e-mail provider hosts)")
 
     # Filter by cluster if specified
     if cluster_name:
@@ -248,55 +685,174 @@ def validate_cluster_websites(cluster_name: str = None,
         active_with_websites = active_with_websites.sample(n=sample_size, random_state=42)
         print(f"\nSampling {sample_size} accounts for validation")
 
-    # Validate each account
+    # Fetch and score every website
     print("\n" + "="*80)
     print("VALIDATION PROCESS")
     print("="*80)
-    print("\nNOTE: This is a template script. WebFetch integration required for actual validation.")
-    print("The script structure is ready - you'll need to integrate WebFetch tool calls.")
-    print("="*80)
-
-    results = []
-    for idx, row in active_with_websites.iterrows():
-        account = row['Account Name']
-        website = row['Website']
-        cluster = row['Industry_Cluster_Enhanced_V2']
-
-        # Validate (placeholder for now)
-        result = validate_account_website(account, website, cluster)
-        results.append(result)
 
-    # Create results DataFrame
-    results_df = pd.DataFrame(results)
+    start = time.perf_counter()
+    if from_snapshot:
+        results_df, stats = score_snapshot(active_with_websites, from_snapshot)
+        elapsed = time.perf_counter() - start
+        print(f"Scored {len(results_df)} accounts from snapshot {from_snapshot} (crawled {stats['created']}) "
+              f"in {elapsed:.1f}s; {stats['missing']} not in the snapshot")
+    else:
+        cache = WebsiteCache(cache_dir, ttl_days=cache_ttl_days) if cache_dir else None
+        results_df, stats = validate_websites(active_with_websites, fetch_options, cache,
+                                              snapshot_out=snapshot_out)
+        elapsed = time.perf_counter() - start
+        print_fetch_plan(hosts.loc[active_with_websites.index], stats)
+        print(f"Fetched {stats['unique_hosts']} hosts for {len(results_df)} accounts in {elapsed:.1f}s "
+              f"({stats['requests_sent']} requests, {stats['connections_opened']} connections)")
+        if cache is not None:
+            print(f"Page cache: {stats['cache_hits']} hits, {stats['cache_revalidated']} revalidated, "
+                  f"{stats['cache_misses']} misses, {stats['cache_evictions']} evicted "
+                  f"({stats['cache_entries']} entries, {stats['cache_bytes']/1e6:.1f} MB)")
+        if snapshot_out:
+            print(f"Wrote crawl snapshot: {snapshot_out}")
 
     # Save results
     results_df.to_csv(output_file, index=False)
     print(f"\nSaved validation results to: {output_file}")
     print(f"Total accounts processed: {len(results_df)}")
 
-    # Summary statistics (when WebFetch is integrated)
+    # Summary statistics
     print("\n" + "="*80)
-    print("NEXT STEPS:")
+    print("VALIDATION SUMMARY")
     print("="*80)
-    print("1. Integrate WebFetch tool to retrieve website content")
-    print("2. Run validate_account_website() with actual content")
-    print("3. Calculate cluster scores using classify_website_content()")
-    print("4. Generate confidence scores and conflict detection")
-    print("5. Re-run this script with real data")
+    print_website_summary(results_df)
 
     return results_df
 
 
+def website_self_test() -> bool:
+    """
+    Fetcher checks plus an end-to-end run of validate_websites against canned
+    pages served locally (no network access needed).
+    """
+    fetcher_ok = fetcher_self_test() and cache_self_test() and snapshot_self_test() and hosts_self_test()
+    scanner_ok = verify_keyword_scanner(synthetic_pages(50)) and verify_streaming_counts(synthetic_pages(50))
+
+    page = '<html><head><style>body {{ color: red }}</style></head><body>{}</body></html>'
+    # One canned server per site: accounts are fetched by host, so each site needs its own
+    sites = {
+        'Lumber Co': {'body': page.format('Lumber, concrete, roofing and siding for every contractor.')},
+        'Bakery Co': {'body': page.format('Our bakery supplies grocery stores with organic food.')},
+        'Moved Co': {'status': 301},
+        'Blank Co': {'body': page.format('Welcome to our homepage.')},
+        'Gone Co': {'status': 404},
+        'Menu Co': {'body': page.format('<nav>Bakery Coffee Wine Food</nav><p>Lumber and concrete.</p>'
+                                        '<footer>Grocery</footer>')},
+        # 6 MB page: inline script, then text; the word budget stops the read early
+        'Huge Co': {'headers': {'Content-Encoding': 'gzip'},
+                    'body': gzip.compress(page.format('<script>' + 'x=1;' * 1_000_000 + '</script>' +
+                                                      'Lumber yard. ' * 200_000).encode())},
+    }
+    # Chunked gzip page (as most real sites send) far beyond the word budget, sent slowly
+    chunked_body = gzip.compress(' '.join(synthetic_pages(60)).encode())
+    chunked_page = {'headers': {'Content-Encoding': 'gzip'}, 'body': chunked_body,
+                    'chunk_size': 4096, 'chunk_delay': 0.001}
+    with ExitStack() as stack:
+        servers = {name: stack.enter_context(serve_canned_pages({'/': spec})) for name, spec in sites.items()}
+        chunked_server = stack.enter_context(serve_canned_pages({'/': chunked_page}))
+        chunked, _ = fetch_websites([chunked_server.base_url], consumer_factory=page_text_consumer(max_tokens=5000),
+                                    retries=0)
+        sites['Moved Co']['headers'] = {'Location': servers['Lumber Co'].base_url + '/'}
+        site_urls = [server.base_url for server in servers.values()]
+        accounts = pd.DataFrame({
+            'Account Name': list(sites) + ['Lumber Branch', 'Mail Co'],
+            # Same host as Lumber Co spelled differently; a contact e-mail domain is never fetched
+            'Website': site_urls + [servers['Lumber Co'].base_url.upper() + '/about', 'gmail.com'],
+            'Industry_Cluster_Enhanced_V2': 'Building Materials & Construction',
+        })
+        fetched, _ = fetch_websites(site_urls, consumer_factory=page_text_consumer(max_tokens=5000),
+                                    backoff=0.01, max_bytes=50_000_000)
+        results_df, plan_stats = validate_websites(accounts, {'backoff': 0.01, 'max_bytes': 50_000_000},
+                                                   page_budget={'max_tokens': 5000})
+
+        cache_dir = tempfile.mkdtemp(prefix='website_cache_')
+        try:
+            validate_websites(accounts, {'backoff': 0.01}, WebsiteCache(cache_dir))
+            requests_before = sum(sum(server.hits.values()) for server in servers.values())
+            cold_df, _ = validate_websites(accounts, {'backoff': 0.01}, WebsiteCache(cache_dir, ttl_days=0),
+                                           snapshot_out=os.path.join(cache_dir, 'crawl.pack'))
+            warm_df, warm_stats = validate_websites(accounts, {'backoff': 0.01}, WebsiteCache(cache_dir))
+            requests_after = sum(sum(server.hits.values()) for server in servers.values())
+        except BaseException:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            raise
+
+    # Servers are down from here on: everything below is scored offline
+    try:
+        offline_df, offline_stats = score_snapshot(accounts, os.path.join(cache_dir, 'crawl.pack'))
+        rescore_rate = benchmark_snapshot_rescore(os.path.join(cache_dir, 'corpus.pack'))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    by_account = results_df.set_index('Account_Name')
+    checks = [
+        ('matching page', by_account.loc['Lumber Co', 'Matches_Expected'] == True),
+        ('conflicting page', by_account.loc['Bakery Co', 'Conflict_Cluster'] == 'Food & Beverage Dist/Mfg'),
+        ('redirected page scored', by_account.loc['Moved Co', 'Matches_Expected'] == True),
+        ('no keywords', pd.isna(by_account.loc['Blank Co', 'Website_Classification'])),
+        ('inaccessible site', by_account.loc['Gone Co', 'Website_Accessible'] == False),
+        ('nav and footer text dropped', by_account.loc['Menu Co', 'Matches_Expected'] == True),
+        ('huge page stopped at word budget', fetched[6]['truncated'] and fetched[6]['tokens_seen'] < 5100
+         and len(fetched[6]['content']) < 100_000),
+        ('word budget ends a chunked download', chunked[0]['truncated'] and chunked[0]['error'] is None
+         and chunked_server.bytes_sent['/'] < len(chunked_body) / 4),
+        ('shared host fetched once for both accounts', plan_stats['unique_hosts'] == 7
+         and plan_stats['fetches_saved'] == 1 and by_account.loc['Lumber Branch', 'Matches_Expected'] == True),
+        ('e-mail provider host not fetched', pd.isna(by_account.loc['Mail Co', 'Website_Host'])
+         and by_account.loc['Mail Co', 'Notes'] == 'Not fetched'),
+        ('warm cache scores like a fresh fetch', warm_stats['requests_sent'] == 0
+         and warm_df.equals(cold_df) and requests_after > requests_before),
+        ('snapshot re-scores offline like the crawl', offline_df.equals(cold_df)
+         and offline_stats['missing'] == 1),
+        ('1,000-site snapshot re-scores in seconds', rescore_rate > 100),
+    ]
+    print("\nEnd-to-end scoring:")
+    for name, passed in checks:
+        print(f"  {'PASS' if passed else 'FAIL'}  {name}")
+    return fetcher_ok and scanner_ok and all(passed for _, passed in checks)
+
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Website-based cluster validation')
+    parser.add_argument('--cluster', default='Building Materials & Construction',
+                        help='Cluster to validate (default: Building Materials & Construction)')
+    parser.add_argument('--sample-size', type=int, help='Validate at most N accounts')
+    parser.add_argument('--output', default='website_validation_pilot_test.csv', help='Output CSV')
+    parser.add_argument('--concurrency', type=int, default=20, help='Global request limit')
+    parser.add_argument('--per-host', type=int, default=2, help='Concurrent requests per host')
+    parser.add_argument('--timeout', type=float, default=15.0,
+                        help='Seconds per request, counted once it has a connection slot')
+    parser.add_argument('--retries', type=int, default=2, help='Retries for transient failures')
+    parser.add_argument('--cache-dir', default=WEBSITE_CACHE_DIR, help='Website page cache directory')
+    parser.add_argument('--cache-ttl-days', type=float, default=30.0,
+                        help='Revalidate cached pages older than this (default 30)')
+    parser.add_argument('--no-cache', action='store_true', help='Fetch every page from the network')
+    parser.add_argument('--snapshot-out', help='Also write the crawl to this snapshot .pack file')
+    parser.add_argument('--from-snapshot', help='Score from this snapshot .pack file (no network access)')
+    parser.add_argument('--self-test', action='store_true',
+                        help='Run fetcher and scoring checks against local canned pages and exit')
+    args = parser.parse_args()
+
+    if args.self_test:
+        raise SystemExit(0 if website_self_test() else 1)
+
     # Example: Validate Building Materials cluster (for pilot testing)
-    print("\nPILOT TEST MODE: Building Materials & Construction")
-    print("This will validate the cluster known to have 100% accuracy")
+    print(f"\nPILOT TEST MODE: {args.cluster}")
     print("-"*80)
 
     results = validate_cluster_websites(
-        cluster_name='Building Materials & Construction',
-        output_file='website_validation_pilot_test.csv'
+        cluster_name=args.cluster,
+        sample_size=args.sample_size,
+        output_file=args.output,
+        fetch_options={'concurrency': args.concurrency, 'per_host': args.per_host,
+                       'timeout': args.timeout, 'retries': args.retries},
+        cache_dir=None if args.no_cache else args.cache_dir,
+        cache_ttl_days=args.cache_ttl_days,
+        snapshot_out=args.snapshot_out,
+        from_snapshot=args.from_snapshot
     )
-
-    print("\nPilot test template created!")
-    print("Integrate WebFetch tool and re-run for actual validation.")
@@ -16,9 +16,11 @@ import numpy as np
 from collections import Counter
 import re
 
+from product_offerings_store import load_product_offerings
+
 # Load datasets
 print("Loading datasets...")
-product_offerings = pd.read_csv('customer_product_offerings.csv')
+product_offerings = load_product_offerings('customer_product_offerings.csv')
 accounts_v2 = pd.read_csv('data/customermethodaccount_01-07-2026_RECLUSTERED_V2.csv')
 
 print(f"Product offerings: {len(product_offerings):,} records from {product_offerings['Account'].nunique():,} accounts")
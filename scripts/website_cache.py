@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache for fetched website pages.
+
+Entries are keyed by normalized URL (lowercase scheme and host, no default
+port or fragment, '/' for an empty path) and kept in index.json. The page
+text is stored once per distinct content under objects/<sha256>.gz, so
+accounts whose URLs serve identical pages share one object.
+
+An entry younger than the TTL is served with no network request. An older
+entry carrying an ETag or Last-Modified is revalidated with a conditional GET,
+and a 304 reply refreshes it without downloading the page again. Failed
+fetches (network errors, 5xx) are remembered for a shorter error TTL so a
+rerun does not hammer dead sites; timeouts are not cached, since they say
+more about load on this side than about the site. Each entry records the page
+budget it was fetched under (the fetcher's max_bytes and the consumer's
+budget), and an entry with a different budget is a miss. When the objects
+exceed the size budget, the least recently used entries are evicted.
+
+Usage:
+    python scripts/website_cache.py --stats
+    python scripts/website_cache.py --self-test
+
+Author: Evidence-Based Analysis
+Date: January 7, 2026
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from website_fetcher import WebsiteFetcher, fetch_websites, normalize_website_url, serve_canned_pages
+
+WEBSITE_CACHE_DIR = 'data/cache/websites'
+CACHE_INDEX = 'index.json'
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Result fields kept in the index; the page text lives in the object store
+ENTRY_FIELDS = ['final_url', 'status', 'content_type', 'etag', 'last_modified', 'redirects', 'error',
+                'content_is_text', 'truncated']
+
+
+def cache_key(url: str) -> str:
+    """Normalized URL used as the cache key."""
+    url = normalize_website_url(url)
+    parts = urlsplit(url)
+    try:
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower().rstrip('.')
+    netloc = host if port in (None, DEFAULT_PORTS.get(scheme)) else f'{host}:{port}'
+    return urlunsplit((scheme, netloc, parts.path or '/', parts.query, ''))
+
+
+class WebsiteCache:
+    """
+    URL-keyed index over a content-addressed object store, with TTL expiry,
+    conditional revalidation, size-bounded LRU eviction and hit/miss counters.
+    """
+
+    def __init__(self, cache_dir: str = WEBSITE_CACHE_DIR, ttl_days: float = 30.0,
+                 error_ttl_hours: float = 24.0, max_mb: float = 500.0):
+        self.cache_dir = cache_dir
+        self.ttl = ttl_days * 86400
+        self.error_ttl = error_ttl_hours * 3600
+        self.max_bytes = int(max_mb * 1e6)
+
+        try:
+            with open(os.path.join(cache_dir, CACHE_INDEX)) as handle:
+                self.entries: Dict[str, Dict] = json.load(handle)
+        except (OSError, ValueError):
+            self.entries = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, 'objects', digest[:2], f'{digest}.gz')
+
+    @staticmethod
+    def _failed(entry: Dict) -> bool:
+        return entry['status'] is None or entry['status'] >= 500
+
+    def _is_fresh(self, entry: Dict, now: float) -> bool:
+        return now - entry['fetched_at'] < (self.error_ttl if self._failed(entry) else self.ttl)
+
+    def _read_object(self, digest: str) -> Optional[str]:
+        try:
+            with gzip.open(self._object_path(digest), 'rt', encoding='utf-8') as handle:
+                return handle.read()
+        except (OSError, EOFError):
+            return None
+
+    def _write_object(self, content: str) -> Tuple[str, int]:
+        """Store content once under its SHA-256; returns (digest, bytes on disk)."""
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + '.tmp', 'wb') as handle:
+                handle.write(gzip.compress(data))
+            os.replace(path + '.tmp', path)
+        return digest, os.path.getsize(path)
+
+    def _cached_result(self, url: str, entry: Dict) -> Optional[Dict]:
+        """Rebuild a fetch result from an entry; None if its object is gone."""
+        content = None
+        if entry.get('sha256'):
+            content = self._read_object(entry['sha256'])
+            if content is None:
+                return None
+        result = {field: entry.get(field) for field in ENTRY_FIELDS}
+        result.update(url=url, content=content, attempts=0, timed_out=False, elapsed=0.0, from_cache=True)
+        return result
+
+    def _conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        if not entry or not entry.get('sha256') or not os.path.exists(self._object_path(entry['sha256'])):
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    @staticmethod
+    def _budget(fetcher: WebsiteFetcher, consumer_factory=None) -> Dict:
+        """Limits that shape the stored content; a consumer factory declares its own as .budget."""
+        return {'max_bytes': fetcher.max_bytes, 'consumer': getattr(consumer_factory, 'budget', None)}
+
+    def _store(self, key: str, result: Dict, budget: Dict, now: float):
+        entry = {field: result.get(field) for field in ENTRY_FIELDS}
+        entry.update(budget=budget, fetched_at=now, last_used=now, sha256=None, size=0)
+        if result.get('content') is not None and not self._failed(entry):
+            entry['sha256'], entry['size'] = self._write_object(result['content'])
+        self.entries[key] = entry
+
+    async def fetch(self, fetcher: WebsiteFetcher, url: str, consumer_factory=None) -> Dict:
+        """
+        Fetch through the cache: fresh hit, conditional revalidation, or full
+        fetch. With a streaming consumer the cached content is whatever text
+        the consumer returned (e.g. the extracted visible text). Entries stored
+        under another page budget are refetched; timeouts are not stored.
+        """
+        key = cache_key(url)
+        now = time.time()
+        budget = self._budget(fetcher, consumer_factory)
+        entry = self.entries.get(key)
+        if entry and entry.get('budget') != budget:
+            entry = None
+
+        if entry and self._is_fresh(entry, now):
+            cached = self._cached_result(url, entry)
+            if cached is not None:
+                self.hits += 1
+                entry['last_used'] = now
+                return cached
+
+        result = await fetcher.fetch(url, headers=self._conditional_headers(entry),
+                                     consumer_factory=consumer_factory)
+        if result['status'] == 304 and entry:
+            cached = self._cached_result(url, entry)
+            if cached is not None:
+                self.revalidated += 1
+                entry.update(fetched_at=now, last_used=now)
+                cached.update(attempts=result['attempts'], elapsed=result['elapsed'])
+                return cached
+
+        self.misses += 1
+        if not result.get('timed_out'):
+            self._store(key, result, budget, now)
+        return result
+
+    def _evict(self):
+        """Drop least recently used entries until the object store fits max_bytes."""
+        refs, sizes = {}, {}
+        for entry in self.entries.values():
+            if entry.get('sha256'):
+                refs[entry['sha256']] = refs.get(entry['sha256'], 0) + 1
+                sizes[entry['sha256']] = entry['size']
+        total = sum(sizes.values())
+
+        for key in sorted(self.entries, key=lambda k: self.entries[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            digest = self.entries.pop(key).get('sha256')
+            self.evictions += 1
+            if digest:
+                refs[digest] -= 1
+                if refs[digest] == 0:
+                    total -= sizes[digest]
+                    try:
+                        os.remove(self._object_path(digest))
+                    except OSError:
+                        pass
+
+    def save(self):
+        """Apply the size bound and write the index."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._evict()
+        path = os.path.join(self.cache_dir, CACHE_INDEX)
+        with open(path + '.tmp', 'w') as handle:
+            json.dump(self.entries, handle)
+        os.replace(path + '.tmp', path)
+
+    def stats(self) -> Dict[str, int]:
+        objects = {e['sha256']: e['size'] for e in self.entries.values() if e.get('sha256')}
+        return {'cache_hits': self.hits, 'cache_misses': self.misses,
+                'cache_revalidated': self.revalidated, 'cache_evictions': self.evictions,
+                'cache_entries': len(self.entries), 'cache_objects': len(objects),
+                'cache_bytes': sum(objects.values())}
+
+
+def self_test() -> bool:
+    """Cold, warm, revalidating and size-bounded runs against canned pages."""
+    import shutil
+    import tempfile
+
+    print("="*80)
+    print("WEBSITE CACHE SELF-TEST (local canned pages)")
+    print("="*80)
+
+    page = '<html><body>Lumber and concrete supply.</body></html>'
+    pages = {f'/site{i}': {'headers': {'ETag': f'"v{i}"'}, 'body': page + str(i)} for i in range(20)}
+    pages['/mirror'] = {'body': page + '0'}
+    pages['/down'] = {'status': 503}
+    slow_page = {'delay': 0.3, 'body': page}
+
+    def pages_only(results):
+        return [(r['status'], r['content']) for r in results if r['status'] < 500]
+
+    cache_dir = tempfile.mkdtemp(prefix='website_cache_')
+    checks = []
+    try:
+        with serve_canned_pages({**pages, '/slow': slow_page}) as server:
+            urls = [server.base_url + path for path in pages]
+            options = {'retries': 0}
+
+            cold, stats = fetch_websites(urls, cache=WebsiteCache(cache_dir), **options)
+            cold_requests = sum(server.hits.values())
+            checks.append(('cold run fetches every URL', stats['cache_misses'] == len(urls)
+                           and cold_requests == len(urls)))
+            checks.append(('identical pages share one object', stats['cache_objects'] == 20))
+
+            warm, stats = fetch_websites(urls, cache=WebsiteCache(cache_dir), **options)
+            checks.append(('warm run makes zero requests', sum(server.hits.values()) == cold_requests
+                           and stats['cache_hits'] == len(urls) and stats['requests_sent'] == 0))
+            checks.append(('warm results match cold', pages_only(warm) == pages_only(cold)))
+
+            expired = WebsiteCache(cache_dir, ttl_days=0, error_ttl_hours=0)
+            revalidated, stats = fetch_websites(urls, cache=expired, **options)
+            checks.append(('expired entries revalidate with 304', stats['cache_revalidated'] == 20
+                           and pages_only(revalidated) == pages_only(cold)))
+
+            _, stats = fetch_websites(urls[:1], cache=WebsiteCache(cache_dir), max_bytes=10, **options)
+            checks.append(('other page budget is a miss', stats['cache_misses'] == 1
+                           and stats['requests_sent'] == 1))
+
+            slow_url = server.base_url + '/slow'
+            for _ in range(2):
+                slow, stats = fetch_websites([slow_url], cache=WebsiteCache(cache_dir), timeout=0.1, **options)
+            checks.append(('timeouts not cached', slow[0]['timed_out'] and stats['cache_misses'] == 1
+                           and server.hits['/slow'] == 2))
+
+            class Interrupted(Exception):
+                pass
+
+            made = []
+
+            def failing_consumer():
+                # No consumer (buffer the page) for the first two pages, then fail like a crash mid-crawl
+                made.append(None)
+                if len(made) == 3:
+                    raise Interrupted
+                return None
+
+            interrupted_dir = os.path.join(cache_dir, 'interrupted')
+            try:
+                fetch_websites(urls, cache=WebsiteCache(interrupted_dir), consumer_factory=failing_consumer,
+                               concurrency=1, **options)
+            except Interrupted:
+                pass
+            checks.append(('failed run still saves its pages', len(WebsiteCache(interrupted_dir).entries) >= 1))
+
+            small = WebsiteCache(cache_dir, max_mb=5 * 100 / 1e6)
+            small.save()
+            checks.append(('LRU eviction honours size bound',
+                           small.stats()['cache_bytes'] <= 500 and small.evictions > 0))
+
+        checks.append(('keys normalized', cache_key('HTTP://Example.com:80') == 'http://example.com/'
+                       and cache_key('example.com/about#team') == 'https://example.com/about'))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    for name, passed in checks:
+        print(f"  {'PASS' if passed else 'FAIL'}  {name}")
+    failed = sum(not passed for _, passed in checks)
+    print(f"\n{len(checks) - failed}/{len(checks)} checks passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='On-disk cache for fetched website pages')
+    parser.add_argument('--cache-dir', default=WEBSITE_CACHE_DIR, help='Cache directory')
+    parser.add_argument('--stats', action='store_true', help='Print cache size and entry counts')
+    parser.add_argument('--self-test', action='store_true',
+                        help='Exercise the cache against a local canned-page server')
+    args = parser.parse_args()
+
+    if args.self_test:
+        raise SystemExit(0 if self_test() else 1)
+    if args.stats:
+        print(WebsiteCache(args.cache_dir).stats())
@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+"""
+Asynchronous website fetcher for website-based cluster validation.
+
+WebsiteFetcher downloads many account homepages concurrently using asyncio
+streams from the standard library. Connections are pooled per host and reused
+through HTTP/1.1 keep-alive. A semaphore per host and a global semaphore cap
+how many requests are in flight. Each request (every redirect hop) has its own
+timeout, which starts once it holds both semaphores. Transient failures
+(connection errors, timeouts, 429 and 5xx) are retried with exponential
+backoff, and at most max_redirects redirects are followed. Bodies are capped at
+max_bytes and gzip/deflate responses are decoded.
+
+serve_canned_pages starts a local HTTP server that returns fixed responses. The
+--self-test run uses it to exercise redirects, retries, timeouts and pooling
+with no network access.
+
+Usage:
+    python scripts/website_fetcher.py --self-test
+    python scripts/website_fetcher.py example.com https://example.org/about
+
+Author: Evidence-Based Analysis
+Date: January 7, 2026
+"""
+
+import argparse
+import asyncio
+import codecs
+import gzip
+import http.server
+import re
+import socket
+import ssl
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import quote, urljoin, urlsplit
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+USER_AGENT = 'Mozilla/5.0 (compatible; ClusterValidation/1.0)'
+CHARSET_PATTERN = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+class FetchError(Exception):
+    """A failure that retrying will not fix (unsupported URL, redirect cap)."""
+
+
+class MalformedResponse(Exception):
+    """The server sent something that is not a parseable HTTP/1.x response."""
+
+
+def normalize_website_url(url: str) -> str:
+    """Strip whitespace and default to https:// when the URL has no scheme."""
+    url = str(url).strip()
+    if '://' not in url:
+        url = 'https://' + url.lstrip('/')
+    return url
+
+
+def response_charset(headers: Dict[str, str]) -> str:
+    """Charset from the Content-Type header, UTF-8 when missing or unknown."""
+    match = CHARSET_PATTERN.search(headers.get('content-type', ''))
+    if match:
+        try:
+            return codecs.lookup(match.group(1)).name
+        except LookupError:
+            pass
+    return 'utf-8'
+
+
+class _BodySink:
+    """
+    Decompresses and decodes body chunks as they arrive, keeping at most
+    max_bytes of decompressed body. The text is buffered, or handed chunk by
+    chunk to a consumer (feed(text) -> bool to continue, close() -> dict of
+    result fields) so the page is never held in memory.
+    """
+
+    def __init__(self, headers: Dict[str, str], max_bytes: int, consumer=None):
+        encoding = headers.get('content-encoding', '').lower()
+        self._gzip = encoding in ('gzip', 'x-gzip')
+        self._deflate = encoding == 'deflate'
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if self._gzip else None
+        self._decoder = codecs.getincrementaldecoder(response_charset(headers))(errors='replace')
+        self._remaining = max_bytes
+        self._consumer = consumer
+        self._parts: List[str] = []
+
+    def _decompress(self, chunk: bytes) -> bytes:
+        if self._deflate and self._decompressor is None:
+            # zlib-wrapped deflate, or raw deflate from servers that skip the header
+            zlib_header = len(chunk) >= 2 and chunk[0] & 0x0F == 8 and (chunk[0] << 8 | chunk[1]) % 31 == 0
+            self._decompressor = zlib.decompressobj(zlib.MAX_WBITS if zlib_header else -zlib.MAX_WBITS)
+        if self._decompressor is None:
+            return chunk[:self._remaining]
+        try:
+            return self._decompressor.decompress(chunk, self._remaining)
+        except zlib.error:
+            raise MalformedResponse(f"Bad {'gzip' if self._gzip else 'deflate'} body")
+
+    def feed(self, chunk: bytes) -> bool:
+        """Take one raw body chunk; False once the size cap or the consumer says stop."""
+        if self._remaining <= 0:
+            return False  # decompress(chunk, 0) would mean no limit
+        data = self._decompress(chunk)
+        self._remaining -= len(data)
+        text = self._decoder.decode(data)
+        if self._consumer is None:
+            self._parts.append(text)
+        elif text and not self._consumer.feed(text):
+            return False
+        return self._remaining > 0
+
+    def close(self) -> Dict:
+        """Result fields for the body: {'content': text}, or the consumer's fields."""
+        text = self._decoder.decode(b'', final=True)
+        if self._consumer is None:
+            self._parts.append(text)
+            return {'content': ''.join(self._parts)}
+        if text:
+            self._consumer.feed(text)
+        return self._consumer.close()
+
+
+class _HostPool:
+    """Idle keep-alive connections and the concurrency limit for one host."""
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+
+class WebsiteFetcher:
+    """
+    Concurrent HTTP(S) GET client with per-host connection pools.
+
+    Use as an async context manager so pooled connections are closed:
+
+        async with WebsiteFetcher(concurrency=20, per_host=2) as fetcher:
+            results = await fetcher.fetch_all(urls)
+    """
+
+    def __init__(self, concurrency: int = 20, per_host: int = 2, timeout: float = 15.0,
+                 retries: int = 2, backoff: float = 0.5, max_redirects: int = 5,
+                 max_bytes: int = 2_000_000, user_agent: str = USER_AGENT,
+                 verify_ssl: bool = True):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_redirects = max_redirects
+        self.max_bytes = max_bytes
+        self.user_agent = user_agent
+
+        self._global = asyncio.Semaphore(concurrency)
+        self._pools: Dict[Tuple[str, str, int], _HostPool] = {}
+        self._ssl_context = ssl.create_default_context()
+        if not verify_ssl:
+            self._ssl_context.check_hostname = False
+            self._ssl_context.verify_mode = ssl.CERT_NONE
+
+        self.connections_opened = 0
+        self.requests_sent = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close every pooled connection."""
+        for pool in self._pools.values():
+            for _, writer in pool.idle:
+                writer.close()
+            pool.idle.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {'hosts': len(self._pools),
+                'connections_opened': self.connections_opened,
+                'requests_sent': self.requests_sent}
+
+    async def fetch_all(self, urls: Iterable[str], consumer_factory=None) -> List[Dict]:
+        """Fetch every URL concurrently; results are in input order."""
+        return await asyncio.gather(*(self.fetch(url, consumer_factory=consumer_factory) for url in urls))
+
+    async def fetch(self, url: str, headers: Dict[str, str] = None, consumer_factory=None) -> Dict:
+        """
+        Fetch one URL with retries. Never raises for network problems: the result
+        dict carries either the page (status, final_url, content) or an error
+        (timed_out is set when the last attempt ran out of time).
+        headers are extra request headers (e.g. If-None-Match for revalidation).
+
+        consumer_factory, when given, makes a fresh consumer for each final
+        response body: the decoded text is streamed into it instead of being
+        buffered, and the fields its close() returns replace 'content'.
+        """
+        start = time.perf_counter()
+        result = {'url': url, 'final_url': None, 'status': None, 'content_type': None,
+                  'content': None, 'etag': None, 'last_modified': None, 'redirects': 0,
+                  'attempts': 0, 'error': None, 'timed_out': False, 'elapsed': 0.0, 'from_cache': False}
+
+        for attempt in range(self.retries + 1):
+            result.update(attempts=attempt + 1, timed_out=False)
+            try:
+                status, final_url, response_headers, body, redirects = await self._get_following_redirects(
+                    normalize_website_url(url), headers, consumer_factory)
+            except FetchError as exc:
+                result['error'] = str(exc)
+                break
+            except (socket.gaierror, ssl.SSLCertVerificationError) as exc:
+                # Unknown host or bad certificate: retrying will not help
+                result['error'] = f'{type(exc).__name__}: {exc}'
+                break
+            except asyncio.TimeoutError:
+                result.update(error=f'Timed out after {self.timeout:g}s', timed_out=True)
+            except (OSError, EOFError, MalformedResponse) as exc:
+                result['error'] = f'{type(exc).__name__}: {exc}'
+            else:
+                result.update(status=status, final_url=final_url, redirects=redirects,
+                              content_type=response_headers.get('content-type'),
+                              etag=response_headers.get('etag'),
+                              last_modified=response_headers.get('last-modified'), error=None)
+                result.update(body)
+                if status not in RETRY_STATUSES:
+                    break
+                result['error'] = f'HTTP {status}'
+
+            if attempt < self.retries:
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+
+        result['elapsed'] = round(time.perf_counter() - start, 3)
+        return result
+
+    async def _get_following_redirects(self, url: str, extra_headers: Dict[str, str] = None,
+                                       consumer_factory=None):
+        redirects = 0
+        while True:
+            status, headers, body = await self._request(url, extra_headers, consumer_factory)
+            location = headers.get('location')
+            if status not in REDIRECT_STATUSES or not location:
+                return status, url, headers, body, redirects
+            if redirects >= self.max_redirects:
+                raise FetchError(f'More than {self.max_redirects} redirects')
+            url = urljoin(url, location)
+            redirects += 1
+
+    def _pool(self, key: Tuple[str, str, int]) -> _HostPool:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _HostPool(self.per_host)
+        return pool
+
+    async def _connect(self, key: Tuple[str, str, int], pool: _HostPool):
+        """An idle pooled connection for the host, or a new one. Returns (reader, writer, reused)."""
+        while pool.idle:
+            reader, writer = pool.idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+
+        scheme, host, port = key
+        ssl_context = self._ssl_context if scheme == 'https' else None
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        self.connections_opened += 1
+        return reader, writer, False
+
+    def _request_bytes(self, parts, host_header: str, extra_headers: Dict[str, str] = None) -> bytes:
+        path = quote(parts.path or '/', safe="/%:@!$&'()*+,;=-._~")
+        if parts.query:
+            path += '?' + quote(parts.query, safe="/%:@!$&'()*+,;=-._~?")
+        extra = ''.join(f'{name}: {value}\r\n' for name, value in (extra_headers or {}).items())
+        return (f'GET {path} HTTP/1.1\r\n'
+                f'Host: {host_header}\r\n'
+                f'User-Agent: {self.user_agent}\r\n'
+                'Accept: text/html,application/xhtml+xml;q=0.9,*/*;q=0.8\r\n'
+                'Accept-Encoding: gzip, deflate\r\n'
+                f'{extra}'
+                'Connection: keep-alive\r\n\r\n').encode('latin-1')
+
+    async def _request(self, url: str, extra_headers: Dict[str, str] = None, consumer_factory=None):
+        """
+        One GET on a pooled connection. Returns (status, headers, body result fields).
+        The timeout starts once the host and global slots are held, so time spent
+        queued behind other requests does not count against it.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise FetchError(f'Unsupported URL: {url}')
+        try:
+            host = parts.hostname.encode('idna').decode('ascii')
+            port = parts.port or (443 if parts.scheme == 'https' else 80)
+        except (UnicodeError, ValueError):
+            raise FetchError(f'Invalid host in URL: {url}')
+        default_port = port == (443 if parts.scheme == 'https' else 80)
+        request = self._request_bytes(parts, host if default_port else f'{host}:{port}', extra_headers)
+
+        key = (parts.scheme, host, port)
+        pool = self._pool(key)
+        # Host slot first: a request queued for a busy host must not hold a global slot
+        async with pool.semaphore, self._global:
+            return await asyncio.wait_for(self._exchange(key, pool, request, consumer_factory), self.timeout)
+
+    async def _exchange(self, key: Tuple[str, str, int], pool: _HostPool, request: bytes,
+                        consumer_factory=None):
+        """Send request and read the response, retrying once on a dropped idle connection."""
+        while True:
+            reader, writer, reused = await self._connect(key, pool)
+            keep_alive = False
+            try:
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    version, status, headers = await self._read_head(reader)
+                except (OSError, EOFError):
+                    if reused:
+                        continue  # the server dropped an idle connection; open a fresh one
+                    raise
+                self.requests_sent += 1
+                redirect = status in REDIRECT_STATUSES and 'location' in headers
+                consumer = consumer_factory() if consumer_factory and not redirect else None
+                sink = _BodySink(headers, self.max_bytes, consumer)
+                complete = await self._read_body(reader, status, headers, sink.feed)
+                connection = headers.get('connection', '').lower()
+                keep_alive = complete and (connection == 'keep-alive' if version == 'HTTP/1.0'
+                                           else connection != 'close')
+                return status, headers, sink.close()
+            finally:
+                if keep_alive:
+                    pool.idle.append((reader, writer))
+                else:
+                    writer.close()
+
+    async def _read_head(self, reader: asyncio.StreamReader):
+        """Status line and headers, skipping interim 1xx responses."""
+        while True:
+            try:
+                status_line = await reader.readline()
+                if not status_line:
+                    raise EOFError('Connection closed before a response')
+                fields = status_line.decode('latin-1').split(None, 2)
+                if len(fields) < 2 or not fields[0].startswith('HTTP/') or not fields[1].isdigit():
+                    raise MalformedResponse(f'Bad status line {status_line[:80]!r}')
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+            except ValueError as exc:  # line longer than the stream limit
+                raise MalformedResponse(str(exc))
+
+            status = int(fields[1])
+            if status >= 200 or status == 101:
+                return fields[0], status, headers
+
+    async def _read_body(self, reader: asyncio.StreamReader, status: int,
+                         headers: Dict[str, str], on_chunk) -> bool:
+        """
+        Pass the body to on_chunk piece by piece until it returns False. Returns
+        whether the body was read to its end; a partial read leaves the
+        connection unusable for keep-alive.
+        """
+        if status in (204, 304):
+            return True
+
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            while True:
+                try:
+                    chunk_size = int((await reader.readline()).split(b';')[0].strip(), 16)
+                except ValueError:
+                    raise MalformedResponse('Bad chunk size')
+                if chunk_size == 0:
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass  # trailers
+                    return True
+                # More chunks follow, so a stop on this chunk's last byte still ends the read
+                if not await self._stream_exactly(reader, chunk_size, on_chunk, last=False):
+                    return False
+                await reader.readline()
+
+        if 'content-length' in headers:
+            try:
+                length = int(headers['content-length'])
+            except ValueError:
+                raise MalformedResponse('Bad Content-Length')
+            return await self._stream_exactly(reader, length, on_chunk)
+
+        # No framing: the body runs until the server closes the connection
+        while True:
+            chunk = await reader.read(65536)
+            if not chunk or not on_chunk(chunk):
+                return False
+
+    @staticmethod
+    async def _stream_exactly(reader: asyncio.StreamReader, length: int, on_chunk,
+                              last: bool = True) -> bool:
+        """
+        Pass the next length bytes to on_chunk; False if it stops early. When
+        these bytes are the last of the body (last=True), a stop on the final
+        byte still counts as a complete read.
+        """
+        while length:
+            chunk = await reader.read(min(65536, length))
+            if not chunk:
+                raise asyncio.IncompleteReadError(b'', length)
+            length -= len(chunk)
+            if not on_chunk(chunk) and (length or not last):
+                return False
+        return True
+
+
+def fetch_websites(urls: Iterable[str], cache=None, consumer_factory=None,
+                   **options) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Fetch URLs from synchronous code. Returns (results in input order, stats).
+
+    cache is an optional website_cache.WebsiteCache; pages it holds are served
+    from disk (or revalidated) and its counters are added to the stats. The
+    cache is saved even if the run raises or is interrupted.
+    consumer_factory streams each fetched body (see WebsiteFetcher.fetch).
+    """
+    async def run():
+        async with WebsiteFetcher(**options) as fetcher:
+            if cache is None:
+                results = await fetcher.fetch_all(list(urls), consumer_factory)
+            else:
+                results = await asyncio.gather(*(cache.fetch(fetcher, url, consumer_factory)
+                                                 for url in urls))
+            return results, fetcher.stats()
+
+    try:
+        results, stats = asyncio.run(run())
+    finally:
+        # Keep what was fetched even when the run fails or is interrupted
+        if cache is not None:
+            cache.save()
+    if cache is not None:
+        stats.update(cache.stats())
+    return results, stats
+
+
+class _CannedPageHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            hits = server.hits.get(self.path, 0)
+            server.hits[self.path] = hits + 1
+        spec = server.pages.get(self.path, {'status': 404, 'body': b'not found'})
+        if isinstance(spec, list):
+            spec = spec[min(hits, len(spec) - 1)]
+        etag = spec.get('headers', {}).get('ETag')
+        if etag and self.headers.get('If-None-Match') == etag:
+            spec = {'status': 304, 'headers': {'ETag': etag}}
+
+        time.sleep(spec.get('delay', 0))
+        body = spec.get('body', b'')
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        chunk_size = spec.get('chunk_size')
+        self.send_response(spec.get('status', 200))
+        for name, value in spec.get('headers', {}).items():
+            self.send_header(name, value)
+        if chunk_size:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not chunk_size:
+            self.wfile.write(body)
+            return
+
+        for start in range(0, len(body), chunk_size):
+            piece = body[start:start + chunk_size]
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(piece), piece))
+            with server.lock:
+                server.bytes_sent[self.path] = server.bytes_sent.get(self.path, 0) + len(piece)
+            time.sleep(spec.get('chunk_delay', 0))
+        self.wfile.write(b'0\r\n\r\n')
+
+    def log_message(self, *args):
+        pass
+
+
+class _CannedPageServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass  # clients that time out hang up mid-response on purpose
+
+
+@contextmanager
+def serve_canned_pages(pages: Dict):
+    """
+    Local HTTP/1.1 server returning fixed responses, for tests without network.
+
+    pages maps a path to a response spec {'status', 'headers', 'body', 'delay'}
+    or to a list of specs served in turn (the last one repeats). A spec with an
+    ETag header answers a matching If-None-Match with 304. A spec with
+    'chunk_size' is sent with chunked transfer encoding, sleeping
+    'chunk_delay' seconds after each chunk. Yields the server; server.base_url
+    is its root URL, server.hits counts requests per path and
+    server.bytes_sent the chunked body bytes written per path.
+    """
+    server = _CannedPageServer(('127.0.0.1', 0), _CannedPageHandler)
+    server.pages = pages
+    server.hits = {}
+    server.bytes_sent = {}
+    server.lock = threading.Lock()
+    server.base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def self_test() -> bool:
+    """Run the fetcher against canned pages and report each behaviour checked."""
+    import random
+
+    page = '<html><body><h1>Acme Supply</h1><p>Lumber, concrete and roofing.</p></body></html>'
+    # ~400 KB of words that compress poorly, so the gzip body spans many 4 KB chunks
+    rng = random.Random(42)
+    words = ['lumber', 'concrete', 'roofing', 'supply', 'steel', 'pipe', 'valve', 'brick']
+    long_page = ' '.join(rng.choice(words) + str(rng.randrange(1000)) for _ in range(40_000))
+    pages = {
+        '/': {'headers': {'Content-Type': 'text/html; charset=utf-8'}, 'body': page},
+        '/moved': {'status': 301, 'headers': {'Location': '/'}},
+        '/loop': {'status': 302, 'headers': {'Location': '/loop'}},
+        '/flaky': [{'status': 503}, {'status': 503}, {'body': page}],
+        '/down': {'status': 500},
+        '/slow': {'delay': 1.0, 'body': page},
+        '/gzip': {'headers': {'Content-Encoding': 'gzip'}, 'body': gzip.compress(page.encode())},
+        '/latin1': {'headers': {'Content-Type': 'text/html; charset=iso-8859-1'},
+                    'body': 'Caf\xe9'.encode('latin-1')},
+        '/big': {'body': b'x' * 5000},
+        '/chunked': {'body': page, 'chunk_size': 16},
+        '/chunked-gzip': {'headers': {'Content-Encoding': 'gzip'}, 'chunk_size': 4096,
+                          'body': gzip.compress(long_page.encode())},
+    }
+    pages.update({f'/page{i}': {'body': f'page {i}'} for i in range(40)})
+    pages.update({f'/queued{i}': {'delay': 0.1, 'body': f'queued {i}'} for i in range(8)})
+
+    print("="*80)
+    print("WEBSITE FETCHER SELF-TEST (local canned pages)")
+    print("="*80)
+
+    checks = []
+    with serve_canned_pages(pages) as server:
+        base = server.base_url
+
+        results, _ = fetch_websites([base + '/', base + '/moved', base + '/loop', base + '/gzip',
+                                     base + '/latin1', base + '/big', base + '/nowhere'],
+                                    max_redirects=3, max_bytes=1000, backoff=0.01)
+        ok, moved, loop, gz, latin1, big, missing = results
+        checks.append(('plain page', ok['status'] == 200 and 'Lumber' in ok['content']))
+        checks.append(('redirect followed', moved['status'] == 200 and moved['redirects'] == 1
+                       and moved['final_url'] == base + '/'))
+        checks.append(('redirect cap', loop['status'] is None and 'redirects' in loop['error']
+                       and server.hits['/loop'] == 4))
+        checks.append(('gzip decoded', gz['content'] == page))
+        checks.append(('charset from header', latin1['content'] == 'Caf\xe9'))
+        checks.append(('body capped at max_bytes', len(big['content']) == 1000))
+        checks.append(('404 not retried', missing['status'] == 404 and missing['attempts'] == 1))
+
+        results, _ = fetch_websites([base + '/flaky', base + '/down'], retries=2, backoff=0.01)
+        flaky, down = results
+        checks.append(('retried until success', flaky['status'] == 200 and flaky['attempts'] == 3))
+        checks.append(('gives up after retries', down['status'] == 500 and down['attempts'] == 3
+                       and down['error'] == 'HTTP 500'))
+
+        start = time.perf_counter()
+        results, _ = fetch_websites([base + '/slow'], timeout=0.2, retries=1, backoff=0.01)
+        checks.append(('timeout', results[0]['error'].startswith('Timed out')
+                       and results[0]['attempts'] == 2 and time.perf_counter() - start < 0.9))
+
+        # 8 slow pages through 2 host slots take ~0.4s in all, but each request only 0.1s
+        results, _ = fetch_websites([base + f'/queued{i}' for i in range(8)], per_host=2,
+                                    timeout=0.3, retries=0)
+        checks.append(('queue wait not counted in timeout', all(r['status'] == 200 for r in results)))
+
+        results, _ = fetch_websites([base + '/chunked', base + '/chunked-gzip'], max_bytes=100_000, retries=0)
+        chunked, chunked_gzip = results
+        checks.append(('chunked body decoded', chunked['content'] == page))
+        checks.append(('chunked gzip body capped at max_bytes', chunked_gzip['status'] == 200
+                       and chunked_gzip['error'] is None and chunked_gzip['content'] == long_page[:100_000]))
+
+        start = time.perf_counter()
+        urls = [base + f'/page{i}' for i in range(40)]
+        results, stats = fetch_websites(urls, concurrency=10, per_host=3)
+        elapsed = time.perf_counter() - start
+        checks.append(('results in input order', [r['content'] for r in results] ==
+                       [f'page {i}' for i in range(40)]))
+        checks.append(('per-host pool reused', stats['connections_opened'] <= 3
+                       and stats['requests_sent'] == 40))
+        print(f"40 pages, per-host limit 3: {stats['connections_opened']} connections, {elapsed:.2f}s")
+
+    for name, passed in checks:
+        print(f"  {'PASS' if passed else 'FAIL'}  {name}")
+    failed = sum(not passed for _, passed in checks)
+    print(f"\n{len(checks) - failed}/{len(checks)} checks passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Concurrent website fetcher')
+    parser.add_argument('urls', nargs='*', help='URLs or bare domains to fetch')
+    parser.add_argument('--self-test', action='store_true',
+                        help='Exercise the fetcher against a local canned-page server')
+    parser.add_argument('--concurrency', type=int, default=20, help='Global request limit')
+    parser.add_argument('--per-host', type=int, default=2, help='Concurrent requests per host')
+    parser.add_argument('--timeout', type=float, default=15.0, help='Seconds per request, counted once it has a connection slot')
+    parser.add_argument('--retries', type=int, default=2, help='Retries for transient failures')
+    args = parser.parse_args()
+
+    if args.self_test:
+        raise SystemExit(0 if self_test() else 1)
+
+    results, stats = fetch_websites(args.urls, concurrency=args.concurrency, per_host=args.per_host,
+                                    timeout=args.timeout, retries=args.retries)
+    for result in results:
+        size = len(result['content']) if result['content'] is not None else 0
+        print(f"{result['url']}: status={result['status']} final={result['final_url']} "
+              f"chars={size:,} attempts={result['attempts']} {result['error'] or ''}")
+    print(stats)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Canonical website hosts for accounts, and the deduplicated fetch plan.
+
+The Website column mixes formats (bare domains, http:// and https:// URLs,
+www. prefixes, trailing paths, ports, e-mail addresses, 'nan' strings), and
+the comma-separated Domains column holds further candidates. canonical_hosts
+normalizes both columns with vectorized pandas string operations and gives
+each account one host: the Website host when usable, otherwise the first
+usable Domains entry. A non-default port stays part of the host. Only
+entries that look like real hostnames are used, so Method account slugs in
+Domains are ignored. Hosts of free e-mail providers (gmail.com, yahoo.com,
+...) come from contact e-mail addresses, not from the business, and are
+never used.
+
+host_fetch_plan reduces the accounts to one fetch per distinct host, of the
+first account's root URL (its http/https scheme and www. kept, https when
+none is given). The validator fetches each host once and gives the result
+to every account that shares it.
+
+Usage:
+    python scripts/website_hosts.py [--dataset path.csv]
+    python scripts/website_hosts.py --self-test
+
+Author: Evidence-Based Analysis
+Date: January 7, 2026
+"""
+
+import argparse
+from typing import Dict, Tuple
+
+import pandas as pd
+
+# Providers whose domain says nothing about the account's business
+FREE_MAIL_HOSTS = {
+    'gmail.com', 'googlemail.com', 'yahoo.com', 'ymail.com', 'hotmail.com', 'outlook.com', 'live.com',
+    'msn.com', 'aol.com', 'icloud.com', 'me.com', 'mac.com', 'protonmail.com', 'proton.me', 'gmx.com',
+    'mail.com', 'zoho.com', 'comcast.net', 'att.net', 'sbcglobal.net', 'verizon.net', 'bellsouth.net',
+    'cox.net', 'charter.net', 'earthlink.net', 'shaw.ca', 'rogers.com',
+}
+
+# scheme://user@host:port/path?query#fragment, every part but the host optional
+URL_PATTERN = (r'^(?:(?P<scheme>[a-z][a-z0-9+.-]*)://)?(?:[^/@]*@)?(?P<host>[^/?#:@]*)'
+               r'(?::(?P<port>[0-9]*))?(?:[/?#].*)?$')
+WWW_PATTERN = r'^www[0-9]*\.'
+HOST_PATTERN = (r'(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+(?:[a-z]{2,}|xn--[a-z0-9-]+)'
+                r'|[0-9]{1,3}(?:\.[0-9]{1,3}){3}')
+
+
+def _parse_hosts(values: pd.Series) -> pd.DataFrame:
+    """
+    Per value: Host (the canonical key: no scheme, credentials, www., path,
+    default port or trailing dot; NaN when missing or not a hostname) and
+    Fetch_URL (root URL keeping the given http/https scheme and www.).
+    """
+    parts = values.astype(str).str.strip().str.lower().str.extract(URL_PATTERN)
+    scheme = parts['scheme'].fillna('')
+    netloc = parts['host'].str.rstrip('.')
+    port = parts['port'].fillna('')
+    default_port = ((port == '') | ((port == '80') & scheme.isin(['', 'http']))
+                    | ((port == '443') & scheme.isin(['', 'https'])))
+    port_suffix = (':' + port).where(~default_port, '')
+
+    host = netloc.str.replace(WWW_PATTERN, '', regex=True)
+    valid = values.notna() & host.str.fullmatch(HOST_PATTERN).fillna(False).astype(bool)
+    fetch_scheme = scheme.where(scheme.isin(['http', 'https']), 'https')
+    return pd.DataFrame({'Host': (host + port_suffix).where(valid),
+                         'Fetch_URL': (fetch_scheme + '://' + netloc + port_suffix + '/').where(valid)},
+                        index=values.index)
+
+
+def normalize_hosts(values: pd.Series) -> pd.Series:
+    """
+    Canonical host per value: lowercase, without scheme, credentials, www.,
+    path, default port or trailing dot; NaN where a value is missing or not
+    a hostname.
+    """
+    return _parse_hosts(values)['Host']
+
+
+def canonical_hosts(accounts: pd.DataFrame, website_column: str = 'Website',
+                    domains_column: str = 'Domains') -> pd.DataFrame:
+    """
+    One host per account, aligned to accounts.index.
+
+    Columns: Canonical_Host (NaN when nothing usable), Fetch_URL (the root
+    URL to fetch for it), Host_Source ('Website' or 'Domains') and
+    Free_Mail_Host (the account's only hosts were e-mail providers).
+    """
+    empty = pd.DataFrame({'Host': float('nan'), 'Fetch_URL': float('nan')}, index=accounts.index, dtype=object)
+    website = _parse_hosts(accounts[website_column]) if website_column in accounts else empty
+    if domains_column in accounts:
+        candidates = _parse_hosts(accounts[domains_column].astype(str).str.split(',').explode())
+        candidates = candidates.dropna(subset=['Host'])
+        is_mail = candidates['Host'].isin(FREE_MAIL_HOSTS)
+        domain = candidates[~is_mail].groupby(level=0).first().reindex(accounts.index)
+        domain_mail = is_mail.groupby(level=0).any().reindex(accounts.index, fill_value=False)
+    else:
+        domain = empty
+        domain_mail = pd.Series(False, index=accounts.index)
+
+    website_mail = website['Host'].isin(FREE_MAIL_HOSTS)
+    use_website = website['Host'].notna() & ~website_mail
+    use_domain = ~use_website & domain['Host'].notna()
+    chosen = website.where(use_website, domain)
+
+    source = pd.Series(pd.NA, index=accounts.index, dtype=object)
+    source[use_website] = 'Website'
+    source[use_domain] = 'Domains'
+    free_mail = ~use_website & ~use_domain & (website_mail | domain_mail)
+    return pd.DataFrame({'Canonical_Host': chosen['Host'], 'Fetch_URL': chosen['Fetch_URL'],
+                         'Host_Source': source, 'Free_Mail_Host': free_mail})
+
+
+def host_fetch_plan(hosts: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+    """
+    One fetch per distinct Canonical_Host in a canonical_hosts frame (first
+    account's Fetch_URL, first-seen order) and the reduction achieved against
+    one fetch per account.
+    """
+    with_host = hosts.dropna(subset=['Canonical_Host'])
+    plan = with_host.drop_duplicates('Canonical_Host')[['Canonical_Host', 'Fetch_URL']].reset_index(drop=True)
+    saved = len(with_host) - len(plan)
+    stats = {'accounts_with_host': len(with_host), 'unique_hosts': len(plan), 'fetches_saved': saved,
+             'fetch_reduction_pct': round(saved / len(with_host) * 100, 1) if len(with_host) else 0.0,
+             'shared_hosts': int((with_host['Canonical_Host'].value_counts() > 1).sum())}
+    return plan, stats
+
+
+def print_fetch_plan(hosts: pd.DataFrame, stats: Dict):
+    """Host coverage and the fetch reduction from deduplication."""
+    sources = hosts['Host_Source'].value_counts()
+    print(f"Accounts with a usable host: {stats['accounts_with_host']} / {len(hosts)} "
+          f"(Website: {sources.get('Website', 0)}, Domains: {sources.get('Domains', 0)}; "
+          f"{int(hosts['Free_Mail_Host'].sum())} skipped as e-mail provider hosts)")
+    print(f"Fetch plan: {stats['accounts_with_host']} accounts -> {stats['unique_hosts']} hosts "
+          f"({stats['fetches_saved']} fetches saved, {stats['fetch_reduction_pct']:.1f}% fewer; "
+          f"{stats['shared_hosts']} hosts shared by several accounts)")
+
+
+def self_test() -> bool:
+    """Normalization cases, source precedence and the fetch plan."""
+    print("="*80)
+    print("WEBSITE HOST SELF-TEST")
+    print("="*80)
+
+    cases = {
+        'example.com': 'example.com',
+        'HTTPS://WWW.Example.com/about/team?x=1#top': 'example.com',
+        'http://www2.example.com:80': 'example.com',
+        'example.com:8080/shop': 'example.com:8080',
+        '  shop.example.co.uk./  ': 'shop.example.co.uk',
+        'sales@example.com': 'example.com',
+        'https://user:pw@example.com/': 'example.com',
+        'nan': None, '': None, 'N/A': None, 'conequipparts': None, 'not a url.com': None,
+    }
+    normalized = normalize_hosts(pd.Series(list(cases) + [None]))
+    checks = [('normalization', [None if pd.isna(h) else h for h in normalized] == list(cases.values()) + [None])]
+
+    accounts = pd.DataFrame({
+        'Website': ['www.acme.com', 'http://acme.com/contact', 'gmail.com', float('nan'), 'nan', 'beta.io/'],
+        'Domains': ['acme', 'acme2', 'bob,bobsupply.com', 'gamma.net, delta.org', 'yahoo.com', float('nan')],
+    }, index=[10, 11, 12, 13, 14, 15])
+    hosts = canonical_hosts(accounts)
+    checks.append(('Website first, Domains fallback, e-mail hosts skipped',
+                   hosts['Canonical_Host'].fillna('').tolist()
+                   == ['acme.com', 'acme.com', 'bobsupply.com', 'gamma.net', '', 'beta.io']
+                   and hosts['Host_Source'].fillna('').tolist()
+                   == ['Website', 'Website', 'Domains', 'Domains', '', 'Website']
+                   and hosts['Free_Mail_Host'].tolist() == [False, False, False, False, True, False]))
+
+    plan, stats = host_fetch_plan(hosts)
+    checks.append(('one fetch per host', plan['Fetch_URL'].tolist()
+                   == ['https://www.acme.com/', 'https://bobsupply.com/', 'https://gamma.net/', 'https://beta.io/']
+                   and stats['fetches_saved'] == 1 and stats['fetch_reduction_pct'] == 20.0))
+
+    for name, passed in checks:
+        print(f"  {'PASS' if passed else 'FAIL'}  {name}")
+    failed = sum(not passed for _, passed in checks)
+    print(f"\n{len(checks) - failed}/{len(checks)} checks passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Canonical website hosts and fetch deduplication')
+    parser.add_argument('--dataset', default='data/customermethodaccount_01-07-2026_RECLUSTERED_V2_WITH_PRODUCT_TYPES.csv',
+                        help='Account CSV with Website and Domains columns')
+    parser.add_argument('--self-test', action='store_true', help='Run normalization checks and exit')
+    args = parser.parse_args()
+
+    if args.self_test:
+        raise SystemExit(0 if self_test() else 1)
+
+    df = pd.read_csv(args.dataset)
+    if 'Active?' in df:
+        df = df[df['Active?'] == True]
+    hosts = canonical_hosts(df)
+    _, stats = host_fetch_plan(hosts)
+    print_fetch_plan(hosts, stats)
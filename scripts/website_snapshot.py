@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Offline website snapshots for reproducible website validation.
+
+A snapshot is one crawl stored in two files:
+  <name>.pack      page records back to back, each zlib-compressed UTF-8
+  <name>.idx.json  offset index: per normalized URL the fetch fields plus the
+                   (offset, length) of its record, and an account -> URL map
+
+Identical pages are stored once. WebsiteSnapshot memory-maps the pack and
+slices out only the records that are asked for, so scoring a corpus reads no
+more than the pages being scored and needs no network access. SnapshotWriter
+is what the crawler (validate_cluster_websites --snapshot-out) writes
+through; both files are written under temporary names and renamed when the
+crawl completes, so an interrupted crawl never leaves a half-written snapshot.
+
+Usage:
+    python scripts/website_snapshot.py data/snapshots/websites.pack --stats
+    python scripts/website_snapshot.py data/snapshots/websites.pack --show example.com
+    python scripts/website_snapshot.py --self-test
+
+Author: Evidence-Based Analysis
+Date: January 7, 2026
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import time
+import zlib
+from typing import Dict, Iterable, Optional
+
+from website_cache import cache_key
+
+SNAPSHOT_DIR = 'data/snapshots'
+SNAPSHOT_VERSION = 1
+
+# Fetch result fields kept in the index; the page text lives in the pack
+RECORD_FIELDS = ['final_url', 'status', 'content_type', 'etag', 'last_modified', 'redirects', 'error',
+                 'content_is_text', 'truncated']
+
+
+def index_path(pack_path: str) -> str:
+    """Index file that belongs to a pack file."""
+    return os.path.splitext(pack_path)[0] + '.idx.json'
+
+
+class SnapshotWriter:
+    """
+    Appends fetch results to a new snapshot; close() (or leaving the with
+    block without an error) publishes it.
+    """
+
+    def __init__(self, pack_path: str, compress_level: int = 6):
+        self.pack_path = pack_path
+        self.compress_level = compress_level
+        os.makedirs(os.path.dirname(pack_path) or '.', exist_ok=True)
+        self._pack = open(pack_path + '.tmp', 'wb')
+        self._offset = 0
+        self._records: Dict[str, tuple] = {}  # sha256 -> (offset, length)
+        self.pages: Dict[str, Dict] = {}
+        self.accounts: Dict[str, str] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _append(self, content: str) -> Dict:
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self._records:
+            record = zlib.compress(data, self.compress_level)
+            self._pack.write(record)
+            self._records[digest] = (self._offset, len(record))
+            self._offset += len(record)
+        offset, length = self._records[digest]
+        return {'sha256': digest, 'offset': offset, 'length': length}
+
+    def add(self, url: str, result: Dict, accounts: Iterable[str] = ()):
+        """Record one fetch result under its URL and the accounts that use it."""
+        key = cache_key(url)
+        entry = {field: result.get(field) for field in RECORD_FIELDS}
+        entry.update(fetched_at=time.time(), sha256=None, offset=None, length=0)
+        if result.get('content') is not None:
+            entry.update(self._append(result['content']))
+        self.pages[key] = entry
+        for account in accounts:
+            self.accounts[str(account)] = key
+
+    def close(self):
+        """Flush the pack, then write the index; renames make the snapshot visible."""
+        if self._pack.closed:
+            return
+        self._pack.close()
+        os.replace(self.pack_path + '.tmp', self.pack_path)
+        index = {'version': SNAPSHOT_VERSION, 'pack': os.path.basename(self.pack_path),
+                 'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'pack_bytes': self._offset,
+                 'pages': self.pages, 'accounts': self.accounts}
+        path = index_path(self.pack_path)
+        with open(path + '.tmp', 'w') as handle:
+            json.dump(index, handle)
+        os.replace(path + '.tmp', path)
+
+    def abort(self):
+        """Discard a partially written snapshot."""
+        self._pack.close()
+        try:
+            os.remove(self.pack_path + '.tmp')
+        except OSError:
+            pass
+
+
+class WebsiteSnapshot:
+    """
+    Read-only view of a snapshot. Lookups return fetch results shaped like
+    WebsiteFetcher.fetch results (with from_snapshot=True), or None when the
+    URL or account was not crawled.
+    """
+
+    def __init__(self, pack_path: str):
+        self.pack_path = pack_path
+        with open(index_path(pack_path)) as handle:
+            index = json.load(handle)
+        if index.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"{index_path(pack_path)}: unsupported snapshot version {index.get('version')}")
+        self.pages: Dict[str, Dict] = index['pages']
+        self.accounts: Dict[str, str] = index['accounts']
+        self.created = index['created']
+
+        self._file = open(pack_path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size != index['pack_bytes']:
+            self._file.close()
+            raise ValueError(f"{pack_path}: {size} bytes, index expects {index['pack_bytes']}")
+        # mmap cannot map an empty file (a crawl where every fetch failed)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def _content(self, entry: Dict) -> Optional[str]:
+        if entry['offset'] is None:
+            return None
+        start = entry['offset']
+        return zlib.decompress(self._map[start:start + entry['length']]).decode('utf-8')
+
+    def result(self, url: str) -> Optional[Dict]:
+        """Stored fetch result for a URL (any spelling that normalizes to it)."""
+        entry = self.pages.get(cache_key(url))
+        if entry is None:
+            return None
+        result = {field: entry.get(field) for field in RECORD_FIELDS}
+        result.update(url=url, content=self._content(entry), attempts=0, elapsed=0.0,
+                      from_cache=True, from_snapshot=True)
+        return result
+
+    def result_for_account(self, account: str, url: str = None) -> Optional[Dict]:
+        """Stored result for an account's crawled URL, falling back to url."""
+        key = self.accounts.get(str(account))
+        if key is not None:
+            return self.result(url if url is not None and cache_key(url) == key else key)
+        return self.result(url) if url is not None else None
+
+    def verify(self) -> int:
+        """Number of records whose content no longer matches its SHA-256."""
+        bad = 0
+        for entry in {e['sha256']: e for e in self.pages.values() if e['sha256']}.values():
+            data = self._content(entry).encode('utf-8')
+            bad += hashlib.sha256(data).hexdigest() != entry['sha256']
+        return bad
+
+    def stats(self) -> Dict:
+        records = {e['sha256'] for e in self.pages.values() if e['sha256']}
+        return {'created': self.created, 'pages': len(self.pages), 'accounts': len(self.accounts),
+                'records': len(records), 'failed': sum(e['sha256'] is None for e in self.pages.values()),
+                'pack_bytes': os.path.getsize(self.pack_path)}
+
+
+def self_test() -> bool:
+    """Round trip, dedup, account lookup, abort and a 1,000-page read timing."""
+    import shutil
+    import tempfile
+
+    print("="*80)
+    print("WEBSITE SNAPSHOT SELF-TEST")
+    print("="*80)
+
+    tmp_dir = tempfile.mkdtemp(prefix='website_snapshot_')
+    pack = os.path.join(tmp_dir, 'crawl.pack')
+    pages = {f'https://site{i}.example.com/': f'Lumber and concrete supply number {i}. ' * 200
+             for i in range(1000)}
+    checks = []
+    try:
+        with SnapshotWriter(pack) as writer:
+            for i, (url, text) in enumerate(pages.items()):
+                writer.add(url, {'status': 200, 'final_url': url, 'content': text,
+                                 'content_is_text': True, 'truncated': False}, accounts=[f'account{i}'])
+            writer.add('mirror.example.com', {'status': 200, 'content': pages['https://site0.example.com/']},
+                       accounts=['mirror'])
+            writer.add('https://down.example.com', {'status': None, 'content': None, 'error': 'timeout'},
+                       accounts=['down'])
+
+        start = time.perf_counter()
+        with WebsiteSnapshot(pack) as snapshot:
+            read = {url: snapshot.result(url)['content'] for url in pages}
+            elapsed = time.perf_counter() - start
+            checks.append(('all pages round trip', read == pages))
+            checks.append(('identical pages stored once', snapshot.stats()['records'] == 1000))
+            checks.append(('lookup by account and URL spelling',
+                           snapshot.result_for_account('account7')['content'] == pages['https://site7.example.com/']
+                           and snapshot.result('HTTPS://SITE7.example.com:443')['content']
+                           == pages['https://site7.example.com/']))
+            down = snapshot.result_for_account('down')
+            checks.append(('failed fetch kept without content', down['content'] is None
+                           and down['error'] == 'timeout'))
+            checks.append(('unknown account or URL', snapshot.result_for_account('nobody') is None
+                           and snapshot.result('elsewhere.example.com') is None))
+            checks.append(('records verify', snapshot.verify() == 0))
+        print(f"Read 1,000 pages from the snapshot in {elapsed*1000:.0f} ms")
+
+        aborted = os.path.join(tmp_dir, 'aborted.pack')
+        try:
+            with SnapshotWriter(aborted) as writer:
+                writer.add('example.com', {'status': 200, 'content': 'partial'})
+                raise KeyboardInterrupt
+        except KeyboardInterrupt:
+            pass
+        checks.append(('interrupted crawl leaves nothing', not any(name.startswith('aborted')
+                                                                   for name in os.listdir(tmp_dir))))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    for name, passed in checks:
+        print(f"  {'PASS' if passed else 'FAIL'}  {name}")
+    failed = sum(not passed for _, passed in checks)
+    print(f"\n{len(checks) - failed}/{len(checks)} checks passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Inspect offline website snapshots')
+    parser.add_argument('pack', nargs='?', help='Snapshot .pack file')
+    parser.add_argument('--stats', action='store_true', help='Print page, record and size counts')
+    parser.add_argument('--verify', action='store_true', help='Check every record against its SHA-256')
+    parser.add_argument('--show', metavar='URL_OR_ACCOUNT', help='Print one stored page')
+    parser.add_argument('--self-test', action='store_true', help='Run snapshot round-trip checks')
+    args = parser.parse_args()
+
+    if args.self_test:
+        raise SystemExit(0 if self_test() else 1)
+    if not args.pack:
+        parser.error('a snapshot .pack file is required')
+
+    with WebsiteSnapshot(args.pack) as snapshot:
+        if args.stats:
+            print(snapshot.stats())
+        if args.verify:
+            bad = snapshot.verify()
+            print(f"{bad} corrupt records")
+            if bad:
+                raise SystemExit(1)
+        if args.show:
+            result = snapshot.result_for_account(args.show) or snapshot.result(args.show)
+            if result is None:
+                raise SystemExit(f"{args.show} is not in the snapshot")
+            print(f"{result['final_url']} status={result['status']} {result['error'] or ''}")
+            print(result['content'] or '')